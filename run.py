@@ -1,41 +1,110 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
 import argparse
-import cProfile
+import ast
 import collections
+import contextlib
+import copy
 import datetime
+import errno
+import functools
+import hashlib
 import importlib
+import importlib.util
+import io
+import json
+import math
 import os
-import pstats
+import platform
 import re
+import signal
+import statistics
+import subprocess
 import sys
 import tempfile
 import time
 import tracemalloc
+import typing as T
 
 import tabulate
 import tqdm
 
 
+PHASES = ["import", "read", "parse", "solve"]
+
 RunResult = collections.namedtuple(
     "RunResult",
     [
         "response",
         "duration",
         "memory",
+        "phases",
+        "timings",
     ],
 )
 
 
-def run_module(module_name: str, rounds=1, memory=False) -> RunResult:
+def timed_call(fn: T.Callable, spans: list[tuple[int, int]]) -> T.Callable:
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            spans.append((start, time.perf_counter_ns()))
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def instrument_phases(mod) -> T.Iterator[dict[str, list[tuple[int, int]]]]:
+    # Every solution's main() looks up parse_input and solve as module globals,
+    # so swapping the attributes is enough to see when each phase runs.
+    spans = {"parse_input": [], "solve": []}
+    originals = {}
+    for name in spans:
+        if hasattr(mod, name):
+            originals[name] = getattr(mod, name)
+            setattr(mod, name, timed_call(originals[name], spans[name]))
+    try:
+        yield spans
+    finally:
+        for name, original in originals.items():
+            setattr(mod, name, original)
+
+
+def run_main(mod, content: str | None = None) -> tuple[T.Any, dict[str, int], int]:
+    with instrument_phases(mod) as spans:
+        start = time.perf_counter_ns()
+        response = solve_with_content(mod, content)
+        stop = time.perf_counter_ns()
+
+    parse_spans = spans["parse_input"]
+    phases = {
+        "read": (parse_spans[0][0] if parse_spans else stop) - start,
+        "parse": sum(b - a for a, b in parse_spans),
+        "solve": sum(b - a for a, b in spans["solve"]),
+    }
+    return response, phases, stop - start
+
+
+def run_module(module_name: str, rounds=1, memory=False, content=None) -> RunResult:
+    phases = dict.fromkeys(PHASES, 0)
+
+    start = time.perf_counter_ns()
+    mod = importlib.import_module(module_name)
+    phases["import"] = time.perf_counter_ns() - start
+
     if memory:
         tracemalloc.start()
+    timings = []
 
-    start = time.time()
     for _ in range(rounds):
-        mod = importlib.import_module(module_name)
-        response = mod.main(runner=True)
-    stop = time.time()
+        response, round_phases, elapsed = run_main(mod, content)
+        for phase, ns in round_phases.items():
+            phases[phase] += ns
+        timings.append(elapsed)
 
     if memory:
         current, peak = tracemalloc.get_traced_memory()
@@ -44,15 +113,1334 @@ def run_module(module_name: str, rounds=1, memory=False) -> RunResult:
     else:
         peak = None
 
-    return RunResult(response, stop - start, peak)
+    duration = phases["import"] + sum(timings)
+    phases = {phase: ns / 1e9 for phase, ns in phases.items()}
+    timings = [ns / 1e9 for ns in timings]
+    return RunResult(response, duration / 1e9, peak, phases, timings)
+
+
+BenchResult = collections.namedtuple(
+    "BenchResult",
+    [
+        "response",
+        "loops",
+        "stats",
+    ],
+)
+
+
+def capture_solve_call(mod, content: str | None = None) -> tuple[T.Any, tuple, dict]:
+    calls = []
+    original = mod.solve
+
+    def capture(*args, **kwargs):
+        # Copy first: some solutions mutate their input while solving.
+        calls.append(copy.deepcopy((args, kwargs)))
+        return original(*args, **kwargs)
+
+    mod.solve = capture
+    try:
+        response = solve_with_content(mod, content)
+    finally:
+        mod.solve = original
+
+    if len(calls) != 1:
+        raise Exception(f"Expected one solve() call, got: {len(calls)}")
+    args, kwargs = calls[0]
+    return response, args, kwargs
+
+
+def cache_clearers(mod) -> list[T.Callable]:
+    # cache_clear() of every functools.cache / lru_cache function in `mod` and
+    # in the modules of its package it imports (e.g. year2021.util). Cleared
+    # before each timed call, so repeats don't just replay memoised results.
+    sources = set(module_source_files(mod.__name__))
+    clearers = {}
+    for module in list(sys.modules.values()):
+        if getattr(module, "__file__", None) not in sources:
+            continue
+        for value in vars(module).values():
+            cache_clear = getattr(value, "cache_clear", None)
+            if callable(cache_clear):
+                clearers[id(value)] = cache_clear
+    return list(clearers.values())
+
+
+def summarize_timings(timings: list[float]) -> dict[str, float]:
+    if len(timings) >= 2:
+        p95 = statistics.quantiles(timings, n=20, method="inclusive")[-1]
+        stdev = statistics.stdev(timings)
+    else:
+        p95 = max(timings)
+        stdev = 0.0
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "stdev": stdev,
+        "p95": p95,
+    }
+
+
+def bench_module(
+    module_name: str, warmup=1, repeat=7, min_time=0.05, content=None
+) -> BenchResult:
+    mod = importlib.import_module(module_name)
+    response, args, kwargs = capture_solve_call(mod, content)
+    clearers = cache_clearers(mod)
+
+    def time_loops(loops: int) -> int:
+        batch = [copy.deepcopy((args, kwargs)) for _ in range(loops)]
+        elapsed = 0
+        for batch_args, batch_kwargs in batch:
+            for cache_clear in clearers:
+                cache_clear()
+            start = time.perf_counter_ns()
+            mod.solve(*batch_args, **batch_kwargs)
+            elapsed += time.perf_counter_ns() - start
+        return elapsed
+
+    for _ in range(warmup):
+        time_loops(1)
+
+    # Like timeit's autorange: sub-millisecond days get batched so that each
+    # sample is long enough for the clock to resolve it.
+    loops = 1
+    while time_loops(loops) < min_time * 1e9:
+        loops *= 10
+
+    timings = [time_loops(loops) / loops / 1e9 for _ in range(repeat)]
+    return BenchResult(response, loops, summarize_timings(timings))
+
+
+PhaseAllocations = collections.namedtuple(
+    "PhaseAllocations",
+    [
+        "peak",
+        "retained",
+        "top",
+    ],
+)
+
+
+class PeakSnapshot:
+    # Keeps a tracemalloc snapshot taken close to the peak of a phase.
+    # Snapshots taken after a phase only see what survived it, so the
+    # intermediate structures that actually drive the peak would be missed.
+    # Instead, every Python function return checks the traced size and takes
+    # a new snapshot whenever it grew by `growth` over the last one (and by at
+    # least `min_step` bytes, snapshots of big heaps aren't cheap).
+
+    def __init__(self, growth=1.25, min_step=1024 * 1024):
+        self.growth = growth
+        self.min_step = min_step
+        self.size, _ = tracemalloc.get_traced_memory()
+        self.snapshot = tracemalloc.take_snapshot()
+
+    def check(self, final=False):
+        current, _ = tracemalloc.get_traced_memory()
+        if final:
+            threshold = self.size
+        else:
+            threshold = max(self.size * self.growth, self.size + self.min_step)
+        if current > threshold:
+            self.size = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def __call__(self, frame, event, arg):
+        if event == "return":
+            self.check()
+
+
+def trace_allocations(fn: T.Callable, report: dict, phase: str, top=10) -> T.Callable:
+    ignore = [tracemalloc.__file__, __file__, "<frozen importlib._bootstrap"]
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        before = tracemalloc.take_snapshot()
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        peak_snapshot = PeakSnapshot()
+        sys.setprofile(peak_snapshot)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            sys.setprofile(None)
+            current, peak = tracemalloc.get_traced_memory()
+            peak_snapshot.check(final=True)
+            # Filtering the grouped statistics is much cheaper than
+            # Snapshot.filter_traces() on a heap with millions of blocks.
+            stats = [
+                stat
+                for stat in peak_snapshot.snapshot.compare_to(before, "lineno")
+                if stat.size_diff > 0
+                and not stat.traceback[0].filename.startswith(tuple(ignore))
+            ]
+            report[phase] = PhaseAllocations(peak - start, current - start, stats[:top])
+
+    return wrapper
+
+
+def allocation_report(module_name: str, top=10) -> dict[str, PhaseAllocations]:
+    mod = importlib.import_module(module_name)
+    report = {}
+    originals = {"parse": mod.parse_input, "solve": mod.solve}
+
+    mod.parse_input = trace_allocations(originals["parse"], report, "parse", top)
+    mod.solve = trace_allocations(originals["solve"], report, "solve", top)
+    tracemalloc.start()
+    try:
+        mod.main(runner=True)
+    finally:
+        tracemalloc.stop()
+        mod.parse_input = originals["parse"]
+        mod.solve = originals["solve"]
+
+    return report
 
 
-def profile_module(module_name: str) -> None:
+def print_allocation_report(module_name: str, report: dict[str, PhaseAllocations]):
+    rows = [
+        [phase, allocations.peak / 1024 / 1024, allocations.retained / 1024 / 1024]
+        for phase, allocations in report.items()
+    ]
+    print()
+    print(module_name)
+    print()
+    print(
+        tabulate.tabulate(
+            rows, headers=["PHASE", "PEAK (MiB)", "RETAINED (MiB)"], floatfmt=".4f"
+        )
+    )
+
+    for phase, allocations in report.items():
+        rows = []
+        for stat in allocations.top:
+            frame = stat.traceback[0]
+            location = f"{os.path.relpath(frame.filename)}:{frame.lineno}"
+            rows.append([stat.size_diff / 1024 / 1024, stat.count_diff, location])
+        print()
+        print(
+            tabulate.tabulate(
+                rows,
+                headers=[f"{phase.upper()} (MiB)", "BLOCKS", "LINE"],
+                floatfmt=".4f",
+            )
+        )
+
+
+def print_allocation_diff(
+    module_a: str,
+    report_a: dict[str, PhaseAllocations],
+    module_b: str,
+    report_b: dict[str, PhaseAllocations],
+):
+    rows = []
+    for phase in report_a.keys() | report_b.keys():
+        peak_a = report_a[phase].peak if phase in report_a else 0
+        peak_b = report_b[phase].peak if phase in report_b else 0
+        change = (peak_b - peak_a) / peak_a * 100 if peak_a else None
+        rows.append([phase, peak_a / 1024 / 1024, peak_b / 1024 / 1024, change])
+    rows.sort()
+    headers = ["PHASE", f"{module_a} (MiB)", f"{module_b} (MiB)", "CHANGE (%)"]
+    print()
+    print(tabulate.tabulate(rows, headers=headers, floatfmt=".4f"))
+
+
+def resize_lines(content: str, scale: float) -> str:
+    # Truncate or tile the real input line by line. Only meaningful for days
+    # whose lines are independent records, days with a generator use that.
+    lines = [line for line in content.splitlines() if line.strip()]
+    count = max(1, round(len(lines) * scale))
+    tiled = (lines * (count // len(lines) + 1))[:count]
+    return os.linesep.join(tiled) + os.linesep
+
+
+def scaled_input(year_day_part: tuple, scale: float, seed=0, tile=False) -> str:
+    year, day, part = year_day_part
+    try:
+        generators = importlib.import_module(f"year{year}.generators")
+    except ModuleNotFoundError:
+        generators = None
+    if generators and not tile:
+        return generators.generate(day, scale, seed)
+    with open(input_path(year, day)) as fp:
+        return resize_lines(fp.read(), scale)
+
+
+def measure_solve(mod, content: str, rounds=1) -> tuple[float, int]:
+    _, args, kwargs = capture_solve_call(mod, content)
+    clearers = cache_clearers(mod)
+
+    timings = []
+    for _ in range(rounds):
+        batch_args, batch_kwargs = copy.deepcopy((args, kwargs))
+        for cache_clear in clearers:
+            cache_clear()
+        start = time.perf_counter_ns()
+        mod.solve(*batch_args, **batch_kwargs)
+        timings.append((time.perf_counter_ns() - start) / 1e9)
+
+    # Traced separately, tracemalloc would inflate the timings.
+    batch_args, batch_kwargs = copy.deepcopy((args, kwargs))
+    for cache_clear in clearers:
+        cache_clear()
+    tracemalloc.start()
+    try:
+        mod.solve(*batch_args, **batch_kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak
+
+
+COMPLEXITY_MODELS = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log(n),
+    "n^2": lambda n: n**2,
+    "n^3": lambda n: n**3,
+}
+
+ComplexityFit = collections.namedtuple(
+    "ComplexityFit",
+    [
+        "model",
+        "error",
+        "predict",
+    ],
+)
+
+
+def fit_least_squares(xs: list[float], ys: list[float], weights: list[float]):
+    # Weighted least squares for y = a * x + b.
+    sw = sum(weights)
+    sx = sum(w * x for w, x in zip(weights, xs))
+    sy = sum(w * y for w, y in zip(weights, ys))
+    sxx = sum(w * x * x for w, x in zip(weights, xs))
+    sxy = sum(w * x * y for w, x, y in zip(weights, xs, ys))
+    det = sw * sxx - sx * sx
+    if not det:
+        return None
+    a = (sw * sxy - sx * sy) / det
+    return a, (sy - a * sx) / sw
+
+
+# Log-space error a growing model has to beat the constant one by. Series
+# that stay within ~10% of flat are reported as constant rather than as some
+# model with a vanishing scale.
+CONSTANT_TOLERANCE = 0.01
+
+
+def fit_complexity(sizes: list[int], values: list[float]) -> list[ComplexityFit]:
+    # Every model gets a scale and an offset, the constant one only an
+    # offset. Polynomial models are fitted by relative error (weights 1/y^2),
+    # the exponential one in log space, and all of them are ranked by the
+    # same log-space error.
+    values = [max(value, 1e-9) for value in values]
+    logs = [math.log(value) for value in values]
+
+    def log_error(predict) -> float:
+        try:
+            predicted = [predict(n) for n in sizes]
+        except OverflowError:
+            return math.inf
+        if min(predicted) <= 0:
+            return math.inf
+        return statistics.mean(
+            (math.log(p) - log) ** 2 for p, log in zip(predicted, logs)
+        )
+
+    weights = [1 / value**2 for value in values]
+    offset = sum(w * value for w, value in zip(weights, values)) / sum(weights)
+    constant = ComplexityFit(
+        "1", log_error(lambda n: offset), functools.partial(lambda n, b: b, b=offset)
+    )
+
+    fits = []
+    for model, g in COMPLEXITY_MODELS.items():
+        params = fit_least_squares([g(n) for n in sizes], values, weights)
+        if params is None or params[0] <= 0:
+            continue
+        predict = functools.partial(
+            lambda n, g, a, b: a * g(n) + b, g=g, a=params[0], b=params[1]
+        )
+        fits.append(ComplexityFit(model, log_error(predict), predict))
+
+    params = fit_least_squares(sizes, logs, [1] * len(sizes))
+    if params is not None and params[0] > 0:
+        predict = functools.partial(
+            lambda n, a, b: math.exp(a * n + b), a=params[0], b=params[1]
+        )
+        fits.append(ComplexityFit("exp", log_error(predict), predict))
+
+    fits.append(constant)
+    return sorted(
+        fits, key=lambda fit: fit.error - CONSTANT_TOLERANCE * (fit is constant)
+    )
+
+
+def find_crossover(predict: T.Callable, budget: float, start: int) -> int | None:
+    # First size at which the fitted model exceeds the budget, by doubling
+    # and then bisecting. None if it stays under the budget up to 2^64.
+    def over(n: int) -> bool:
+        try:
+            return predict(n) > budget
+        except OverflowError:
+            return True
+
+    if over(start):
+        return start
+    low, high = start, start * 2
+    while not over(high):
+        if high > 2**64:
+            return None
+        low, high = high, high * 2
+    while high - low > 1:
+        middle = (low + high) // 2
+        if over(middle):
+            high = middle
+        else:
+            low = middle
+    return high
+
+
+ComplexityReport = collections.namedtuple(
+    "ComplexityReport",
+    [
+        "samples",
+        "time_fits",
+        "memory_fits",
+    ],
+)
+
+
+def complexity_report(
+    year_day_part: tuple,
+    module_name: str,
+    scales: list[float],
+    budget: float,
+    rounds=1,
+    seed=0,
+    tile=False,
+) -> ComplexityReport:
+    mod = importlib.import_module(module_name)
+    samples = []
+    for scale in scales:
+        content = scaled_input(year_day_part, scale, seed, tile)
+        # n is the size of the input in bytes, whatever it encodes.
+        seconds, peak = measure_solve(mod, content, rounds)
+        samples.append([scale, len(content.encode()), seconds, peak])
+        if seconds > budget:
+            # Larger inputs would only take longer.
+            break
+
+    sizes = [n for _, n, _, _ in samples]
+    if len(set(sizes)) < 3:
+        return ComplexityReport(samples, [], [])
+    return ComplexityReport(
+        samples,
+        fit_complexity(sizes, [seconds for _, _, seconds, _ in samples]),
+        fit_complexity(sizes, [peak for _, _, _, peak in samples]),
+    )
+
+
+def print_complexity_report(
+    module_name: str, report: ComplexityReport, budget: float, memory_budget: float
+):
+    rows = [
+        [scale, n, seconds, peak / 1024 / 1024]
+        for scale, n, seconds, peak in report.samples
+    ]
+    print()
+    print(module_name)
+    print()
+    print(
+        tabulate.tabulate(
+            rows,
+            headers=["SCALE", "N (bytes)", "SOLVE (s)", "PEAK (MiB)"],
+            floatfmt=".4f",
+        )
+    )
+
+    if not report.time_fits:
+        print()
+        print("Not enough distinct input sizes to fit a model.")
+        return
+
+    # Bytes per unit of scale, to translate a crossover size back to a scale.
+    scale, n, _, _ = report.samples[-1]
+    bytes_per_scale = n / scale
+
+    rows = []
+    for resource, fits, limit, unit in [
+        ("time", report.time_fits, budget, "s"),
+        ("memory", report.memory_fits, memory_budget * 1024 * 1024, "MiB"),
+    ]:
+        if not fits:
+            rows.append([resource, None, None, None, None])
+            continue
+        best = fits[0]
+        crossover = None
+        if best.model != "1":
+            # A constant fit never crosses a budget it isn't already over.
+            crossover = find_crossover(best.predict, limit, report.samples[0][1])
+        others = ", ".join(f"{fit.model} ({fit.error:.3g})" for fit in fits[1:])
+        rows.append(
+            [
+                resource,
+                f"{best.model} ({best.error:.3g})",
+                crossover,
+                crossover / bytes_per_scale if crossover else None,
+                others,
+            ]
+        )
+    print()
+    print(
+        tabulate.tabulate(
+            rows,
+            headers=[
+                "RESOURCE",
+                "BEST FIT (ERROR)",
+                "OVER BUDGET AT N",
+                "SCALE",
+                "OTHER FITS",
+            ],
+            floatfmt=".4f",
+        )
+    )
+    print()
+    print(f"Budget: {budget}s solve time, {memory_budget} MiB peak memory.")
+
+
+def input_path(year: int, day: int) -> str:
+    # The same file the solutions read, wherever run.py is started from and
+    # with AOC_INPUTS_DIR applied.
+    inputs = importlib.import_module(f"year{year}.util.inputs")
+    return inputs.input_path(year, day)
+
+
+def hash_file(filepath: str) -> str | None:
+    if not os.path.exists(filepath):
+        return None
+    with open(filepath, "rb") as fp:
+        return hashlib.sha256(fp.read()).hexdigest()
+
+
+def git_revision() -> tuple[str | None, bool]:
+    def git(*args):
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    try:
+        dirty = git("status", "--porcelain", "--untracked-files=no")
+        return git("rev-parse", "HEAD"), bool(dirty)
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+
+
+def resolve_revision(ref: str) -> str | None:
+    # Full commit hash of a branch, tag, HEAD~2, abbreviated hash...
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_environment() -> dict:
+    revision, dirty = git_revision()
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "revision": revision,
+        "dirty": dirty,
+        "python": platform.python_version(),
+    }
+
+
+def make_history_record(
+    year_day_part: tuple,
+    module_name: str,
+    result,
+    environment: dict,
+    generated: dict | None = None,
+) -> dict:
+    year, day, part = year_day_part
+    record = {
+        **environment,
+        "module": module_name,
+        "input_sha256": hash_file(input_path(year, day)),
+        # With --scale: the scale, the seed and the hash of the generated input.
+        **(generated or {}),
+        "response": str(result.response),
+    }
+    if isinstance(result, BenchResult):
+        record["mode"] = "bench"
+        record["loops"] = result.loops
+        record["stats"] = result.stats
+        record["median"] = result.stats["median"]
+    else:
+        rounds = len(result.timings)
+        record["mode"] = "run"
+        record["import"] = result.phases["import"]
+        record["phases"] = {
+            phase: result.phases[phase] / rounds for phase in PHASES[1:]
+        }
+        record["timings"] = result.timings
+        record["median"] = statistics.median(result.timings)
+        record["memory"] = result.memory
+    return record
+
+
+def make_output_records(
+    target_modules: dict,
+    results: dict,
+    cached: dict,
+    failures: dict,
+    environment: dict,
+    generated: dict | None = None,
+) -> list[dict]:
+    records = []
+    for year_day_part in sorted([*results, *cached, *failures]):
+        module_name = target_modules[year_day_part]
+        if year_day_part in cached:
+            record = {"response": str(cached[year_day_part]), "status": "CACHED"}
+        elif year_day_part in failures:
+            status, message = failures[year_day_part]
+            record = {"status": status, "error": message}
+        else:
+            record = make_history_record(
+                year_day_part,
+                module_name,
+                results[year_day_part],
+                environment,
+                (generated or {}).get(year_day_part),
+            )
+            record = {k: v for k, v in record.items() if k not in environment}
+            record["status"] = "OK"
+        records.append({"module": module_name, **record})
+    return records
+
+
+def flatten_record(record: dict) -> dict:
+    flat = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            flat.update({f"{key}_{k}": v for k, v in value.items()})
+        elif isinstance(value, list):
+            flat[key] = ";".join(map(str, value))
+        else:
+            flat[key] = value
+    return flat
+
+
+def format_json(environment: dict, records: list[dict]) -> str:
+    return json.dumps({"environment": environment, "results": records}, indent=2)
+
+
+def format_csv(environment: dict, records: list[dict]) -> str:
+    import csv
+
+    rows = [{**environment, **flatten_record(record)} for record in records]
+    fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def format_junit(environment: dict, records: list[dict]) -> str:
+    import xml.etree.ElementTree as ET
+
+    suite_name = records[0]["module"].split(".")[0] if records else "aoc"
+    failed = [r for r in records if r["status"] not in ("OK", "CACHED")]
+    suite = ET.Element(
+        "testsuite",
+        name=suite_name,
+        tests=str(len(records)),
+        failures=str(len(failed)),
+        skipped=str(sum(r["status"] == "CACHED" for r in records)),
+        timestamp=environment["timestamp"],
+    )
+    properties = ET.SubElement(suite, "properties")
+    for key, value in environment.items():
+        ET.SubElement(properties, "property", name=key, value=str(value))
+
+    for record in records:
+        seconds = sum(record.get("timings", [])) or record.get("median") or 0
+        case = ET.SubElement(
+            suite,
+            "testcase",
+            classname=suite_name,
+            name=record["module"],
+            time=f"{seconds:.6f}",
+        )
+        if record["status"] == "CACHED":
+            ET.SubElement(case, "skipped", message="answer from cache")
+        elif record["status"] != "OK":
+            ET.SubElement(case, "failure", message=record["error"] or record["status"])
+        if "response" in record:
+            ET.SubElement(case, "system-out").text = record["response"]
+
+    return ET.tostring(suite, encoding="unicode")
+
+
+OUTPUT_FORMATS = {
+    "json": format_json,
+    "csv": format_csv,
+    "junit": format_junit,
+}
+
+
+def load_history(filepath: str) -> list[dict]:
+    if not os.path.exists(filepath):
+        return []
+    with open(filepath) as fp:
+        return [json.loads(line) for line in fp if line.strip()]
+
+
+def append_history(filepath: str, records: list[dict]) -> None:
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    with open(filepath, "a") as fp:
+        for record in records:
+            fp.write(json.dumps(record) + "\n")
+
+
+def compare_to_baseline(
+    records: list[dict], history: list[dict], baseline: str, threshold: float
+) -> tuple[list[list], list[str]]:
+    # `baseline` is a full commit hash, see resolve_revision(). Only clean
+    # checkouts count as a baseline, otherwise local edits made on top of the
+    # baseline revision would be compared against themselves.
+    # Runs only compare with runs on the same input (the same scale and seed
+    # for generated ones), read the same way: streamed or as a whole.
+    def key(record: dict) -> tuple:
+        return (
+            record["module"],
+            record["mode"],
+            record.get("input_sha256"),
+            record.get("scale"),
+            record.get("seed"),
+            bool(record.get("stream")),
+        )
+
+    baseline_medians = {}
+    for old in history:
+        if old["dirty"] or old["revision"] != baseline:
+            continue
+        baseline_medians.setdefault(key(old), []).append(old["median"])
+
+    rows = []
+    regressions = []
+    for record in records:
+        if key(record) not in baseline_medians:
+            rows.append([record["module"], None, record["median"], None, "MISSING"])
+            continue
+        before = statistics.median(baseline_medians[key(record)])
+        change = (record["median"] - before) / before * 100 if before else 0.0
+        status = "ok"
+        if change > threshold:
+            status = "SLOWER"
+            regressions.append(record["module"])
+        rows.append([record["module"], before, record["median"], change, status])
+    return rows, regressions
+
+
+def module_source_files(module_name: str) -> list[str]:
+    # Follow imports that stay inside the solution package (e.g. year2021.util)
+    # so an edit to a shared helper also invalidates the days that use it.
+    top_level = module_name.split(".")[0]
+    pending = [module_name]
+    seen = {}
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        try:
+            spec = importlib.util.find_spec(name)
+        except ModuleNotFoundError:
+            spec = None
+        if spec is None or spec.origin is None:
+            # `from .util import letters4by6` also yields names like
+            # year2021.util.letters4by6.some_function, which aren't modules.
+            continue
+        seen[name] = spec.origin
+
+        package = name if spec.submodule_search_locations else name.rpartition(".")[0]
+        with open(spec.origin) as fp:
+            tree = ast.parse(fp.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                imported = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level:
+                    base = importlib.util.resolve_name("." * node.level + base, package)
+                imported = [base] + [f"{base}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            pending.extend(n for n in imported if n.split(".")[0] == top_level)
+
+    return sorted(seen.values())
+
+
+def cache_key(year_day_part: tuple, module_name: str) -> str | None:
+    # None when there is no input to hash, which can't be cached.
+    year, day, part = year_day_part
+    input_hash = hash_file(input_path(year, day))
+    if input_hash is None:
+        return None
+    digest = hashlib.sha256(module_name.encode())
+    for filepath in module_source_files(module_name):
+        digest.update(hash_file(filepath).encode())
+    digest.update(input_hash.encode())
+    return digest.hexdigest()
+
+
+def cache_lookup(cache_dir: str, key: str) -> T.Any:
+    filepath = os.path.join(cache_dir, f"{key}.json")
+    if not os.path.exists(filepath):
+        raise KeyError(key)
+    with open(filepath) as fp:
+        return json.load(fp)["response"]
+
+
+def cache_store(cache_dir: str, key: str, module_name: str, response) -> None:
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, f"{key}.json"), "w") as fp:
+        json.dump({"module": module_name, "response": response}, fp)
+
+
+Limits = collections.namedtuple(
+    "Limits",
+    [
+        "timeout",
+        "memory",
+        "cpu",
+    ],
+)
+
+
+def run_module_child(
+    conn, module_name: str, rounds: int, memory: bool, limits: Limits, content=None
+):
+    import resource
+
+    if limits.memory:
+        size = limits.memory * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (size, size))
+    if limits.cpu:
+        # SIGXCPU at the soft limit, SIGKILL only if that gets ignored.
+        resource.setrlimit(resource.RLIMIT_CPU, (limits.cpu, limits.cpu + 1))
+
+    try:
+        conn.send(("OK", run_module(module_name, rounds, memory, content)))
+    except Exception as e:
+        status = "OOM" if is_out_of_memory(e, bool(limits.memory)) else "ERROR"
+        conn.send((status, describe_error(e)))
+    finally:
+        conn.close()
+
+
+def is_out_of_memory(error: Exception, limited: bool) -> bool:
+    # Under RLIMIT_AS, running out of address space isn't always a
+    # MemoryError: mmap() and friends fail with ENOMEM, and extension modules
+    # fail to import when their shared libraries can't be mapped.
+    if isinstance(error, MemoryError):
+        return True
+    if isinstance(error, OSError) and error.errno == errno.ENOMEM:
+        return True
+    return limited and isinstance(error, ImportError)
+
+
+def describe_error(error: Exception) -> str:
+    # One line. Errors raised `from` another (e.g. numpy's multi-paragraph
+    # ImportError) are described by the one they were raised from.
+    while error.__cause__ is not None:
+        error = error.__cause__
+    lines = str(error).strip().splitlines()
+    return f"{type(error).__name__}: {lines[0]}" if lines else type(error).__name__
+
+
+def describe_exit(exitcode: int) -> str:
+    # The child died before it could report back, e.g. killed by a signal.
+    if exitcode == -signal.SIGXCPU:
+        return "TIMEOUT"
+    if exitcode == -signal.SIGKILL:
+        return "KILLED"
+    return "CRASHED"
+
+
+def run_modules_isolated(
+    target_modules: dict, jobs: int, rounds=1, memory=False, limits=None, contents=None
+) -> T.Iterator[tuple]:
+    # One process per module keeps imports and functools.cache state from
+    # leaking between days, and lets a runaway day be killed on its own.
+    import multiprocessing
+    import multiprocessing.connection
+
+    limits = limits or Limits(None, None, None)
+    contents = contents or {}
+    pending = list(target_modules.items())
+    running = {}
+
+    while pending or running:
+        while pending and len(running) < jobs:
+            year_day_part, module_name = pending.pop(0)
+            conn, child_conn = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=run_module_child,
+                args=(
+                    child_conn,
+                    module_name,
+                    rounds,
+                    memory,
+                    limits,
+                    contents.get(year_day_part),
+                ),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            deadline = time.monotonic() + limits.timeout if limits.timeout else None
+            running[conn] = (year_day_part, process, deadline)
+
+        deadlines = [deadline for _, _, deadline in running.values() if deadline]
+        wait = max(0, min(deadlines) - time.monotonic()) if deadlines else None
+        for conn in multiprocessing.connection.wait(list(running), timeout=wait):
+            year_day_part, process, _ = running.pop(conn)
+            try:
+                status, result = conn.recv()
+            except EOFError:
+                process.join()
+                status, result = describe_exit(process.exitcode), None
+            conn.close()
+            process.join()
+            yield year_day_part, status, result
+
+        now = time.monotonic()
+        for conn, (year_day_part, process, deadline) in list(running.items()):
+            if deadline and now >= deadline:
+                process.kill()
+                process.join()
+                conn.close()
+                del running[conn]
+                yield year_day_part, "TIMEOUT", None
+
+
+def profile_module(module_name: str, output_dir: str) -> pstats.Stats:
+    import cProfile
+    import pstats
+
     mod = importlib.import_module(module_name)
     with cProfile.Profile() as pr:
         mod.main(runner=True)
-    pr.dump_stats(os.path.join(tempfile.gettempdir(), f"{module_name}.prof"))
-    pr.print_stats(pstats.SortKey.CUMULATIVE)
+    pr.dump_stats(os.path.join(output_dir, f"{module_name}.prof"))
+    return pstats.Stats(pr)
+
+
+def frame_label(func: tuple[str, int, str]) -> str:
+    filename, lineno, name = func
+    if filename == "~":
+        # Builtins, e.g. "<built-in method builtins.sorted>".
+        return name.strip("<>")
+    return f"{os.path.basename(filename)}:{name}:{lineno}"
+
+
+def folded_stacks(stats: pstats.Stats, min_time=1e-6) -> dict[str, float]:
+    # cProfile only records caller -> callee edges, not whole stacks, so
+    # stacks are rebuilt by walking down from the roots and splitting each
+    # function's time between its callers in proportion to the edge times.
+    callees = {}
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+
+    folded = collections.Counter()
+
+    def walk(func, path, labels, fraction):
+        cc, nc, tt, ct, callers = stats.stats[func]
+        folded[";".join(labels)] += tt * fraction
+        for child, edge_time in callees.get(func, {}).items():
+            child_time = stats.stats[child][3]
+            share = fraction * edge_time / child_time if child_time else 0
+            if child in path or share * child_time < min_time:
+                continue
+            walk(child, path | {child}, labels + [frame_label(child)], share)
+
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        if not callers:
+            walk(func, {func}, [frame_label(func)], 1.0)
+
+    return folded
+
+
+def write_folded(filepath: str, folded: dict[str, float], prefix=None) -> None:
+    with open(filepath, "w") as fp:
+        for stack, seconds in sorted(folded.items()):
+            # Flamegraph tools expect integer sample counts, use microseconds.
+            count = round(seconds * 1e6)
+            if count > 0:
+                stack = f"{prefix};{stack}" if prefix else stack
+                fp.write(f"{stack} {count}\n")
+
+
+def profile_modules(target_modules: dict, output_dir: str, top=10) -> None:
+    import pstats
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    combined = None
+    combined_folded = {}
+    pbar = tqdm.tqdm(target_modules.values())
+    for module_name in pbar:
+        pbar.set_description(module_name)
+        stats = profile_module(module_name, output_dir)
+        folded = folded_stacks(stats)
+        write_folded(os.path.join(output_dir, f"{module_name}.folded"), folded)
+        combined_folded.update(
+            {f"{module_name};{stack}": seconds for stack, seconds in folded.items()}
+        )
+        if combined is None:
+            combined = stats
+        else:
+            combined.add(stats)
+
+    if len(target_modules) == 1:
+        combined.sort_stats(pstats.SortKey.CUMULATIVE).print_stats()
+    else:
+        parts = [module_name.split(".") for module_name in target_modules.values()]
+        name = ".".join(os.path.commonprefix(parts)) or "combined"
+        combined.dump_stats(os.path.join(output_dir, f"{name}.prof"))
+        write_folded(os.path.join(output_dir, f"{name}.folded"), combined_folded)
+        combined.sort_stats(pstats.SortKey.TIME).print_stats(top)
+
+    print(f"Profiles written to: {output_dir}")
+
+
+class StackSampler:
+    # Samples the main thread's stack from a SIGPROF handler, so the solution
+    # runs at full speed between samples, unlike with cProfile which pays on
+    # every call (and distorts call-heavy, recursive solutions the most).
+
+    def __init__(self, interval: float, anchor):
+        self.interval = interval
+        self.anchor = anchor
+        self.samples = collections.Counter()
+
+    def handler(self, signum, frame):
+        stack = []
+        while frame is not None and frame is not self.anchor:
+            code = frame.f_code
+            # Generator frames between instructions may not have a line.
+            lineno = frame.f_lineno or code.co_firstlineno
+            stack.append((code.co_filename, code.co_firstlineno, code.co_name, lineno))
+            frame = frame.f_back
+        self.samples[tuple(reversed(stack))] += 1
+
+    def __enter__(self):
+        self.previous = signal.signal(signal.SIGPROF, self.handler)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc_info):
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self.previous)
+
+
+def sample_module(
+    module_name: str, interval: float
+) -> tuple[T.Any, StackSampler, float]:
+    mod = importlib.import_module(module_name)
+    with StackSampler(interval, sys._getframe()) as sampler:
+        start = time.perf_counter()
+        response = mod.main(runner=True)
+        stop = time.perf_counter()
+    return response, sampler, stop - start
+
+
+def print_samples(module_name: str, sampler: StackSampler, elapsed: float, top=10):
+    total = sum(sampler.samples.values())
+    print()
+    print(f"{module_name}: {total} samples in {elapsed:.4f} s")
+    if not total:
+        return
+
+    own = collections.Counter()
+    inclusive = collections.Counter()
+    lines = collections.Counter()
+    for stack, count in sampler.samples.items():
+        filename, firstlineno, name, lineno = stack[-1]
+        own[(filename, firstlineno, name)] += count
+        lines[(filename, lineno, name)] += count
+        # Recursive functions show up many times in one stack, count once.
+        for func in set(frame[:3] for frame in stack):
+            inclusive[func] += count
+
+    rows = [
+        [
+            own[func] / total * 100,
+            inclusive[func] / total * 100,
+            frame_label(func),
+        ]
+        for func, _ in own.most_common(top)
+    ]
+    print()
+    print(
+        tabulate.tabulate(
+            rows, headers=["OWN (%)", "TOTAL (%)", "FUNCTION"], floatfmt=".2f"
+        )
+    )
+
+    rows = [
+        [count / total * 100, frame_label(line)]
+        for line, count in lines.most_common(top)
+    ]
+    print()
+    print(tabulate.tabulate(rows, headers=["OWN (%)", "LINE"], floatfmt=".2f"))
+
+
+def sample_modules(target_modules: dict, output_dir: str, interval: float, top=10):
+    if not hasattr(signal, "setitimer"):
+        raise Exception("Sampling needs signal.setitimer, which this OS lacks.")
+    os.makedirs(output_dir, exist_ok=True)
+
+    for module_name in target_modules.values():
+        response, sampler, elapsed = sample_module(module_name, interval)
+        print_samples(module_name, sampler, elapsed, top)
+
+        folded = collections.Counter()
+        for stack, count in sampler.samples.items():
+            labels = [frame_label(frame[:3]) for frame in stack]
+            folded[";".join(labels)] += count * interval
+        write_folded(os.path.join(output_dir, f"{module_name}.sample.folded"), folded)
+
+    print()
+    print(f"Folded stacks written to: {output_dir}")
+
+
+ImportTime = collections.namedtuple(
+    "ImportTime",
+    [
+        "name",
+        "depth",
+        "own",
+        "cumulative",
+    ],
+)
+
+
+def measure_imports(module_name: str) -> list[ImportTime]:
+    # A fresh interpreter per module, otherwise whatever an earlier module
+    # already imported (numpy...) would look free for the next one.
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines look like "import time:   self |   cumulative |   name", children
+    # are printed before their parent and indented two spaces per level.
+    timings = []
+    for line in process.stderr.splitlines():
+        match = re.match(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$", line)
+        if match:
+            own, cumulative, indent, name = match.groups()
+            depth = (len(indent) - 1) // 2
+            timings.append(
+                ImportTime(name, depth, int(own) / 1e6, int(cumulative) / 1e6)
+            )
+
+    # Keep the target's own subtree, not interpreter startup or site imports.
+    end = max(i for i, t in enumerate(timings) if t.name == module_name)
+    start = end
+    while start > 0 and timings[start - 1].depth > 0:
+        start -= 1
+    return timings[start : end + 1]
+
+
+def print_imports(target_modules: dict, top=10) -> None:
+    rows = []
+    dependencies = {}
+    pbar = tqdm.tqdm(target_modules.values())
+    for module_name in pbar:
+        pbar.set_description(module_name)
+        timings = measure_imports(module_name)
+        target = timings[-1]
+        rows.append([module_name, target.own * 1000, target.cumulative * 1000])
+        dependencies[module_name] = timings[:-1]
+
+    print()
+    print(
+        tabulate.tabulate(
+            rows, headers=["MODULE", "SELF (ms)", "TOTAL (ms)"], floatfmt=".4f"
+        )
+    )
+
+    for module_name, timings in dependencies.items():
+        heaviest = sorted(timings, key=lambda t: t.own, reverse=True)[:top]
+        if not heaviest:
+            continue
+        rows = [[t.own * 1000, t.cumulative * 1000, t.name] for t in heaviest]
+        print()
+        print(
+            tabulate.tabulate(
+                rows,
+                headers=["SELF (ms)", "TOTAL (ms)", f"IMPORTED BY {module_name}"],
+                floatfmt=".4f",
+            )
+        )
+
+
+def find_modules(year: int) -> dict[tuple, str]:
+    name_pattern = r"^day(\d{2})([ab])[.]py$"
+    container = os.path.join("src", f"year{year}")
+    candidates = [
+        re.findall(name_pattern, candidate) for candidate in os.listdir(container)
+    ]
+    candidates = [c[0] for c in candidates if len(c) >= 1]
+    candidates = [
+        [(year, int(day), part), f"year{year}.day{day}{part}"]
+        for day, part in candidates
+    ]
+    return dict(sorted(candidates))
+
+
+InputSource = collections.namedtuple(
+    "InputSource",
+    [
+        "source",
+        "stream",
+    ],
+)
+
+
+def can_stream(module_name: str) -> bool:
+    # Whether main() takes `stream`, read from the source rather than by
+    # importing the module, which would leave nothing for IMPORT to time.
+    spec = importlib.util.find_spec(module_name)
+    with open(spec.origin) as fp:
+        tree = ast.parse(fp.read())
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "main":
+            arguments = node.args.posonlyargs + node.args.args + node.args.kwonlyargs
+            return any(argument.arg == "stream" for argument in arguments)
+    return False
+
+
+def solve_with_content(mod, content: str | InputSource | None = None) -> T.Any:
+    if content is None:
+        return mod.main(runner=True)
+    if isinstance(content, InputSource):
+        # main() reads the source (None for its usual input) itself, so the
+        # read phase times the right file. With stream, line by line.
+        if content.stream:
+            return mod.main(runner=True, source=content.source, stream=True)
+        return mod.main(runner=True, source=content.source)
+    # Generated text, read by main() like any other stream.
+    return mod.main(runner=True, source=io.StringIO(content))
+
+
+def serve(target_modules: dict, socket_path: str) -> None:
+    # Imported here rather than at the top, like cProfile and multiprocessing,
+    # to keep them off the startup time of every other mode.
+    import socket
+    import socketserver
+
+    if not hasattr(socketserver, "UnixStreamServer"):
+        raise Exception("Serving needs Unix sockets, which this OS lacks.")
+
+    class SolverHandler(socketserver.StreamRequestHandler):
+        # One JSON object per line in, one JSON object per line out:
+        # {"module": "year2021.day05b", "input_path": "...", "content": "..."}
+        # input_path and content are optional, and content wins over input_path.
+
+        def handle(self):
+            for line in self.rfile:
+                try:
+                    reply = self.server.solve(json.loads(line))
+                except Exception as e:
+                    reply = {"error": str(e)}
+                self.wfile.write((json.dumps(reply) + "\n").encode())
+
+    class SolverServer(socketserver.UnixStreamServer):
+        # Requests are handled one at a time on purpose: the solutions keep
+        # module-level state (functools caches), and are CPU bound anyway.
+
+        def __init__(self, socket_path: str, modules: dict):
+            self.modules = modules
+            super().__init__(socket_path, SolverHandler)
+
+        def solve(self, request: dict) -> dict:
+            module_name = request["module"]
+            if module_name not in self.modules:
+                raise Exception(f"Unknown module: {module_name}")
+
+            content = request.get("content")
+            if content is None and request.get("input_path"):
+                content = InputSource(request["input_path"], False)
+
+            start = time.perf_counter()
+            response = solve_with_content(self.modules[module_name], content)
+            stop = time.perf_counter()
+            return {
+                "module": module_name,
+                "response": response,
+                "duration": stop - start,
+            }
+
+    if os.path.exists(socket_path):
+        try:
+            with socket.socket(socket.AF_UNIX) as sock:
+                sock.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+        else:
+            raise Exception(f"Already serving on: {socket_path}")
+
+    modules = {}
+    pbar = tqdm.tqdm(target_modules.values())
+    for module_name in pbar:
+        pbar.set_description(module_name)
+        modules[module_name] = importlib.import_module(module_name)
+
+    # Stop the same way on SIGTERM as on Ctrl+C, so the socket gets removed.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+    with SolverServer(socket_path, modules) as server:
+        print(f"Serving {len(modules)} modules on: {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
+def request_solve(socket_path: str, module_name: str, input_path=None) -> T.Any:
+    import socket
+
+    request = {"module": module_name}
+    if input_path:
+        request["input_path"] = os.path.abspath(input_path)
+
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.connect(socket_path)
+        with sock.makefile("rw") as stream:
+            stream.write(json.dumps(request) + "\n")
+            stream.flush()
+            reply = json.loads(stream.readline())
+
+    if "error" in reply:
+        raise Exception(reply["error"])
+    return reply["response"]
 
 
 def parse_args():
@@ -73,6 +1461,13 @@ def parse_args():
 
     p.add_argument("-a", "--all", action="store_true", help="run everything")
 
+    p.add_argument(
+        "--format",
+        choices=["table", *OUTPUT_FORMATS],
+        default="table",
+        help="how to print results (example: json)",
+    )
+
     p.add_argument(
         "--rounds",
         metavar="N",
@@ -81,6 +1476,81 @@ def parse_args():
         help="number of times to run each solution",
     )
 
+    p.add_argument(
+        "--scale",
+        metavar="K",
+        type=float,
+        help="solve a generated input K times the size of the real one",
+    )
+
+    p.add_argument(
+        "--seed",
+        metavar="N",
+        type=int,
+        default=0,
+        help="random seed for --scale inputs",
+    )
+
+    p.add_argument(
+        "-j",
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=1,
+        help="number of modules to run in parallel, one process each",
+    )
+
+    p.add_argument(
+        "--timeout",
+        metavar="SECONDS",
+        type=float,
+        help="wall-clock limit per module, each module runs in its own process",
+    )
+
+    p.add_argument(
+        "--max-memory",
+        metavar="MIB",
+        type=int,
+        help="address space limit per module, each module runs in its own process",
+    )
+
+    p.add_argument(
+        "--max-cpu",
+        metavar="SECONDS",
+        type=int,
+        help="CPU time limit per module, each module runs in its own process",
+    )
+
+    p.add_argument(
+        "--bench",
+        action="store_true",
+        help="benchmark the solve phase with warmup and repeated samples",
+    )
+
+    p.add_argument(
+        "--warmup",
+        metavar="N",
+        type=int,
+        default=1,
+        help="number of untimed solve calls before benchmarking",
+    )
+
+    p.add_argument(
+        "--repeat",
+        metavar="N",
+        type=int,
+        default=7,
+        help="number of benchmark samples per module",
+    )
+
+    p.add_argument(
+        "--min-time",
+        metavar="SECONDS",
+        type=float,
+        default=0.05,
+        help="minimum duration of one benchmark sample (loops scale up to fit)",
+    )
+
     p.add_argument(
         "--memory",
         action="store_true",
@@ -88,13 +1558,203 @@ def parse_args():
     )
 
     p.add_argument(
-        "--profile", action="store_true", help="run cProfile on module (slower)"
+        "--complexity",
+        action="store_true",
+        help="fit solve time and peak memory against growing input sizes",
+    )
+
+    p.add_argument(
+        "--points",
+        metavar="N",
+        type=int,
+        default=6,
+        help="number of input sizes with --complexity, starting at --scale",
+    )
+
+    p.add_argument(
+        "--growth",
+        metavar="FACTOR",
+        type=float,
+        default=2.0,
+        help="scale factor between consecutive sizes with --complexity",
+    )
+
+    p.add_argument(
+        "--budget",
+        metavar="SECONDS",
+        type=float,
+        default=10.0,
+        help="solve time that a --complexity crossover is reported for",
+    )
+
+    p.add_argument(
+        "--memory-budget",
+        metavar="MIB",
+        type=float,
+        default=1024.0,
+        help="peak memory that a --complexity crossover is reported for",
+    )
+
+    p.add_argument(
+        "--tile",
+        action="store_true",
+        help="with --complexity, truncate/tile the real input instead of generating",
+    )
+
+    p.add_argument(
+        "--serve",
+        action="store_true",
+        help="keep every module imported and answer requests on --socket",
+    )
+
+    p.add_argument(
+        "--connect",
+        action="store_true",
+        help="ask a running --serve daemon for the answer instead",
+    )
+
+    p.add_argument(
+        "--socket",
+        metavar="PATH",
+        default=os.path.join(".aoc", "solver.sock"),
+        help="Unix socket used by --serve and --connect",
+    )
+
+    p.add_argument(
+        "--input",
+        metavar="PATH",
+        help="solve this input file instead of the default, - reads stdin",
+    )
+
+    p.add_argument(
+        "--stream",
+        action="store_true",
+        help="feed the input line by line to the days that support it",
+    )
+
+    p.add_argument(
+        "--cache-dir",
+        metavar="PATH",
+        default=os.path.join(".aoc", "cache"),
+        help="where answers are cached by module source and input hash",
+    )
+
+    p.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="recompute answers even if the source and input are unchanged",
+    )
+
+    p.add_argument(
+        "--history",
+        metavar="PATH",
+        default=os.path.join(".aoc", "history.jsonl"),
+        help="JSON-lines file that every run is appended to",
+    )
+
+    p.add_argument(
+        "--no-history",
+        action="store_true",
+        help="do not append this run to the history file",
+    )
+
+    p.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="compare medians against history recorded at git revision BASELINE",
+    )
+
+    p.add_argument(
+        "--threshold",
+        metavar="PERCENT",
+        type=float,
+        default=10.0,
+        help="slowdown that counts as a regression with --compare",
+    )
+
+    p.add_argument(
+        "--allocations",
+        action="store_true",
+        help="report per-phase peak memory and the top allocating lines",
+    )
+
+    p.add_argument(
+        "--top",
+        metavar="N",
+        type=int,
+        default=10,
+        help="number of rows to show in --allocations/--imports/--profile reports",
+    )
+
+    p.add_argument(
+        "--diff",
+        metavar="DAYPART",
+        help="with --allocations, compare against another day (example: 15a)",
+    )
+
+    p.add_argument(
+        "--profile", action="store_true", help="run cProfile on modules (slower)"
+    )
+
+    p.add_argument(
+        "--imports",
+        action="store_true",
+        help="measure cold import time of modules and their dependencies",
+    )
+
+    p.add_argument(
+        "--sample",
+        action="store_true",
+        help="run a low-overhead sampling profiler on modules",
+    )
+
+    p.add_argument(
+        "--interval",
+        metavar="MS",
+        type=float,
+        default=1.0,
+        help="CPU time between stack samples with --sample",
+    )
+
+    p.add_argument(
+        "--profile-dir",
+        metavar="PATH",
+        default=tempfile.gettempdir(),
+        help="where --profile and --sample write .prof and folded stack files",
     )
 
     args = p.parse_args()
-    if not ((args.day and args.part) or args.all):
+    if args.jobs < 1:
+        p.error("--jobs must be at least 1")
+    isolated = args.jobs > 1 or args.timeout or args.max_memory or args.max_cpu
+    if args.bench and isolated:
+        p.error("--bench runs modules in-process, drop --jobs and limits")
+    if args.diff and not re.match(r"^\d{1,2}[ab]$", args.diff):
+        p.error("--diff expects a day and part (example: 15a)")
+    if args.repeat < 1:
+        p.error("--repeat must be at least 1")
+    if args.complexity and (args.points < 3 or args.growth <= 1):
+        p.error("--complexity needs at least 3 --points and a --growth above 1")
+    if args.input and args.scale is not None:
+        p.error("--input and --scale both replace the input, pick one")
+    if args.input and args.all and not args.connect:
+        p.error("--input replaces a single day's input, drop --all")
+    if args.input == "-" and (isolated or args.bench or args.rounds > 1):
+        p.error("stdin can only be read once, by a single in-process run")
+    if args.stream and (args.bench or args.scale is not None):
+        p.error("--stream can't be combined with --bench or --scale")
+    if args.scale is not None and args.scale <= 0:
+        p.error("--scale must be positive")
+    reports = [args.serve, args.connect, args.imports, args.profile, args.sample]
+    if args.scale is not None and (any(reports) or args.allocations):
+        p.error("--scale only applies to plain runs and --bench")
+    if not ((args.day and args.part) or args.all or args.serve):
         p.print_help()
         sys.exit(1)
+    if args.compare:
+        args.baseline = resolve_revision(args.compare)
+        if args.baseline is None:
+            p.error(f"--compare: unknown git revision: {args.compare}")
 
     return args
 
@@ -109,50 +1769,281 @@ def main():
         module_name = f"year{args.year}.day{args.day:02}{args.part}"
         target_modules[year_day_part] = module_name
 
-    elif args.all:
-        name_pattern = r"^day(\d{2})([ab])[.]py$"
-        container = os.path.join("src", f"year{args.year}")
-        candidates = [
-            re.findall(name_pattern, candidate) for candidate in os.listdir(container)
-        ]
-        candidates = [c[0] for c in candidates if len(c) >= 1]
-        candidates = [
-            [(args.year, int(day), part), f"year{args.year}.day{day}{part}"]
-            for day, part in candidates
-        ]
-        target_modules.update(dict(sorted(candidates)))
+    elif args.all or args.serve:
+        target_modules.update(find_modules(args.year))
+
+    if args.serve:
+        serve(target_modules, args.socket)
+        return
+
+    if args.connect:
+        for target_module in target_modules.values():
+            print(request_solve(args.socket, target_module, args.input))
+        return
+
+    if args.imports:
+        print_imports(target_modules, args.top)
+        return
 
     if args.profile:
-        if len(target_modules) > 1:
-            raise Exception("Too many modules to profile.")
+        profile_modules(target_modules, args.profile_dir, args.top)
+        return
+
+    if args.sample:
+        sample_modules(target_modules, args.profile_dir, args.interval / 1000, args.top)
+        return
+
+    if args.complexity:
+        start = args.scale or 0.25
+        scales = [start * args.growth**i for i in range(args.points)]
+        for year_day_part, target_module in target_modules.items():
+            report = complexity_report(
+                year_day_part,
+                target_module,
+                scales,
+                args.budget,
+                args.rounds,
+                args.seed,
+                args.tile,
+            )
+            print_complexity_report(
+                target_module, report, args.budget, args.memory_budget
+            )
+        return
+
+    if args.allocations:
+        reports = {}
         for year_day_part in target_modules:
             target_module = target_modules[year_day_part]
-            profile_module(target_module)
-            return
+            reports[target_module] = allocation_report(target_module, args.top)
+            print_allocation_report(target_module, reports[target_module])
+        if args.diff:
+            diff_module = f"year{args.year}.day{int(args.diff[:-1]):02}{args.diff[-1]}"
+            diff_report = allocation_report(diff_module, args.top)
+            print_allocation_report(diff_module, diff_report)
+            for target_module, report in reports.items():
+                print_allocation_diff(target_module, report, diff_module, diff_report)
+        return
+
+    if args.bench:
+        headers = ["MODULE", "RESPONSE", "LOOPS"]
+        headers.extend(
+            f"{stat.upper()} (ms)" for stat in ["min", "median", "mean", "stdev", "p95"]
+        )
+    else:
+        headers = ["MODULE", "RESPONSE"]
+        headers.extend(f"{phase.upper()} (s)" for phase in PHASES)
+        headers.append("TIME (s)")
+        if args.memory:
+            headers.append("MEM (MiB)")
+
+    contents = {}
+    generated = {}
+    if args.scale is not None:
+        generators = importlib.import_module(f"year{args.year}.generators")
+        for year_day_part in target_modules:
+            year, day, part = year_day_part
+            # Both parts of a day solve the same generated input.
+            content = contents.get((year, day, "a")) or contents.get((year, day, "b"))
+            if content is None:
+                content = generators.generate(day, args.scale, args.seed)
+            contents[year_day_part] = content
+            generated[year_day_part] = {
+                "scale": args.scale,
+                "seed": args.seed,
+                "input_sha256": hashlib.sha256(content.encode()).hexdigest(),
+            }
+
+    if args.stream:
+        streaming = {
+            year_day_part: target_module
+            for year_day_part, target_module in target_modules.items()
+            if can_stream(target_module)
+        }
+        if len(streaming) < len(target_modules):
+            skipped = len(target_modules) - len(streaming)
+            print(
+                f"Skipping {skipped} module(s) that can't stream their input.",
+                file=sys.stdout if args.format == "table" else sys.stderr,
+            )
+        target_modules = streaming
+
+    if args.input or args.stream:
+        source = sys.stdin.buffer if args.input == "-" else args.input
+        content = InputSource(source, args.stream)
+        described = {"stream": True} if args.stream else {}
+        if args.input:
+            # Piped input is gone once read, there is nothing left to hash.
+            hashed = hash_file(args.input) if args.input != "-" else None
+            described["input_sha256"] = hashed
+        for year_day_part in target_modules:
+            contents[year_day_part] = content
+            generated[year_day_part] = described
 
-    headers = ["MODULE", "RESPONSE", "TIME (s)"]
-    if args.memory:
-        headers.append("MEM (MiB)")
+    results = {}
+    cached = {}
+    pending = dict(target_modules)
 
-    results = []
+    # Anything asking for measurements needs the solutions to actually run,
+    # and the cache only knows about the real inputs.
+    measuring = args.bench or args.memory or args.compare or args.rounds > 1
+    measuring = measuring or args.scale is not None or args.input or args.stream
+    cache_keys = {
+        year_day_part: cache_key(year_day_part, target_modules[year_day_part])
+        for year_day_part in target_modules
+    }
+    if not (args.no_cache or measuring):
+        for year_day_part, key in cache_keys.items():
+            if key is None:
+                continue
+            try:
+                cached[year_day_part] = cache_lookup(args.cache_dir, key)
+            except KeyError:
+                continue
+            del pending[year_day_part]
 
-    pbar = tqdm.tqdm(target_modules)
-    for year_day_part in pbar:
-        target_module = target_modules[year_day_part]
-        pbar.set_description(target_module)
-        result = run_module(target_module, args.rounds, args.memory)
-        results.append(
+    failures = {}
+    limits = Limits(args.timeout, args.max_memory, args.max_cpu)
+
+    if args.jobs > 1 or any(limits):
+        pbar = tqdm.tqdm(total=len(pending))
+        completed = run_modules_isolated(
+            pending, args.jobs, args.rounds, args.memory, limits, contents
+        )
+        for year_day_part, status, result in completed:
+            pbar.set_description(target_modules[year_day_part])
+            pbar.update()
+            if status == "OK":
+                results[year_day_part] = result
+            else:
+                failures[year_day_part] = (status, result)
+        pbar.close()
+    else:
+        pbar = tqdm.tqdm(pending)
+        for year_day_part in pbar:
+            target_module = pending[year_day_part]
+            pbar.set_description(target_module)
+            if args.bench:
+                results[year_day_part] = bench_module(
+                    target_module,
+                    args.warmup,
+                    args.repeat,
+                    args.min_time,
+                    contents.get(year_day_part),
+                )
+            else:
+                results[year_day_part] = run_module(
+                    target_module,
+                    args.rounds,
+                    args.memory,
+                    contents.get(year_day_part),
+                )
+
+    for year_day_part, result in results.items():
+        if year_day_part in generated or cache_keys[year_day_part] is None:
+            continue
+        cache_store(
+            args.cache_dir,
+            cache_keys[year_day_part],
+            target_modules[year_day_part],
+            result.response,
+        )
+
+    rows = []
+    for year_day_part in sorted([*results, *cached, *failures]):
+        if year_day_part in cached:
+            rows.append([target_modules[year_day_part], cached[year_day_part]])
+            rows[-1].extend([None] * (len(headers) - 2))
+            continue
+        if year_day_part in failures:
+            rows.append([target_modules[year_day_part], failures[year_day_part][0]])
+            rows[-1].extend([None] * (len(headers) - 2))
+            continue
+        result = results[year_day_part]
+        if args.bench:
+            rows.append([target_modules[year_day_part], result.response, result.loops])
+            rows[-1].extend(value * 1000 for value in result.stats.values())
+            continue
+        rows.append(
             [
-                target_module,
+                target_modules[year_day_part],
                 result.response,
+                result.phases["import"],
+                *[result.phases[phase] / args.rounds for phase in PHASES[1:]],
                 result.duration / args.rounds,
             ]
         )
         if args.memory:
-            results[-1].append(result.memory / 1024 / 1024)
+            rows[-1].append(result.memory / 1024 / 1024)
 
-    print()
-    print(tabulate.tabulate(results, headers=headers, floatfmt=".4f"))
+    # Machine readable output owns stdout, notes for humans go to stderr.
+    notes = sys.stdout if args.format == "table" else sys.stderr
+
+    environment = get_environment()
+    if args.format == "table":
+        print()
+        print(tabulate.tabulate(rows, headers=headers, floatfmt=".4f"))
+    else:
+        output_records = make_output_records(
+            target_modules, results, cached, failures, environment, generated
+        )
+        print(OUTPUT_FORMATS[args.format](environment, output_records))
+
+    if generated and args.scale is not None:
+        print(file=notes)
+        print(f"Generated inputs at scale {args.scale} (seed {args.seed}).", file=notes)
+    if cached:
+        print(file=notes)
+        print(
+            f"{len(cached)} answer(s) from cache, use --no-cache to recompute.",
+            file=notes,
+        )
+    if failures:
+        print(file=notes)
+        for year_day_part, (status, message) in sorted(failures.items()):
+            print(f"{target_modules[year_day_part]}: {message or status}", file=notes)
+
+    records = [
+        make_history_record(
+            year_day_part,
+            target_modules[year_day_part],
+            result,
+            environment,
+            generated.get(year_day_part),
+        )
+        for year_day_part, result in sorted(results.items())
+    ]
+
+    regressions = []
+    missing_baseline = False
+    if args.compare:
+        history = load_history(args.history)
+        rows, regressions = compare_to_baseline(
+            records, history, args.baseline, args.threshold
+        )
+        headers = ["MODULE", "BASELINE (s)", "CURRENT (s)", "CHANGE (%)", "STATUS"]
+        print(file=notes)
+        print(tabulate.tabulate(rows, headers=headers, floatfmt=".4f"), file=notes)
+        # A gate with nothing to compare against must not pass silently.
+        missing_baseline = bool(rows) and all(row[-1] == "MISSING" for row in rows)
+        if missing_baseline:
+            print(file=notes)
+            print(
+                f"No clean runs at {args.compare} ({args.baseline[:12]}) in "
+                f"{args.history} to compare against.",
+                file=notes,
+            )
+
+    if not args.no_history:
+        append_history(args.history, records)
+
+    if regressions:
+        print(file=notes)
+        print(f"Slower than {args.compare} by more than {args.threshold}%:", file=notes)
+        print(os.linesep.join(regressions), file=notes)
+
+    if regressions or failures or missing_baseline:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,29 +1,41 @@
 #!/usr/bin/env python3
 
-import os
+import itertools
+import typing as T
 
+from .util import inputs
 
-def parse_input(content: str) -> list[int]:
+
+def parse_lines(lines: T.Iterable[str]) -> T.Iterator[int]:
     # Interestingly, off by one when not using ints...
-    return list(map(int, filter(None, map(str.strip, content.split(os.linesep)))))
+    return map(int, filter(None, map(str.strip, lines)))
+
+
+def parse_input(content: str | T.Iterable[str]) -> list[int] | T.Iterator[int]:
+    data = parse_lines(inputs.as_lines(content))
+    return list(data) if isinstance(content, str) else data
 
 
-def count_depth_increases(depths: list[int]) -> int:
+def count_depth_increases(depths: T.Iterable[int]) -> int:
     increases = 0
-    for index in range(0, len(depths) - 1):
-        a = depths[index]
-        b = depths[index + 1]
+    for a, b in itertools.pairwise(depths):
         if b > a:
             increases += 1
     return increases
 
 
-def main(runner=False):
-    with open("inputs/year2021/001.txt") as fp:
-        content = fp.read()
+def solve(depths: T.Iterable[int]) -> int:
+    return count_depth_increases(depths)
+
+
+def main(runner=False, source=None, stream=False):
+    if stream:
+        content = inputs.iter_lines(2021, 1, source)
+    else:
+        content = inputs.read_input(2021, 1, source)
 
     depths = parse_input(content)
-    increases = count_depth_increases(depths)
+    increases = solve(depths)
     if runner:
         return increases
     print(increases)
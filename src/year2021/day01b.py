@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 
-import os
+from .util import inputs
 
 
 def parse_input(content: str) -> list[int]:
-    return list(map(int, filter(None, map(str.strip, content.split(os.linesep)))))
+    return list(map(int, filter(None, map(str.strip, content.splitlines()))))
 
 
 def sums_in_window(depths: list[int], window_length=3):
@@ -23,13 +23,16 @@ def count_depth_increases(depths: list[int]) -> int:
     return increases
 
 
-def main(runner=False):
-    with open("inputs/year2021/001.txt") as fp:
-        content = fp.read()
+def solve(depths: list[int]) -> int:
+    windowed_depths = sums_in_window(depths)
+    return count_depth_increases(windowed_depths)
+
+
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 1, source)
 
     depths = parse_input(content)
-    windowed_depths = sums_in_window(depths)
-    increases = count_depth_increases(windowed_depths)
+    increases = solve(depths)
     if runner:
         return increases
     print(increases)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# day01b over an int64 array instead of a list, parsed straight from the
+# input bytes. With stream=True the input is read in fixed-size chunks, so
+# memory stays bounded however many readings there are.
+
+import typing as T
+
+import numpy as np
+
+from .util import arrays, inputs
+
+
+WINDOW = 3
+
+
+def parse_input(content: str | bytes | memoryview) -> np.ndarray:
+    if isinstance(content, str):
+        content = content.encode()
+    return arrays.parse_ints(content)
+
+
+def count_window_increases(depths: np.ndarray, window: int = WINDOW) -> int:
+    # Neighbouring windows share all but their first and last readings, so a
+    # window sum goes up exactly when the reading entering it is larger than
+    # the one leaving it: depths[i + window] > depths[i].
+    return int(np.count_nonzero(depths[window:] > depths[:-window]))
+
+
+def count_window_increases_chunked(
+    chunks: T.Iterable[np.ndarray], window: int = WINDOW
+) -> int:
+    # The last `window` readings of each chunk are compared against the
+    # first readings of the next one.
+    increases = 0
+    tail = np.empty(0, dtype=np.int64)
+    for depths in chunks:
+        depths = np.concatenate((tail, depths))
+        increases += count_window_increases(depths, window)
+        tail = depths[-window:]
+    return increases
+
+
+def solve(depths: np.ndarray) -> int:
+    return count_window_increases(depths)
+
+
+def main(runner=False, source=None, stream=False):
+    if stream:
+        chunks = arrays.iter_int_chunks(inputs.iter_chunks(2021, 1, source))
+        increases = count_window_increases_chunked(chunks)
+    else:
+        with inputs.open_input(2021, 1, source) as data:
+            depths = parse_input(data.view)
+        increases = solve(depths)
+    if runner:
+        return increases
+    print(increases)
+
+
+if __name__ == "__main__":
+    main()
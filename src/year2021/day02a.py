@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-import os
+from .util import inputs
 
 
 def parse_input(content: str) -> list[tuple[str, int]]:
@@ -9,9 +9,7 @@ def parse_input(content: str) -> list[tuple[str, int]]:
             a,
             int(b),
         )
-        for a, b in map(
-            str.split, filter(None, map(str.strip, content.split(os.linesep)))
-        )
+        for a, b in map(str.split, filter(None, map(str.strip, content.splitlines())))
     ]
 
 
@@ -30,14 +28,18 @@ def execute_plan(commands: list[tuple[str, int]]) -> tuple[int, int]:
     return x, y
 
 
-def main(runner=False):
-    with open("inputs/year2021/002.txt") as fp:
-        content = fp.read()
+def solve(commands: list[tuple[str, int]]) -> int:
+    x, y = execute_plan(commands)
+    return x * y
+
+
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 2, source)
 
     commands = parse_input(content)
-    x, y = execute_plan(commands)
     if runner:
-        return x * y
+        return solve(commands)
+    x, y = execute_plan(commands)
     print(f"({x}, {y}) and {x} * {y} = {x * y}")
 
 
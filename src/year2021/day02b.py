@@ -1,21 +1,28 @@
 #!/usr/bin/env python3
 
-import os
+import typing as T
 
+from .util import inputs
 
-def parse_input(content: str) -> list[tuple[str, int]]:
-    return [
+
+def parse_lines(lines: T.Iterable[str]) -> T.Iterator[tuple[str, int]]:
+    return (
         (
             a,
             int(b),
         )
-        for a, b in map(
-            str.split, filter(None, map(str.strip, content.split(os.linesep)))
-        )
-    ]
+        for a, b in map(str.split, filter(None, map(str.strip, lines)))
+    )
+
 
+def parse_input(
+    content: str | T.Iterable[str],
+) -> list[tuple[str, int]] | T.Iterator[tuple[str, int]]:
+    data = parse_lines(inputs.as_lines(content))
+    return list(data) if isinstance(content, str) else data
 
-def execute_plan(commands: list[tuple[str, int]]) -> tuple[int, int]:
+
+def execute_plan(commands: T.Iterable[tuple[str, int]]) -> tuple[int, int]:
     x = y = aim = 0
     for command, value in commands:
         match command:
@@ -31,14 +38,21 @@ def execute_plan(commands: list[tuple[str, int]]) -> tuple[int, int]:
     return x, y
 
 
-def main(runner=False):
-    with open("inputs/year2021/002.txt") as fp:
-        content = fp.read()
+def solve(commands: T.Iterable[tuple[str, int]]) -> int:
+    x, y = execute_plan(commands)
+    return x * y
+
+
+def main(runner=False, source=None, stream=False):
+    if stream:
+        content = inputs.iter_lines(2021, 2, source)
+    else:
+        content = inputs.read_input(2021, 2, source)
 
     commands = parse_input(content)
-    x, y = execute_plan(commands)
     if runner:
-        return x * y
+        return solve(commands)
+    x, y = execute_plan(commands)
     print(f"({x}, {y}) and {x} * {y} = {x * y}")
 
 
@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 
 import collections
-import os
+
+from .util import inputs
 
 
 def parse_input(content: str) -> list[list[int]]:
     return [
         list(map(int, list(row)))
-        for row in filter(None, map(str.strip, content.split(os.linesep)))
+        for row in filter(None, map(str.strip, content.splitlines()))
     ]
 
 
@@ -29,9 +30,8 @@ def solve(data: list[list[int]]) -> int:
     return power_consumption
 
 
-def main(runner=False):
-    with open("inputs/year2021/003.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 3, source)
 
     data = parse_input(content)
     power_consumption = solve(data)
@@ -2,18 +2,24 @@
 
 import collections
 import enum
-import os
+import typing as T
 
+from .util import inputs
 
-def parse_input(content: str) -> list[list[int]]:
-    return [
-        list(map(int, list(row)))
-        for row in filter(None, map(str.strip, content.split(os.linesep)))
-    ]
 
+# Rows are kept as their bit strings with a count per distinct row. There are
+# at most 2^width distinct rows, so the memory used doesn't grow with the
+# number of rows and the input can be streamed.
+RowCounts = collections.Counter[str]
 
-def bit_row_to_decimal(row: list[int]) -> int:
-    return int("".join(map(str, row)), 2)
+
+def parse_input(content: str | T.Iterable[str]) -> RowCounts:
+    lines = inputs.as_lines(content)
+    return collections.Counter(filter(None, map(str.strip, lines)))
+
+
+def bit_row_to_decimal(row: str) -> int:
+    return int(row, 2)
 
 
 class Commonality(enum.Enum):
@@ -21,27 +27,34 @@ class Commonality(enum.Enum):
     MOST = 1
 
 
-def bit_criteria(data: list[list[int]], commonality: Commonality) -> list[int]:
+def bit_criteria(data: RowCounts, commonality: Commonality) -> str:
     index = 0
-    while index < len(data[0]) and len(data) > 1:
-        counts = collections.Counter([row[index] for row in data])
-        (most_bit, most_count), (least_bit, least_count) = counts.most_common()
-        if most_count == least_count:
+    width = len(next(iter(data)))
+    while index < width and sum(data.values()) > 1:
+        ones = sum(count for row, count in data.items() if row[index] == "1")
+        zeros = sum(data.values()) - ones
+        if not ones or not zeros:
+            # Every remaining row agrees on this bit.
+            discriminator = 1 if ones else 0
+        elif ones == zeros:
             discriminator = commonality.value
         else:
             match commonality:
                 case Commonality.LEAST:
-                    discriminator = least_bit
+                    discriminator = 1 if ones < zeros else 0
                 case Commonality.MOST:
-                    discriminator = most_bit
+                    discriminator = 1 if ones > zeros else 0
                 case _:
                     raise Exception(f"Unknown commonality: {commonality}")
-        data = [row for row in data if row[index] == discriminator]
+        bit = str(discriminator)
+        data = collections.Counter(
+            {row: count for row, count in data.items() if row[index] == bit}
+        )
         index += 1
-    return data[0]
+    return next(iter(data))
 
 
-def get_life_support(data: list[list[int]]) -> int:
+def get_life_support(data: RowCounts) -> int:
     oxygen_generator = bit_criteria(data, Commonality.MOST)
     oxygen_generator = bit_row_to_decimal(oxygen_generator)
     co2_scrubber = bit_criteria(data, Commonality.LEAST)
@@ -50,13 +63,15 @@ def get_life_support(data: list[list[int]]) -> int:
     return oxygen_generator * co2_scrubber
 
 
-def solve(data: list[list[int]]) -> int:
+def solve(data: RowCounts) -> int:
     return get_life_support(data)
 
 
-def main(runner=False):
-    with open("inputs/year2021/003.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None, stream=False):
+    if stream:
+        content = inputs.iter_lines(2021, 3, source)
+    else:
+        content = inputs.read_input(2021, 3, source)
 
     data = parse_input(content)
     answer = solve(data)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+# day03b over rows packed into a sorted uint64 array. Rows that agree on
+# their leading bits are contiguous once sorted, and within them the ones
+# with the next bit set form a suffix. Each bit criteria step is then a
+# binary search that narrows a [low, high) range, with no filtering or
+# copying of rows. Rows are at most 64 bits wide.
+
+import enum
+import typing as T
+
+import numpy as np
+
+from .util import arrays, inputs
+
+
+MAX_WIDTH = 64
+
+
+def parse_rows(data: bytes | bytearray | memoryview) -> tuple[np.ndarray, int]:
+    raw = np.frombuffer(data, dtype=np.uint8)
+    # Only "0" and "1" are left unchanged by setting the lowest bit to 1.
+    is_bit = (raw | 1) == ord("1")
+    if not np.all(is_bit | np.isin(raw, arrays.WHITESPACE)):
+        raise Exception("Invalid input: expected rows of bits")
+
+    _, lengths = arrays.token_spans(is_bit)
+    width = int(lengths[0]) if len(lengths) else 0
+    if np.any(lengths != width) or width > MAX_WIDTH:
+        raise Exception(f"Invalid input: rows must share a width of 1 to {MAX_WIDTH}")
+
+    columns = (raw[is_bit] & 1).reshape(-1, width) if width else raw[:0]
+    rows = np.zeros(len(columns), dtype=np.uint64)
+    for column in columns.T:
+        rows <<= np.uint64(1)
+        rows |= column
+    return rows, width
+
+
+def parse_input(content: str | bytes | memoryview) -> tuple[np.ndarray, int]:
+    if isinstance(content, str):
+        content = content.encode()
+    rows, width = parse_rows(content)
+    rows.sort()
+    return rows, width
+
+
+class Commonality(enum.Enum):
+    LEAST = 0
+    MOST = 1
+
+
+def bit_criteria(rows: np.ndarray, width: int, commonality: Commonality) -> int:
+    # `rows` must be sorted. Every row in [low, high) starts with `prefix`.
+    low, high = 0, len(rows)
+    prefix = 0
+    for index in reversed(range(width)):
+        if high - low <= 1:
+            break
+        # Rows after `low` with a smaller prefix can't exist, and rows before
+        # `high` all share the prefix, so a search of the whole array lands
+        # inside the range.
+        split = int(np.searchsorted(rows, np.uint64(prefix | 1 << index)))
+        ones = high - split
+        zeros = split - low
+        if not ones or not zeros:
+            # Every remaining row agrees on this bit.
+            discriminator = 1 if ones else 0
+        elif ones == zeros:
+            discriminator = commonality.value
+        else:
+            match commonality:
+                case Commonality.LEAST:
+                    discriminator = 1 if ones < zeros else 0
+                case Commonality.MOST:
+                    discriminator = 1 if ones > zeros else 0
+                case _:
+                    raise Exception(f"Unknown commonality: {commonality}")
+        if discriminator:
+            low = split
+            prefix |= 1 << index
+        else:
+            high = split
+    return int(rows[low])
+
+
+def get_life_support(rows: np.ndarray, width: int) -> int:
+    oxygen_generator = bit_criteria(rows, width, Commonality.MOST)
+    co2_scrubber = bit_criteria(rows, width, Commonality.LEAST)
+
+    return oxygen_generator * co2_scrubber
+
+
+def solve(data: tuple[np.ndarray, int]) -> int:
+    return get_life_support(*data)
+
+
+def parse_chunks(chunks: T.Iterable[bytes]) -> tuple[np.ndarray, int]:
+    # Only the packed rows are kept, 8 bytes each, rather than the text.
+    parsed = [parse_rows(chunk) for chunk in arrays.iter_whole_chunks(chunks)]
+    widths = {width for rows, width in parsed if len(rows)}
+    if len(widths) > 1:
+        raise Exception("Invalid input: rows must share a width")
+    rows = np.concatenate([rows for rows, _ in parsed] or [np.empty(0, np.uint64)])
+    rows.sort()
+    return rows, widths.pop() if widths else 0
+
+
+def main(runner=False, source=None, stream=False):
+    if stream:
+        data = parse_chunks(inputs.iter_chunks(2021, 3, source))
+    else:
+        with inputs.open_input(2021, 3, source) as content:
+            data = parse_input(content.view)
+    answer = solve(data)
+    if runner:
+        return answer
+    print(answer)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+# day04a over a (boards, size, size) array. Instead of replaying the calls,
+# every cell is replaced by the turn its number is called on. A line is
+# complete on the turn of its last number, the max of its ranks, and a board
+# wins with its first complete line, the min of those maxes. That's a few
+# reductions over the whole array, however many boards and calls there are.
+
+import numpy as np
+
+from .util import arrays, inputs
+
+
+def parse_input(content: str | bytes | memoryview) -> tuple[np.ndarray, np.ndarray]:
+    if isinstance(content, str):
+        content = content.encode()
+    content = bytes(content).lstrip()
+    calls, _, rest = content.partition(b"\n")
+    numbers = arrays.parse_ints(calls.replace(b",", b" "))
+    size = len(rest.lstrip().split(b"\n", 1)[0].split())
+    cells = arrays.parse_ints(rest)
+    if not size or len(cells) % (size * size):
+        raise Exception("Invalid input: boards must be square")
+    return cells.reshape(-1, size, size), numbers
+
+
+def call_ranks(boards: np.ndarray, numbers_to_call: np.ndarray) -> np.ndarray:
+    # The turn each cell is called on. Cells that are never called get
+    # len(numbers_to_call), later than any turn.
+    turns = len(numbers_to_call)
+    # Only the first call of a number counts.
+    called, first_turns = np.unique(numbers_to_call, return_index=True)
+    if not len(called):
+        return np.full(boards.shape, turns, dtype=np.int64)
+    # Looked up by binary search in the sorted calls rather than in a table
+    # indexed by value, which would be as large as the largest number.
+    index = np.minimum(np.searchsorted(called, boards), len(called) - 1)
+    return np.where(called[index] == boards, first_turns[index], turns)
+
+
+def win_turns(ranks: np.ndarray) -> np.ndarray:
+    rows = ranks.max(axis=2).min(axis=1)
+    cols = ranks.max(axis=1).min(axis=1)
+    return np.minimum(rows, cols)
+
+
+def get_score(
+    board: np.ndarray, ranks: np.ndarray, turn: int, numbers_to_call: np.ndarray
+) -> int:
+    unmarked_sum = board[ranks > turn].sum()
+    return int(unmarked_sum * numbers_to_call[turn])
+
+
+def solve(boards: np.ndarray, numbers_to_call: np.ndarray) -> int | None:
+    ranks = call_ranks(boards, numbers_to_call)
+    turns = win_turns(ranks)
+    # The first board to win; ties go to the lowest index, as argmin does.
+    winner = int(np.argmin(turns)) if len(turns) else None
+    if winner is None or turns[winner] == len(numbers_to_call):
+        return None
+    return get_score(boards[winner], ranks[winner], turns[winner], numbers_to_call)
+
+
+def main(runner=False, source=None):
+    with inputs.open_input(2021, 4, source) as content:
+        data = parse_input(content.view)
+    answer = solve(*data)
+    if runner:
+        return answer
+    print(answer)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,13 @@
 
 import os
 
+from .util import inputs
+
 
 def parse_input(content: str) -> tuple[list[int], list[list[list[int]]]]:
     numbers = []
     boards = []
-    for line in content.split(os.linesep):
+    for line in content.splitlines():
         line = line.strip()
         if not line:
             boards.append([])
@@ -76,9 +78,8 @@ def solve(boards: list[list[int]], numbers_to_call: list[int]) -> int:
     return get_score(last_winner, numbers_to_call[: last_call_index + 1])
 
 
-def main(runner=False):
-    with open("inputs/year2021/004.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 4, source)
 
     data = parse_input(content)
     answer = solve(*data)
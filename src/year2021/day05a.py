@@ -3,12 +3,14 @@
 import re
 import os
 
+from .util import inputs
+
 
 def parse_input(content: str) -> list[list[int]]:
     return [
         # x1, y1, x2, y2
         list(map(int, re.findall(r"(\d+)", line)))
-        for line in filter(None, map(str.strip, content.split(os.linesep)))
+        for line in filter(None, map(str.strip, content.splitlines()))
     ]
 
 
@@ -53,9 +55,8 @@ def solve(line_segments: list[list[int]]) -> int:
     return sum([1 if len(values) >= 2 else 0 for values in grid.values()])
 
 
-def main(runner=False):
-    with open("inputs/year2021/005.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 5, source)
 
     data = parse_input(content)
     answer = solve(data)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+
+# day05b as counts instead of lists of segments per cell. Segments are
+# rasterised in batches of at most BATCH_POINTS points, with every point of
+# a batch generated at once from its segment's start, direction and step.
+# Long segments are split across batches.
+#
+# The counts go into a dense uint8 grid over the bounding box when that's
+# cheaper than keeping the covered cells alone, and otherwise into sorted
+# arrays of covered cells and their counts, so a few segments spread over
+# huge coordinates don't allocate a huge grid. Sparse counts are kept as
+# sorted runs, one per batch at first, merged pairwise as they pile up like
+# in a merge sort, so each cell is merged a logarithmic number of times.
+# Dense counts saturate at 255, which is plenty to tell overlaps apart.
+
+import typing as T
+
+import numpy as np
+
+from .util import arrays, inputs
+
+
+BATCH_POINTS = 1 << 20
+# The sparse counts take about this many bytes per covered cell, against one
+# byte per cell of the bounding box for the dense grid.
+SPARSE_BYTES_PER_POINT = 16
+MIN_DENSE_CELLS = 1 << 16
+SATURATED = np.iinfo(np.uint8).max
+
+SEPARATORS = bytes.maketrans(b",->", b"   ")
+
+
+def parse_input(content: str | bytes | memoryview) -> np.ndarray:
+    # x1, y1, x2, y2 per row.
+    if isinstance(content, str):
+        content = content.encode()
+    values = arrays.parse_ints(bytes(content).translate(SEPARATORS))
+    if len(values) % 4:
+        raise Exception("Invalid input: expected x1,y1 -> x2,y2 per line")
+    return values.reshape(-1, 4)
+
+
+def segment_lengths(segments: np.ndarray) -> np.ndarray:
+    x1, y1, x2, y2 = segments.T
+    dx = np.abs(x2 - x1)
+    dy = np.abs(y2 - y1)
+    if np.any((dx != dy) & (dx != 0) & (dy != 0)):
+        raise Exception("Invalid input: segments must be straight or at 45 degrees")
+    return np.maximum(dx, dy) + 1
+
+
+def bounding_box(segments: np.ndarray) -> tuple[int, int, int, int]:
+    xs = segments[:, [0, 2]]
+    ys = segments[:, [1, 3]]
+    return int(xs.min()), int(ys.min()), int(xs.max()), int(ys.max())
+
+
+def rasterise(
+    segments: np.ndarray, batch_points: int | None = None
+) -> T.Iterator[np.ndarray]:
+    # Batches of at most batch_points (default BATCH_POINTS) covered cells,
+    # as keys (y - min_y) * width + (x - min_x) over the bounding box.
+    min_x, min_y, max_x, max_y = bounding_box(segments)
+    width = max_x - min_x + 1
+    if width * (max_y - min_y + 1) > np.iinfo(np.int64).max:
+        raise Exception("Invalid input: coordinates are too far apart")
+
+    x1, y1, x2, y2 = segments.T
+    lengths = segment_lengths(segments)
+    # Point k of the whole raster is starts[owner] + (k - offsets[owner]) *
+    # strides[owner]; the offset is folded into starts up front.
+    strides = np.sign(y2 - y1) * width + np.sign(x2 - x1)
+    ends = np.cumsum(lengths)
+    offsets = ends - lengths
+    starts = (y1 - min_y) * width + (x1 - min_x) - offsets * strides
+
+    batch_points = batch_points or BATCH_POINTS
+    for low in range(0, int(ends[-1]), batch_points):
+        high = min(low + batch_points, int(ends[-1]))
+        # Segments with points in [low, high), the first and last possibly
+        # only in part.
+        first = int(np.searchsorted(ends, low, "right"))
+        last = int(np.searchsorted(ends, high - 1, "right")) + 1
+        batch_lengths = np.minimum(ends[first:last], high) - np.maximum(
+            offsets[first:last], low
+        )
+        points = np.arange(low, high)
+        yield np.repeat(starts[first:last], batch_lengths) + points * np.repeat(
+            strides[first:last], batch_lengths
+        )
+
+
+def count_dense(segments: np.ndarray) -> np.ndarray:
+    min_x, min_y, max_x, max_y = bounding_box(segments)
+    width = max_x - min_x + 1
+    counts = np.zeros((max_y - min_y + 1) * width, dtype=np.uint8)
+    for batch in rasterise(segments):
+        cells, hits = np.unique(batch, return_counts=True)
+        counts[cells] = np.minimum(counts[cells] + hits, SATURATED)
+    return counts.reshape(-1, width)
+
+
+Counts = tuple[np.ndarray, np.ndarray]
+
+
+def merge_counts(a: Counts, b: Counts) -> Counts:
+    # Two runs of sorted, distinct cells with their counts, as one.
+    a_cells, a_counts = a
+    b_cells, b_counts = b
+    index = np.searchsorted(a_cells, b_cells)
+    found = index < len(a_cells)
+    found[found] = a_cells[index[found]] == b_cells[found]
+    counts = a_counts.copy()
+    # Cells are distinct within a run, so no index repeats.
+    counts[index[found]] += b_counts[found]
+    new = ~found
+    return (
+        np.insert(a_cells, index[new], b_cells[new]),
+        np.insert(counts, index[new], b_counts[new]),
+    )
+
+
+def count_sparse(segments: np.ndarray) -> Counts:
+    # Covered cells as sorted keys from rasterise(), with their counts.
+    runs = []
+    for batch in rasterise(segments):
+        cells, counts = np.unique(batch, return_counts=True)
+        runs.append((cells, counts.astype(np.int64)))
+        # Merge while the previous run is no more than twice as long, so
+        # run lengths at least double down the stack.
+        while len(runs) > 1 and len(runs[-2][0]) <= 2 * len(runs[-1][0]):
+            runs.append(merge_counts(runs.pop(-2), runs.pop()))
+    while len(runs) > 1:
+        runs.append(merge_counts(runs.pop(-2), runs.pop()))
+    if not runs:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return runs[0]
+
+
+def is_dense(segments: np.ndarray) -> bool:
+    min_x, min_y, max_x, max_y = bounding_box(segments)
+    area = (max_x - min_x + 1) * (max_y - min_y + 1)
+    points = int(segment_lengths(segments).sum())
+    return area <= max(points * SPARSE_BYTES_PER_POINT, MIN_DENSE_CELLS)
+
+
+def count_overlaps(segments: np.ndarray) -> int:
+    if not len(segments):
+        return 0
+    if not is_dense(segments):
+        _, counts = count_sparse(segments)
+        return int(np.count_nonzero(counts >= 2))
+    counts = count_dense(segments)
+    # A block of rows at a time, rather than a grid-sized mask.
+    rows = max(1, BATCH_POINTS // counts.shape[1])
+    return sum(
+        int(np.count_nonzero(counts[start : start + rows] >= 2))
+        for start in range(0, len(counts), rows)
+    )
+
+
+def solve(line_segments: np.ndarray) -> int:
+    return count_overlaps(line_segments)
+
+
+def main(runner=False, source=None):
+    with inputs.open_input(2021, 5, source) as content:
+        data = parse_input(content.view)
+    answer = solve(data)
+    if runner:
+        return answer
+    print(answer)
+
+
+if __name__ == "__main__":
+    main()
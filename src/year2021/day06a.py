@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 
 import re
-import os
+
+from .util import inputs
 
 
 def parse_input(content: str) -> list[int]:
-    for row in content.split(os.linesep):
+    for row in content.splitlines():
         if not row.strip():
             continue
         return list(map(int, filter(None, map(str.strip, row.split(",")))))
@@ -32,9 +33,8 @@ def solve(initial_state: list[int], days: int) -> int:
     return len(current_state)
 
 
-def main(runner=False):
-    with open("inputs/year2021/006.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 6, source)
 
     data = parse_input(content)
     answer = solve(data, 80)
@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 
 import collections
-import os
 import re
 
+from .util import inputs
+
 
 def parse_input(content: str) -> list[int]:
-    for row in content.split(os.linesep):
+    for row in content.splitlines():
         if not row.strip():
             continue
         return list(map(int, filter(None, map(str.strip, row.split(",")))))
@@ -33,9 +34,8 @@ def solve(initial_state: list[int], days: int) -> int:
     return sum(current_state.values())
 
 
-def main(runner=False):
-    with open("inputs/year2021/006.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 6, source)
 
     data = parse_input(content)
     answer = solve(data, 256)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+# day06b as a linear recurrence. The counts of fish per timer are a vector
+# and a day is one multiplication by a fixed 9x9 transition matrix, so
+# `days` days are the matrix to the power `days`. That's a product of the
+# matrices for the set bits of `days`, each the square of the one before,
+# making the cost logarithmic in days. The squares are cached per modulus,
+# so forecasting more horizons only costs the matrix-vector products.
+#
+# Exact counts grow by about 9% a day, so horizons beyond MAX_EXACT_DAYS
+# need a modulus.
+#
+# Only the total is asked for, and the total after `days` days is a fixed
+# weighting of the initial counts: the sums of the columns of the matrix
+# power. forecast_batch() works those weights out once per horizon and gets
+# every population's totals from a single matrix product.
+
+import collections
+import functools
+import typing as T
+
+import numpy as np
+
+from .util import inputs
+
+
+TIMERS = 9
+RESET_TIMER = 6
+NEWBORN_TIMER = 8
+MAX_EXACT_DAYS = 10**6
+
+Matrix = tuple[tuple[int, ...], ...]
+
+
+def parse_input(content: str) -> list[int]:
+    for row in content.splitlines():
+        if not row.strip():
+            continue
+        return list(map(int, filter(None, map(str.strip, row.split(",")))))
+
+
+def count_timers(initial_state: T.Iterable[int]) -> list[int]:
+    counts = collections.Counter(initial_state)
+    if not set(counts).issubset(range(TIMERS)):
+        raise Exception(f"Invalid input: timers must be 0 to {TIMERS - 1}")
+    return [counts[timer] for timer in range(TIMERS)]
+
+
+def transition_matrix() -> Matrix:
+    # Row `timer` says where tomorrow's fish with that timer come from.
+    rows = [[0] * TIMERS for _ in range(TIMERS)]
+    for timer in range(1, TIMERS):
+        rows[timer - 1][timer] = 1
+    rows[RESET_TIMER][0] = 1
+    rows[NEWBORN_TIMER][0] = 1
+    return tuple(map(tuple, rows))
+
+
+def multiply(a: Matrix, b: Matrix, modulus: int | None = None) -> Matrix:
+    columns = tuple(zip(*b))
+    product = [[sum(map(int.__mul__, row, column)) for column in columns] for row in a]
+    if modulus:
+        product = [[value % modulus for value in row] for row in product]
+    return tuple(map(tuple, product))
+
+
+def apply(matrix: Matrix, counts: list[int], modulus: int | None = None) -> list[int]:
+    counts = [sum(map(int.__mul__, row, counts)) for row in matrix]
+    if modulus:
+        counts = [count % modulus for count in counts]
+    return counts
+
+
+@functools.cache
+def squared_power(bit: int, modulus: int | None = None) -> Matrix:
+    # The transition matrix to the power 2**bit.
+    if not bit:
+        return transition_matrix()
+    previous = squared_power(bit - 1, modulus)
+    return multiply(previous, previous, modulus)
+
+
+def check_horizon(days: int, modulus: int | None = None):
+    if days < 0:
+        raise Exception(f"Days must not be negative: {days}")
+    if modulus is None and days > MAX_EXACT_DAYS:
+        raise Exception(f"Counts after {days} days are too large without a modulus")
+    if modulus is not None and modulus < 2:
+        raise Exception(f"Modulus must be at least 2: {modulus}")
+
+
+def advance(counts: list[int], days: int, modulus: int | None = None) -> list[int]:
+    check_horizon(days, modulus)
+    for bit in range(days.bit_length()):
+        if days >> bit & 1:
+            counts = apply(squared_power(bit, modulus), counts, modulus)
+    return counts
+
+
+def solve(initial_state: list[int], days: int, modulus: int | None = None) -> int:
+    total = sum(advance(count_timers(initial_state), days, modulus))
+    return total % modulus if modulus else total
+
+
+def forecast(
+    initial_state: list[int], horizons: T.Iterable[int], modulus: int | None = None
+) -> dict[int, int]:
+    counts = count_timers(initial_state)
+    forecasts = {}
+    for days in horizons:
+        total = sum(advance(counts, days, modulus))
+        forecasts[days] = total % modulus if modulus else total
+    return forecasts
+
+
+@functools.cache
+def horizon_weights(days: int, modulus: int | None = None) -> tuple[int, ...]:
+    # How many fish one fish with each timer becomes after `days` days.
+    check_horizon(days, modulus)
+    weights = [1] * TIMERS
+    for bit in range(days.bit_length()):
+        if days >> bit & 1:
+            columns = tuple(zip(*squared_power(bit, modulus)))
+            weights = apply(columns, weights, modulus)
+    return tuple(weights)
+
+
+def forecast_batch(
+    counts: np.ndarray, horizons: T.Sequence[int], modulus: int | None = None
+) -> np.ndarray:
+    # `counts` has a row of timer counts per population. The result has a
+    # row per population and a column per horizon.
+    counts = np.asarray(counts)
+    if counts.ndim != 2 or counts.shape[1] != TIMERS:
+        raise Exception(f"Counts must have shape (populations, {TIMERS})")
+    if np.any(counts < 0):
+        raise Exception("Counts must not be negative")
+    weights = [horizon_weights(days, modulus) for days in horizons]
+
+    if modulus:
+        counts = counts % modulus
+        largest = (modulus - 1) ** 2 * TIMERS
+    else:
+        largest = max(1, int(counts.sum(axis=1).max(initial=0))) * max(
+            (max(row) for row in weights), default=0
+        )
+    # Stay in int64 while no product or sum can overflow it, and fall back
+    # to Python ints otherwise.
+    dtype = np.int64 if largest <= np.iinfo(np.int64).max else object
+    totals = counts.astype(dtype) @ np.array(weights, dtype=dtype).reshape(-1, TIMERS).T
+    return totals % modulus if modulus else totals
+
+
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 6, source)
+
+    data = parse_input(content)
+    answer = solve(data, 256)
+    if runner:
+        return answer
+    print(answer)
+
+
+if __name__ == "__main__":
+    main()
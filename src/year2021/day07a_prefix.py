@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+# day07a over sorted positions and their prefix sums. The total distance to
+# a candidate splits at the candidate into the crabs left and right of it,
+# each side a count times the candidate minus a range sum, so it takes one
+# binary search.
+#
+# The total distance is smallest at the median, so that's the only
+# candidate to try. cheapest() finds the minimum of any other convex cost
+# by ternary search.
+
+import dataclasses
+import typing as T
+
+import numpy as np
+
+from .util import arrays, inputs
+
+
+@dataclasses.dataclass(frozen=True)
+class Crabs:
+    positions: np.ndarray  # Sorted.
+    prefix_sums: np.ndarray  # prefix_sums[i] is the sum of positions[:i].
+
+    @classmethod
+    def from_positions(cls, positions: np.ndarray) -> "Crabs":
+        positions = np.sort(positions)
+        prefix_sums = np.concatenate(([0], np.cumsum(positions)))
+        return cls(positions, prefix_sums)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+def parse_input(content: str | bytes | memoryview) -> Crabs:
+    if isinstance(content, str):
+        content = content.encode()
+    positions = arrays.parse_ints(bytes(content).replace(b",", b" "))
+    if not len(positions):
+        raise Exception("Invalid input: no crab positions")
+    return Crabs.from_positions(positions)
+
+
+def linear_cost(crabs: Crabs, candidate: int) -> int:
+    left = int(np.searchsorted(crabs.positions, candidate))
+    left_sum = int(crabs.prefix_sums[left])
+    right_sum = int(crabs.prefix_sums[-1]) - left_sum
+    right = len(crabs) - left
+    return candidate * left - left_sum + right_sum - candidate * right
+
+
+def cheapest(cost: T.Callable[[int], int], low: int, high: int) -> tuple[int, int]:
+    # Position and cost of the minimum of a convex cost over [low, high].
+    while high - low > 2:
+        third = (high - low) // 3
+        a, b = low + third, high - third
+        cost_a, cost_b = cost(a), cost(b)
+        if cost_a < cost_b:
+            high = b - 1
+        elif cost_a > cost_b:
+            low = a + 1
+        else:
+            # A convex function is only flat at its minimum.
+            low, high = a, b
+    return min(((cost(c), c) for c in range(low, high + 1)))[::-1]
+
+
+def solve(crabs: Crabs) -> int:
+    return linear_cost(crabs, int(crabs.positions[len(crabs) // 2]))
+
+
+def main(runner=False, source=None):
+    with inputs.open_input(2021, 7, source) as content:
+        data = parse_input(content.view)
+    answer = solve(data)
+    if runner:
+        return answer
+    print(answer)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,12 @@
 
 import collections
 import functools
-import os
+
+from .util import inputs
 
 
 def parse_input(content: str) -> list[int]:
-    for row in content.split(os.linesep):
+    for row in content.splitlines():
         if not row.strip():
             continue
         return list(map(int, filter(None, map(str.strip, row.split(",")))))
@@ -38,9 +39,8 @@ def solve(positions: list[int]) -> tuple[int, int]:
         return v
 
 
-def main(runner=False):
-    with open("inputs/year2021/007.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 7, source)
 
     data = parse_input(content)
     answer = solve(data)
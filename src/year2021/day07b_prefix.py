@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# day07b over sorted positions and their prefix sums. The total distance to
+# a candidate splits at the candidate into the crabs left and right of it,
+# each side a count times the candidate minus a range sum, so it takes one
+# binary search. The triangular cost d * (d + 1) / 2 per crab adds the sum
+# of squared distances, which expands to sums over all crabs and is O(1).
+#
+# The triangular total is within half a step of its real minimum at the
+# mean, so only the integers around the mean need to be tried. cheapest()
+# finds the minimum of any other convex cost by ternary search.
+
+import dataclasses
+import operator
+import typing as T
+
+import numpy as np
+
+from .util import arrays, inputs
+
+
+@dataclasses.dataclass(frozen=True)
+class Crabs:
+    positions: np.ndarray  # Sorted.
+    prefix_sums: np.ndarray  # prefix_sums[i] is the sum of positions[:i].
+    square_sum: int
+
+    @classmethod
+    def from_positions(cls, positions: np.ndarray) -> "Crabs":
+        positions = np.sort(positions)
+        prefix_sums = np.concatenate(([0], np.cumsum(positions)))
+        values = positions.tolist()
+        return cls(positions, prefix_sums, sum(map(operator.mul, values, values)))
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+def parse_input(content: str | bytes | memoryview) -> Crabs:
+    if isinstance(content, str):
+        content = content.encode()
+    positions = arrays.parse_ints(bytes(content).replace(b",", b" "))
+    if not len(positions):
+        raise Exception("Invalid input: no crab positions")
+    return Crabs.from_positions(positions)
+
+
+def linear_cost(crabs: Crabs, candidate: int) -> int:
+    left = int(np.searchsorted(crabs.positions, candidate))
+    left_sum = int(crabs.prefix_sums[left])
+    right_sum = int(crabs.prefix_sums[-1]) - left_sum
+    right = len(crabs) - left
+    return candidate * left - left_sum + right_sum - candidate * right
+
+
+def triangular_cost(crabs: Crabs, candidate: int) -> int:
+    # Sum of (d^2 + d) / 2 over every crab's distance d.
+    squares = (
+        crabs.square_sum
+        - 2 * candidate * int(crabs.prefix_sums[-1])
+        + len(crabs) * candidate * candidate
+    )
+    return (squares + linear_cost(crabs, candidate)) // 2
+
+
+def cheapest(cost: T.Callable[[int], int], low: int, high: int) -> tuple[int, int]:
+    # Position and cost of the minimum of a convex cost over [low, high].
+    while high - low > 2:
+        third = (high - low) // 3
+        a, b = low + third, high - third
+        cost_a, cost_b = cost(a), cost(b)
+        if cost_a < cost_b:
+            high = b - 1
+        elif cost_a > cost_b:
+            low = a + 1
+        else:
+            # A convex function is only flat at its minimum.
+            low, high = a, b
+    return min(((cost(c), c) for c in range(low, high + 1)))[::-1]
+
+
+def solve(crabs: Crabs) -> int:
+    mean = int(crabs.prefix_sums[-1]) // len(crabs)
+    low = max(mean - 1, int(crabs.positions[0]))
+    high = min(mean + 2, int(crabs.positions[-1]))
+    return min(triangular_cost(crabs, candidate) for candidate in range(low, high + 1))
+
+
+def main(runner=False, source=None):
+    with inputs.open_input(2021, 7, source) as content:
+        data = parse_input(content.view)
+    answer = solve(data)
+    if runner:
+        return answer
+    print(answer)
+
+
+if __name__ == "__main__":
+    main()
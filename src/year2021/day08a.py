@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-import os
+from .util import inputs
 
 
 SEGMENTS = {
@@ -18,7 +18,7 @@ SEGMENTS = {
 
 
 def parse_input(content: str) -> list[tuple[list[str], list[str]]]:
-    rows = list(filter(None, map(str.strip, content.split(os.linesep))))
+    rows = list(filter(None, map(str.strip, content.splitlines())))
     rows = [list(map(str.strip, row.split("|"))) for row in rows]
     rows = [
         (
@@ -45,9 +45,8 @@ def solve(data: list[tuple[list[str], list[str]]]) -> int:
     return appearances
 
 
-def main(runner=False):
-    with open("inputs/year2021/008.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 8, source)
 
     data = parse_input(content)
     answer = solve(data)
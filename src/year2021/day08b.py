@@ -2,7 +2,9 @@
 
 import functools
 import itertools
-import os
+import typing as T
+
+from .util import inputs
 
 
 CORPUS = "abcdefg"
@@ -21,24 +23,53 @@ SEGMENTS = {
 }
 
 
-def parse_input(content: str) -> list[tuple[list[str], list[str]]]:
-    rows = list(filter(None, map(str.strip, content.split(os.linesep))))
-    rows = [list(map(str.strip, row.split("|"))) for row in rows]
-    rows = [
+Entry = tuple[list[str], list[str]]
+
+# A pattern as a bitmask with bit i set for segment CORPUS[i], so patterns
+# compare equal regardless of the order of their letters. A display's ten
+# patterns as a frozenset of those masks are its signature: every wiring
+# gives a distinct one.
+Signature = frozenset[int]
+
+
+def parse_lines(lines: T.Iterable[str]) -> T.Iterator[Entry]:
+    rows = filter(None, map(str.strip, lines))
+    rows = (list(map(str.strip, row.split("|"))) for row in rows)
+    rows = (
         (
             a.split(),
             b.split(),
         )
         for a, b in rows
-    ]
+    )
     return rows
 
 
+def parse_input(content: str | T.Iterable[str]) -> list[Entry] | T.Iterator[Entry]:
+    data = parse_lines(inputs.as_lines(content))
+    return list(data) if isinstance(content, str) else data
+
+
+@functools.cache
+def pattern_to_mask(pattern: str) -> int:
+    mask = 0
+    for ch in pattern:
+        mask |= 1 << CORPUS.index(ch)
+    return mask
+
+
+DIGIT_MASKS = {pattern_to_mask(letters): digit for digit, letters in SEGMENTS.items()}
+
+
+def get_signature(patterns: T.Iterable[str]) -> Signature:
+    return frozenset(map(pattern_to_mask, patterns))
+
+
 def segment_to_digit(segment: str) -> int:
-    for digit, letters in SEGMENTS.items():
-        if set(letters) == set(segment):
-            return digit
-    raise Exception(f"Unknown segment: {segment}")
+    try:
+        return DIGIT_MASKS[pattern_to_mask(segment)]
+    except KeyError:
+        raise Exception(f"Unknown segment: {segment}")
 
 
 def apply_translation(patterns: list[str], translations: dict[str, str]) -> list[str]:
@@ -67,31 +98,54 @@ def get_all_wire_permutations() -> list[set[str]]:
     return groups
 
 
-def deduce_rewire(patterns: list[str]) -> dict[str, str]:
-    patterns = set("".join(sorted(pattern)) for pattern in patterns)
+@functools.cache
+def get_rewire_index() -> dict[Signature, dict[str, str]]:
+    precompute = zip(get_all_translations(), get_all_wire_permutations())
+    return {
+        get_signature(wire_group): translations
+        for translations, wire_group in precompute
+    }
 
-    precompute = list(zip(get_all_translations(), get_all_wire_permutations()))
-    for translations, wire_group in precompute:
-        if wire_group == patterns:
-            return translations
 
-    raise Exception("Invalid state.")
+@functools.cache
+def get_digit_index() -> dict[Signature, dict[int, int]]:
+    # For each wiring, the digit shown by each scrambled pattern, so outputs
+    # decode without being translated first.
+    index = {}
+    for signature, translations in get_rewire_index().items():
+        inverted = dict((v, k) for k, v in translations.items())
+        scrambled = apply_translation(SEGMENTS.values(), inverted)
+        index[signature] = dict(zip(map(pattern_to_mask, scrambled), SEGMENTS))
+    return index
+
+
+def deduce_rewire(patterns: list[str]) -> dict[str, str]:
+    try:
+        return get_rewire_index()[get_signature(patterns)]
+    except KeyError:
+        raise Exception("Invalid state.")
 
 
-def solve(data: list[tuple[list[str], list[str]]]) -> int:
+def solve(data: T.Iterable[Entry]) -> int:
+    index = get_digit_index()
     total = 0
     for patterns, output in data:
-        translations = deduce_rewire(patterns)
-        resolved = apply_translation(output, translations)
-        digits = list(map(segment_to_digit, resolved))
-        digits = int("".join(map(str, digits)))
+        try:
+            decoder = index[get_signature(patterns)]
+        except KeyError:
+            raise Exception("Invalid state.")
+        digits = 0
+        for pattern in output:
+            digits = digits * 10 + decoder[pattern_to_mask(pattern)]
         total += digits
     return total
 
 
-def main(runner=False):
-    with open("inputs/year2021/008.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None, stream=False):
+    if stream:
+        content = inputs.iter_lines(2021, 8, source)
+    else:
+        content = inputs.read_input(2021, 8, source)
 
     data = parse_input(content)
     answer = solve(data)
@@ -3,6 +3,8 @@
 import itertools
 import os
 
+from .util import inputs
+
 
 CORPUS = "abcdefg"
 
@@ -21,7 +23,7 @@ SEGMENTS = {
 
 
 def parse_input(content: str) -> list[tuple[list[str], list[str]]]:
-    rows = list(filter(None, map(str.strip, content.split(os.linesep))))
+    rows = list(filter(None, map(str.strip, content.splitlines())))
     rows = [list(map(str.strip, row.split("|"))) for row in rows]
     rows = [
         (
@@ -84,9 +86,8 @@ def solve(data: list[tuple[list[str], list[str]]]) -> int:
     return total
 
 
-def main(runner=False):
-    with open("inputs/year2021/008.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 8, source)
 
     data = parse_input(content)
     answer = solve(data)
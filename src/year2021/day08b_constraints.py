@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+
+# day08b by constraint propagation instead of trying every wiring, for any
+# segment alphabet and symbol table (7-segment digits, 14- or 16-segment
+# alphanumerics, ...). Patterns are bitmasks over the alphabet.
+#
+# A wire can only be connected to a segment that plays the same part in the
+# table. Parts are found by colour refinement, run the same way on the
+# table and on a display's patterns: a pattern's colour is its size and the
+# colours of its segments, and a segment's colour is the colours of the
+# patterns it's lit in. The first round is the classic frequency count per
+# pattern size, which alone tells all seven segments apart. Rounds continue
+# until the table's colouring is stable. Wires whose colour still matches
+# several segments are assigned by a search that checks every pattern once
+# all of its wires are assigned.
+#
+# Segments the table can't tell apart at all (e.g. never lit) may be wired
+# either way, as long as every pattern still reads as the same symbol.
+# Tables where some wiring would read a pattern as another symbol can't be
+# decoded and are rejected up front.
+
+from __future__ import annotations
+import typing as T
+
+from .util import inputs
+
+
+CORPUS = "abcdefg"
+
+SEGMENTS = {
+    0: "abcefg",  # len 6
+    1: "cf",  # len 2
+    2: "acdeg",  # len 5
+    3: "acdfg",  # len 5
+    4: "bcdf",  # len 4
+    5: "abdfg",  # len 5
+    6: "abdefg",  # len 6
+    7: "acf",  # len 3
+    8: "abcdefg",  # len 7
+    9: "abcdfg",  # len 6
+}
+
+
+Entry = tuple[list[str], list[str]]
+
+
+def parse_input(content: str) -> list[Entry]:
+    rows = filter(None, map(str.strip, content.splitlines()))
+    rows = [list(map(str.strip, row.split("|"))) for row in rows]
+    return [(a.split(), b.split()) for a, b in rows]
+
+
+def iter_bits(mask: int) -> T.Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class SegmentDisplay:
+    def __init__(self, alphabet: str, symbols: dict[T.Hashable, str]):
+        if len(set(alphabet)) != len(alphabet):
+            raise Exception(f"Repeated segments in alphabet: {alphabet}")
+        self.alphabet = alphabet
+        self.bits = {segment: 1 << index for index, segment in enumerate(alphabet)}
+        self.symbols = {
+            self.to_mask(pattern): symbol for symbol, pattern in symbols.items()
+        }
+        if len(self.symbols) != len(symbols):
+            raise Exception("Symbols must have distinct patterns")
+        # Colours are interned so the table and every display share ids.
+        self.colour_ids = {}
+        self.colourings = self.refine(self.symbols)
+        self.check_symmetry()
+
+    def to_mask(self, pattern: str) -> int:
+        mask = 0
+        for segment in pattern:
+            try:
+                mask |= self.bits[segment]
+            except KeyError:
+                raise Exception(f"Unknown segment: {segment}")
+        return mask
+
+    def intern(self, colour: tuple) -> int:
+        return self.colour_ids.setdefault(colour, len(self.colour_ids))
+
+    def pattern_colours(
+        self, masks: T.Collection[int], colours: list[int], marked: int | None = None
+    ) -> dict[int, int]:
+        return {
+            mask: self.intern(
+                (
+                    mask == marked,
+                    mask.bit_count(),
+                    tuple(sorted(colours[i] for i in iter_bits(mask))),
+                )
+            )
+            for mask in masks
+        }
+
+    def refine(
+        self,
+        masks: T.Collection[int],
+        rounds: int | None = None,
+        marked: int | None = None,
+    ) -> list[list[int]]:
+        # Segment colours after each round. Without `rounds`, stops once a
+        # round no longer splits any colour. A `marked` pattern gets a colour
+        # of its own.
+        colourings = [[0] * len(self.alphabet)]
+        while rounds is None or len(colourings) <= rounds:
+            lit_in = [[] for _ in self.alphabet]
+            for mask, colour in self.pattern_colours(
+                masks, colourings[-1], marked
+            ).items():
+                for index in iter_bits(mask):
+                    lit_in[index].append(colour)
+            colours = [
+                self.intern((colour, tuple(sorted(patterns))))
+                for colour, patterns in zip(colourings[-1], lit_in)
+            ]
+            if rounds is None and len(set(colours)) == len(set(colourings[-1])):
+                break
+            colourings.append(colours)
+        return colourings
+
+    def check_symmetry(self):
+        # Patterns refinement can't tell apart might be swapped by a wiring.
+        # Marking one of them and then the other, a wiring that respects the
+        # colours must take the second to the first, so finding any at all
+        # means the two symbols look the same on some display.
+        groups = {}
+        colours = self.pattern_colours(self.symbols, self.colourings[-1])
+        for mask, colour in colours.items():
+            groups.setdefault(colour, []).append(mask)
+        for first, *others in groups.values():
+            segments = self.refine(self.symbols, marked=first)[-1]
+            for other in others:
+                rounds = self.refine(self.symbols, marked=other)
+                wires = self.refine(self.symbols, len(rounds) - 1, other)[-1]
+                if sorted(wires) != sorted(segments):
+                    continue
+                if next(self.iter_wirings(self.symbols, wires, segments), None):
+                    raise Exception(
+                        "Symbols can't be told apart: "
+                        f"{self.symbols[first]}, {self.symbols[other]}"
+                    )
+
+    def iter_wirings(
+        self, masks: T.Collection[int], wires: list[int], segments: list[int]
+    ) -> T.Iterator[list[int]]:
+        # Every wiring, wire index to segment index, that connects wires only
+        # to segments of the same colour and reads every mask as a symbol.
+        candidates = [0] * len(self.alphabet)
+        for wire, colour in enumerate(wires):
+            for segment, segment_colour in enumerate(segments):
+                if colour == segment_colour:
+                    candidates[wire] |= 1 << segment
+        yield from self.search(masks, candidates, [None] * len(self.alphabet), 0)
+
+    def search(
+        self,
+        masks: T.Collection[int],
+        candidates: list[int],
+        wiring: list[int | None],
+        used: int,
+    ) -> T.Iterator[list[int]]:
+        unassigned = [w for w, segment in enumerate(wiring) if segment is None]
+        if not unassigned:
+            yield list(wiring)
+            return
+        # The most constrained wire first.
+        wire = min(unassigned, key=lambda w: (candidates[w] & ~used).bit_count())
+        for segment in iter_bits(candidates[wire] & ~used):
+            wiring[wire] = segment
+            if self.consistent(masks, wiring):
+                yield from self.search(masks, candidates, wiring, used | 1 << segment)
+        wiring[wire] = None
+
+    def consistent(self, masks: T.Collection[int], wiring: list[int | None]) -> bool:
+        for mask in masks:
+            segments = [wiring[w] for w in iter_bits(mask)]
+            if None in segments:
+                continue
+            if sum(1 << segment for segment in segments) not in self.symbols:
+                return False
+        return True
+
+    def deduce_rewire(self, patterns: T.Iterable[str]) -> dict[str, str]:
+        # Wire letter to segment letter.
+        masks = set(map(self.to_mask, patterns))
+        if len(masks) != len(self.symbols):
+            raise Exception("Invalid state.")
+        segments = self.colourings[-1]
+        wires = self.refine(masks, len(self.colourings) - 1)[-1]
+        if sorted(wires) != sorted(segments):
+            raise Exception("Invalid state.")
+        wiring = next(self.iter_wirings(masks, wires, segments), None)
+        if wiring is None:
+            raise Exception("Invalid state.")
+        return {self.alphabet[w]: self.alphabet[s] for w, s in enumerate(wiring)}
+
+    def get_decoder(self, patterns: T.Iterable[str]) -> dict[int, T.Hashable]:
+        # Scrambled pattern mask to symbol.
+        patterns = list(patterns)
+        wiring = self.deduce_rewire(patterns)
+        decoder = {}
+        for pattern in patterns:
+            translated = self.to_mask("".join(map(wiring.__getitem__, pattern)))
+            decoder[self.to_mask(pattern)] = self.symbols[translated]
+        return decoder
+
+    def decode(self, patterns: T.Iterable[str], output: T.Iterable[str]) -> list:
+        decoder = self.get_decoder(patterns)
+        try:
+            return [decoder[self.to_mask(pattern)] for pattern in output]
+        except KeyError as e:
+            raise Exception(f"Unknown pattern: {e}")
+
+
+SEVEN_SEGMENT = SegmentDisplay(CORPUS, SEGMENTS)
+
+
+def solve(data: T.Iterable[Entry], display: SegmentDisplay = SEVEN_SEGMENT) -> int:
+    total = 0
+    for patterns, output in data:
+        digits = display.decode(patterns, output)
+        total += int("".join(map(str, digits)))
+    return total
+
+
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 8, source)
+
+    data = parse_input(content)
+    answer = solve(data)
+    if runner:
+        return answer
+    print(answer)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,15 @@
 #!/usr/bin/env python3
 
-import os
 import re
 
+from .util import inputs
+
 
 def parse_input(content: str) -> dict[tuple[int, int], int]:
     grid = {}
     rows = [
         list(map(int, re.findall(r"(\d)", line)))
-        for line in filter(None, map(str.strip, content.split(os.linesep)))
+        for line in filter(None, map(str.strip, content.splitlines()))
     ]
     for y, row in enumerate(rows):
         for x, col in enumerate(row):
@@ -42,9 +43,8 @@ def solve(data: dict[tuple[int, int], int]) -> int:
     return sum(value + 1 for value in poi.values())
 
 
-def main(runner=False):
-    with open("inputs/year2021/009.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 9, source)
 
     data = parse_input(content)
     answer = solve(data)
@@ -2,9 +2,10 @@
 
 import functools
 import operator
-import os
 import re
 
+from .util import inputs
+
 
 BOUNDARY = 9
 
@@ -13,7 +14,7 @@ def parse_input(content: str) -> dict[tuple[int, int], int]:
     grid = {}
     rows = [
         list(map(int, re.findall(r"(\d)", line)))
-        for line in filter(None, map(str.strip, content.split(os.linesep)))
+        for line in filter(None, map(str.strip, content.splitlines()))
     ]
     for y, row in enumerate(rows):
         for x, col in enumerate(row):
@@ -71,9 +72,8 @@ def solve(data: dict[tuple[int, int], int]) -> int:
     return functools.reduce(operator.mul, sorted(basins.values())[-3:])
 
 
-def main(runner=False):
-    with open("inputs/year2021/009.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 9, source)
 
     data = parse_input(content)
     answer = solve(data)
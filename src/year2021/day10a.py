@@ -2,7 +2,8 @@
 
 import collections
 import enum
-import os
+
+from .util import inputs
 
 
 OPEN = "([{<"
@@ -35,7 +36,7 @@ ParseResult = collections.namedtuple(
 
 
 def parse_input(content: str) -> list[list[str]]:
-    return list(filter(None, map(str.strip, content.split(os.linesep))))
+    return list(filter(None, map(str.strip, content.splitlines())))
 
 
 def is_pair(lhs: str, rhs: str) -> bool:
@@ -69,9 +70,8 @@ def solve(data: list[list[str]]) -> int:
     return score
 
 
-def main(runner=False):
-    with open("inputs/year2021/010.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 10, source)
 
     data = parse_input(content)
     answer = solve(data)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
-import os
+import typing as T
+
+from .util import inputs
 
 
 OPEN = "([{<"
@@ -15,8 +17,13 @@ SCORE = {
 }
 
 
-def parse_input(content: str) -> list[list[str]]:
-    return list(filter(None, map(str.strip, content.split(os.linesep))))
+def parse_lines(lines: T.Iterable[str]) -> T.Iterator[str]:
+    return filter(None, map(str.strip, lines))
+
+
+def parse_input(content: str | T.Iterable[str]) -> list[str] | T.Iterator[str]:
+    data = parse_lines(inputs.as_lines(content))
+    return list(data) if isinstance(content, str) else data
 
 
 def is_pair(lhs: str, rhs: str) -> bool:
@@ -44,7 +51,8 @@ def get_score(chunks: str) -> int:
     return score
 
 
-def solve(data: list[list[str]]) -> int:
+def solve(data: T.Iterable[str]) -> int:
+    # Only the scores are kept, the median needs all of them.
     scores = []
     for line in data:
         result = parse_incomplete(line)
@@ -54,9 +62,11 @@ def solve(data: list[list[str]]) -> int:
     return sorted(scores)[len(scores) // 2]
 
 
-def main(runner=False):
-    with open("inputs/year2021/010.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None, stream=False):
+    if stream:
+        content = inputs.iter_lines(2021, 10, source)
+    else:
+        content = inputs.read_input(2021, 10, source)
 
     data = parse_input(content)
     answer = solve(data)
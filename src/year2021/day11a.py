@@ -2,17 +2,19 @@
 
 import os
 
-import colorama
+from .util import inputs
 
 
 def parse_input(content: str) -> list[list[int]]:
     return [
         list(map(int, list(row)))
-        for row in filter(None, map(str.strip, content.split(os.linesep)))
+        for row in filter(None, map(str.strip, content.splitlines()))
     ]
 
 
 def render_grid(grid: list[list[int]], colors=True) -> str:
+    import colorama
+
     output = []
     for row in grid:
         output.append([])
@@ -93,9 +95,8 @@ def solve(data: list[list[int]], steps: int) -> int:
     return flashes
 
 
-def main(runner=False):
-    with open("inputs/year2021/011.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 11, source)
 
     data = parse_input(content)
     answer = solve(data, 100)
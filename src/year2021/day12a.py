@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 
-import os
 import string
 import typing as T
 
-import colorama
+from .util import inputs
 
 
 def parse_input(content: str) -> dict[str, list[str]]:
     result = {}
-    for row in filter(None, map(str.strip, content.split(os.linesep))):
+    for row in filter(None, map(str.strip, content.splitlines())):
         lhs, rhs = filter(None, map(str.strip, row.split("-")))
         if lhs == "end":
             lhs, rhs = rhs, lhs
@@ -51,9 +50,8 @@ def solve(graph: dict[str, list[str]]) -> int:
     return paths
 
 
-def main(runner=False):
-    with open("inputs/year2021/012.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 12, source)
 
     data = parse_input(content)
     answer = solve(data)
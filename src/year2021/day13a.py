@@ -5,6 +5,8 @@ import math
 import os
 import re
 
+from .util import inputs
+
 
 ParsedInput = tuple[list[tuple[int, int]], list[tuple[str, int]]]
 Grid = collections.Counter[tuple[int, int], int]
@@ -68,9 +70,8 @@ def solve(data: ParsedInput, max_folds=math.inf) -> int:
     return len(grid)
 
 
-def main(runner=False):
-    with open("inputs/year2021/013.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 13, source)
 
     data = parse_input(content)
     answer = solve(data, 1)
@@ -5,7 +5,7 @@ import math
 import os
 import re
 
-from .util import letters4by6
+from .util import inputs, letters4by6
 
 
 ParsedInput = tuple[list[tuple[int, int]], list[tuple[str, int]]]
@@ -70,9 +70,8 @@ def solve(data: ParsedInput, max_folds=math.inf) -> str:
     return letters4by6.translate(render_grid(grid))
 
 
-def main(runner=False):
-    with open("inputs/year2021/013.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 13, source)
 
     data = parse_input(content)
     answer = solve(data)
@@ -5,6 +5,8 @@ import collections
 import re
 import typing as T
 
+from .util import inputs
+
 
 Rules = dict[tuple[str, str], str]
 ParsedInput = tuple[str, Rules]
@@ -85,9 +87,8 @@ def solve(data: ParsedInput, max_steps: int) -> int:
     return most_common - least_common
 
 
-def main(runner=False):
-    with open("inputs/year2021/014.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 14, source)
 
     data = parse_input(content)
     answer = solve(data, 10)
@@ -6,7 +6,7 @@ import math
 import os
 import typing as T
 
-import colorama
+from .util import inputs
 
 
 V2 = tuple[int, int]
@@ -15,7 +15,7 @@ V2 = tuple[int, int]
 def parse_input(content: str) -> dict[V2, int]:
     rows = [
         list(map(int, list(row)))
-        for row in filter(None, map(str.strip, content.split(os.linesep)))
+        for row in filter(None, map(str.strip, content.splitlines()))
     ]
     graph = {}
     for y, row in enumerate(rows):
@@ -124,6 +124,8 @@ def dijkstra(
 
 
 def render_dijkstra(graph: dict[V2, int], path: list[V2]) -> str:
+    import colorama
+
     (min_x, min_y), (max_x, max_y) = get_corners(graph)
 
     output = []
@@ -209,9 +211,8 @@ def solve(data: dict[V2, int]) -> int:
     return sum(data[xy] for xy in path[1:])
 
 
-def main(runner=False):
-    with open("inputs/year2021/015.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 15, source)
 
     data = parse_input(content)
     answer = solve(data)
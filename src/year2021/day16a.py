@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
 import dataclasses
-import os
+
+from .util import inputs
 
 
 HEX_TO_BIN = {
@@ -25,7 +26,7 @@ HEX_TO_BIN = {
 
 
 def parse_input(content: str) -> str:
-    for row in filter(None, map(str.strip, content.split(os.linesep))):
+    for row in filter(None, map(str.strip, content.splitlines())):
         return row
 
 
@@ -169,9 +170,8 @@ def solve(data: str) -> int:
     return sum(node.version for node in walk_packets(packet))
 
 
-def main(runner=False):
-    with open("inputs/year2021/016.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 16, source)
 
     data = parse_input(content)
     data = convert_hex_to_bin(data)
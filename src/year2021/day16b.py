@@ -3,7 +3,8 @@
 import dataclasses
 import functools
 import operator
-import os
+
+from .util import inputs
 
 
 HEX_TO_BIN = {
@@ -27,7 +28,7 @@ HEX_TO_BIN = {
 
 
 def parse_input(content: str) -> str:
-    for row in filter(None, map(str.strip, content.split(os.linesep))):
+    for row in filter(None, map(str.strip, content.splitlines())):
         return row
 
 
@@ -195,9 +196,8 @@ def solve(data: str) -> int:
     return render(packet)
 
 
-def main(runner=False):
-    with open("inputs/year2021/016.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 16, source)
 
     data = parse_input(content)
     data = convert_hex_to_bin(data)
@@ -5,6 +5,8 @@ import math
 import os
 import re
 
+from .util import inputs
+
 
 @dataclasses.dataclass
 class Vector2:
@@ -89,9 +91,8 @@ def solve(data: Target) -> int:
     return max_y
 
 
-def main(runner=False):
-    with open("inputs/year2021/017.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 17, source)
 
     data = parse_input(content)
     answer = solve(data)
@@ -4,6 +4,8 @@ import dataclasses
 import os
 import re
 
+from .util import inputs
+
 
 @dataclasses.dataclass(frozen=True)
 class Vector2:
@@ -90,9 +92,8 @@ def solve(data: Target) -> int:
     return len(all_initial_velocity_hits(data))
 
 
-def main(runner=False):
-    with open("inputs/year2021/017.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 17, source)
 
     data = parse_input(content)
     answer = solve(data)
@@ -7,9 +7,10 @@ import itertools
 import json
 import math
 import operator
-import os
 import re
 
+from .util import inputs
+
 
 class Pair:
     def __init__(
@@ -88,7 +89,7 @@ class Pair:
 def parse_input(content: str) -> list[Pair]:
     return [
         Pair.build(json.loads(row))
-        for row in filter(None, map(str.strip, content.split(os.linesep)))
+        for row in filter(None, map(str.strip, content.splitlines()))
     ]
 
 
@@ -227,9 +228,8 @@ def solve(data: list[Pair]) -> int:
     return max(magnitudes.values())
 
 
-def main(runner=False):
-    with open("inputs/year2021/018.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 18, source)
 
     data = parse_input(content)
     answer = solve(data)
@@ -6,12 +6,13 @@ import dataclasses
 import functools
 import itertools
 import math
-import os
 import re
 import typing as T
 
 import numpy as np
 
+from .util import inputs
+
 
 MIN_OVERLAP = 12
 # In this input, scanner 18 only had 65 matches: (12,2)-1.
@@ -77,7 +78,7 @@ class RT:
 def parse_input(content: str) -> dict[int, set[Vector3]]:
     data = collections.defaultdict(set)
     last_key = None
-    for row in filter(None, map(str.strip, content.split(os.linesep))):
+    for row in filter(None, map(str.strip, content.splitlines())):
         if "---" in row:
             last_key = int(re.findall(r"(\d+)", row)[0])
             continue
@@ -264,9 +265,8 @@ def solve(data: dict[int, set[Vector3]]) -> int:
     return beacons
 
 
-def main(runner=False):
-    with open("inputs/year2021/019.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 19, source)
 
     data = parse_input(content)
     answer = len(solve(data))
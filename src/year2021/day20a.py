@@ -4,6 +4,8 @@ import enum
 import os
 import re
 
+from .util import inputs
+
 
 Image = dict[tuple[int, int], str]
 
@@ -17,13 +19,13 @@ def parse_input(content: str) -> tuple[str, Image]:
     sections = re.split(r"^\s*$", content.strip(), flags=re.MULTILINE)
     enhancement, image, *_ = sections
 
-    enhancement = "".join(map(str.strip, enhancement.split(os.linesep)))
+    enhancement = "".join(map(str.strip, enhancement.splitlines()))
     if len(enhancement) != 512:
         raise Exception(f"Invalid algorithm length: f{len(enhancement)}")
 
     image = {
         (x, y): cell
-        for y, row in enumerate(map(str.strip, image.split(os.linesep)))
+        for y, row in enumerate(map(str.strip, image.splitlines()))
         for x, cell in enumerate(row)
     }
 
@@ -128,9 +130,8 @@ def solve(data: tuple[str, Image], rounds: int) -> int:
     return sum(1 if image[(x, y)] == Pixel.LIGHT else 0 for x, y in image)
 
 
-def main(runner=False):
-    with open("inputs/year2021/020.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 20, source)
 
     data = parse_input(content)
     answer = solve(data, rounds=2)
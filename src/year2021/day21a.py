@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
-import os
 import re
 
+from .util import inputs
+
 
 def parse_input(content: str) -> dict[int, int]:
     return {
@@ -68,9 +69,8 @@ def solve(min_score: int, start_positions: dict[int, int]) -> int:
     return losing_score * die.rolled
 
 
-def main(runner=False):
-    with open("inputs/year2021/021.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 21, source)
 
     data = parse_input(content)
     answer = solve(1000, data)
@@ -2,9 +2,10 @@
 
 import functools
 import itertools
-import os
 import re
 
+from .util import inputs
+
 
 MIN_SCORE = 21
 
@@ -64,9 +65,8 @@ def solve(start_positions: dict[int, int]) -> int:
     return max(wins1, wins2)
 
 
-def main(runner=False):
-    with open("inputs/year2021/021.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 21, source)
 
     data = parse_input(content)
     answer = solve(data)
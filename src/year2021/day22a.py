@@ -2,10 +2,11 @@
 
 import dataclasses
 import enum
-import os
 import re
 import typing as T
 
+from .util import inputs
+
 
 class Toggle(enum.Enum):
     OFF = 0
@@ -29,7 +30,7 @@ class RebootStep:
 def parse_input(content: str) -> list[RebootStep]:
     pattern = r"^(on|off) x=(-?\d+)..(-?\d+),y=(-?\d+)..(-?\d+),z=(-?\d+)..(-?\d+)"
     steps = []
-    for row in filter(None, map(str.strip, content.split(os.linesep))):
+    for row in filter(None, map(str.strip, content.splitlines())):
         match = re.search(pattern, row)
         toggle, args = match.groups()[0], list(map(int, match.groups()[1:]))
         min_x = min(args[0], args[1])
@@ -83,9 +84,8 @@ def solve(steps: list[RebootStep]) -> int:
     return sum(1 if grid[point] == Toggle.ON else 0 for point in grid)
 
 
-def main(runner=False):
-    with open("inputs/year2021/022.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 22, source)
 
     data = parse_input(content)
     answer = solve(data)
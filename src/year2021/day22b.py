@@ -3,9 +3,10 @@
 from __future__ import annotations
 import dataclasses
 import enum
-import os
 import re
 
+from .util import inputs
+
 
 @dataclasses.dataclass(frozen=True, order=True)
 class Vector3:
@@ -47,7 +48,7 @@ class RebootStep:
 def parse_input(content: str) -> list[RebootStep]:
     pattern = r"^(on|off) x=(-?\d+)..(-?\d+),y=(-?\d+)..(-?\d+),z=(-?\d+)..(-?\d+)"
     steps = []
-    for row in filter(None, map(str.strip, content.split(os.linesep))):
+    for row in filter(None, map(str.strip, content.splitlines())):
         match = re.search(pattern, row)
         toggle = match.groups()[0]
         args = list(map(int, match.groups()[1:]))
@@ -134,9 +135,8 @@ def solve(steps: list[RebootStep]) -> int:
     return sum(cuboid.volume() * toggle.value for cuboid, toggle in cuboids)
 
 
-def main(runner=False):
-    with open("inputs/year2021/022.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 22, source)
 
     data = parse_input(content)
     answer = solve(data)
@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 
 import dataclasses
-import os
 import typing as T
 
-import colorama
+from .util import inputs
 
 
 def parse_input(content: str) -> list[list[str | int]]:
     instructions = []
-    for line in filter(None, map(str.strip, content.split(os.linesep))):
+    for line in filter(None, map(str.strip, content.splitlines())):
         components = line.split()
         for i, c in enumerate(components):
             try:
@@ -74,6 +73,8 @@ class ALU:
             self.output_step(instruction)
 
     def output_step(self, instruction: list[str | int]):
+        import colorama
+
         def style(value: T.Any, *mods: str) -> str:
             return "".join(mods) + str(value) + colorama.Style.RESET_ALL
 
@@ -328,7 +329,7 @@ def resolve_implications(variants: list[Variant]):
             right = left - delta
         else:
             right = 9
-            left = left + delta
+            left = right + delta
         ws[w1] = left
         ws[w0] = right
 
@@ -348,9 +349,8 @@ def solve(data: list[list[str | int]]) -> str:
     return resolve_implications(variants)
 
 
-def main(runner=False):
-    with open("inputs/year2021/024.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 24, source)
 
     data = parse_input(content)
     answer = solve(data)
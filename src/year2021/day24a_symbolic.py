@@ -2,17 +2,15 @@
 
 from __future__ import annotations
 import dataclasses
-import os
 import pprint
 import typing as T
 
-import colorama
-import sympy
+from .util import inputs
 
 
 def parse_input(content: str) -> list[list[str | int]]:
     instructions = []
-    for line in filter(None, map(str.strip, content.split(os.linesep))):
+    for line in filter(None, map(str.strip, content.splitlines())):
         components = line.split()
         for i, c in enumerate(components):
             try:
@@ -81,6 +79,8 @@ class ALU:
             self.output_step(instruction)
 
     def output_step(self, instruction: list[str | int]):
+        import colorama
+
         def style(value: T.Any, *mods: str) -> str:
             return "".join(mods) + str(value) + colorama.Style.RESET_ALL
 
@@ -202,6 +202,8 @@ class Expr:
 
 
 def to_symbolic_tree(instruction_group: list[list[str | int]]):
+    import sympy
+
     tree = []
     # n = 'a'
 
@@ -372,9 +374,8 @@ def solve(data: list[list[str | int]]):
     alu.run(iter(map(int, str(13579246899999))))
 
 
-def main(runner=False):
-    with open("inputs/year2021/024.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 24, source)
 
     data = parse_input(content)
 
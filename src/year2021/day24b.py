@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 
 import dataclasses
-import os
 import typing as T
 
+from .util import inputs
+
 
 def parse_input(content: str) -> list[list[str | int]]:
     instructions = []
-    for line in filter(None, map(str.strip, content.split(os.linesep))):
+    for line in filter(None, map(str.strip, content.splitlines())):
         components = line.split()
         for i, c in enumerate(components):
             try:
@@ -113,9 +114,8 @@ def solve(data: list[list[str | int]]) -> str:
     return resolve_implications(variants)
 
 
-def main(runner=False):
-    with open("inputs/year2021/024.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 24, source)
 
     data = parse_input(content)
     answer = solve(data)
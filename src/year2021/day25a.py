@@ -4,6 +4,8 @@ import dataclasses
 import enum
 import os
 
+from .util import inputs
+
 
 class Mobile(str, enum.Enum):
     EAST = ">"
@@ -26,7 +28,7 @@ class State:
 def parse_input(content: str) -> State:
     grid = {}
 
-    rows = list(filter(None, map(str.strip, content.split(os.linesep))))
+    rows = list(filter(None, map(str.strip, content.splitlines())))
     height = len(rows)
     width = len(rows[0])
 
@@ -96,9 +98,8 @@ def solve(data: State) -> int:
     return counter
 
 
-def main(runner=False):
-    with open("inputs/year2021/025.txt") as fp:
-        content = fp.read()
+def main(runner=False, source=None):
+    content = inputs.read_input(2021, 25, source)
 
     data = parse_input(content)
     answer = solve(data)
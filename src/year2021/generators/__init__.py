@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+# Seeded generators for synthetic puzzle inputs.
+#
+# Each dayNN module exposes generate(scale, seed) returning input text that
+# the matching solutions parse and solve. A scale of 1 approximates the size
+# of the real puzzle input; larger (or fractional) scales grow (or shrink)
+# whichever dimension dominates that day's work. The same scale and seed
+# always produce the same text.
+
+import importlib
+import math
+
+
+def scaled(base: int, scale: float, minimum: int = 1) -> int:
+    return max(minimum, round(base * scale))
+
+
+def scaled_side(base: int, scale: float, minimum: int = 1) -> int:
+    # Grids grow in both dimensions, so their area tracks the scale.
+    return max(minimum, round(base * math.sqrt(scale)))
+
+
+def get_generator(day: int):
+    try:
+        module = importlib.import_module(f"{__name__}.day{day:02d}")
+    except ModuleNotFoundError:
+        raise Exception(f"No input generator for day {day}") from None
+    return module.generate
+
+
+def generate(day: int, scale: float = 1.0, seed: int = 0) -> str:
+    if scale <= 0:
+        raise Exception(f"Scale must be positive: {scale}")
+    return get_generator(day)(scale, seed)
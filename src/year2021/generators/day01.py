@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    depth = rng.randint(100, 200)
+    depths = []
+    for _ in range(scaled(2000, scale)):
+        depth = max(0, depth + rng.randint(-12, 20))
+        depths.append(depth)
+    return os.linesep.join(map(str, depths)) + os.linesep
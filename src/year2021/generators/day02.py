@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled
+
+
+DIRECTIONS = ["forward", "down", "up"]
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    commands = [
+        f"{rng.choices(DIRECTIONS, weights=[4, 4, 2])[0]} {rng.randint(1, 9)}"
+        for _ in range(scaled(1000, scale))
+    ]
+    return os.linesep.join(commands) + os.linesep
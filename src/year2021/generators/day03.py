@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+import math
+import os
+import random
+
+from year2021.generators import scaled
+
+
+def split_rows(rng: random.Random, count: int, width: int) -> list[str]:
+    # The bit criteria keep filtering while more than one row is left. Build
+    # the rows as a trie where every group of two or more rows has at least
+    # one row on each side of the next bit, so every step narrows the group
+    # and every column has both bit values.
+    if width == 0:
+        return [""] * count
+    if count == 1:
+        return ["".join(rng.choice("01") for _ in range(width))]
+    zeros = min(count - 1, max(1, round(count * rng.uniform(0.35, 0.65))))
+    ones = count - zeros
+    return ["0" + row for row in split_rows(rng, zeros, width - 1)] + [
+        "1" + row for row in split_rows(rng, ones, width - 1)
+    ]
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    count = scaled(1000, scale, minimum=2)
+    width = max(12, math.ceil(math.log2(count)) + 2)
+    rows = split_rows(rng, count, width)
+    rng.shuffle(rows)
+    return os.linesep.join(rows) + os.linesep
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled
+
+
+BOARD_SIZE = 5
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    count = scaled(100, scale)
+    numbers = list(range(max(BOARD_SIZE * BOARD_SIZE, count)))
+    width = len(str(numbers[-1]))
+
+    # Every number is eventually called, so every board eventually wins.
+    calls = numbers[:]
+    rng.shuffle(calls)
+
+    sections = [",".join(map(str, calls))]
+    for _ in range(count):
+        cells = rng.sample(numbers, BOARD_SIZE * BOARD_SIZE)
+        rows = [
+            " ".join(
+                str(cell).rjust(width)
+                for cell in cells[i * BOARD_SIZE : (i + 1) * BOARD_SIZE]
+            )
+            for i in range(BOARD_SIZE)
+        ]
+        sections.append(os.linesep.join(rows))
+    return (os.linesep * 2).join(sections) + os.linesep
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled, scaled_side
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    # Keep the density of the real input: the line count tracks the scale
+    # while the grid side only tracks its square root.
+    size = scaled_side(1000, scale, minimum=10)
+    lines = []
+    for _ in range(scaled(500, scale)):
+        x0, y0 = rng.randrange(size), rng.randrange(size)
+        match rng.choice(["horizontal", "vertical", "diagonal"]):
+            case "horizontal":
+                x1, y1 = rng.randrange(size), y0
+            case "vertical":
+                x1, y1 = x0, rng.randrange(size)
+            case "diagonal":
+                dx, dy = rng.choice([-1, 1]), rng.choice([-1, 1])
+                limit_x = size - 1 - x0 if dx > 0 else x0
+                limit_y = size - 1 - y0 if dy > 0 else y0
+                length = rng.randint(0, min(limit_x, limit_y))
+                x1, y1 = x0 + dx * length, y0 + dy * length
+        lines.append(f"{x0},{y0} -> {x1},{y1}")
+    return os.linesep.join(lines) + os.linesep
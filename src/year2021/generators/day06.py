@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    timers = [rng.randint(1, 5) for _ in range(scaled(300, scale))]
+    return ",".join(map(str, timers)) + os.linesep
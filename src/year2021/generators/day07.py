@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    count = scaled(1000, scale)
+    # Like the real input, positions bunch up towards zero and the spread
+    # grows with the number of crabs.
+    positions = [int(rng.triangular(0, 2 * count, 0)) for _ in range(count)]
+    return ",".join(map(str, positions)) + os.linesep
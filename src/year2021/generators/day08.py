@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled
+
+
+SEGMENTS = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
+
+
+def scramble(rng: random.Random, wiring: dict[str, str], segments: str) -> str:
+    wires = [wiring[segment] for segment in segments]
+    rng.shuffle(wires)
+    return "".join(wires)
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    entries = []
+    for _ in range(scaled(200, scale)):
+        wires = list("abcdefg")
+        rng.shuffle(wires)
+        wiring = dict(zip("abcdefg", wires))
+        patterns = [scramble(rng, wiring, segments) for segments in SEGMENTS]
+        rng.shuffle(patterns)
+        outputs = [scramble(rng, wiring, SEGMENTS[rng.randrange(10)]) for _ in range(4)]
+        entries.append(f"{' '.join(patterns)} | {' '.join(outputs)}")
+    return os.linesep.join(entries) + os.linesep
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled_side
+
+
+# The real heightmap is carved into basins a handful of cells across by
+# ridges of 9s. Scatter one basin centre per cell of a coarse grid and wall
+# off every cell that borders a different basin.
+BASIN_SPACING = 7
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = scaled_side(100, scale, minimum=3)
+    cells = -(-side // BASIN_SPACING)
+    centres = {
+        (cx, cy): (
+            cx * BASIN_SPACING + rng.randrange(BASIN_SPACING),
+            cy * BASIN_SPACING + rng.randrange(BASIN_SPACING),
+        )
+        for cy in range(cells)
+        for cx in range(cells)
+    }
+
+    def basin(x: int, y: int) -> tuple[int, int]:
+        cx, cy = x // BASIN_SPACING, y // BASIN_SPACING
+        candidates = [
+            (cx + dx, cy + dy)
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+            if (cx + dx, cy + dy) in centres
+        ]
+        return min(
+            candidates,
+            key=lambda c: abs(centres[c][0] - x) + abs(centres[c][1] - y),
+        )
+
+    labels = [[basin(x, y) for x in range(side)] for y in range(side)]
+    rows = []
+    for y in range(side):
+        row = []
+        for x in range(side):
+            label = labels[y][x]
+            if (x + 1 < side and labels[y][x + 1] != label) or (
+                y + 1 < side and labels[y + 1][x] != label
+            ):
+                row.append("9")
+            else:
+                centre = centres[label]
+                distance = abs(centre[0] - x) + abs(centre[1] - y)
+                row.append(str(min(8, distance + rng.randint(0, 2))))
+        rows.append("".join(row))
+    return os.linesep.join(rows) + os.linesep
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled
+
+
+PAIRS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def wrong_closer(rng: random.Random, opener: str) -> str:
+    return rng.choice([ch for ch in PAIRS.values() if ch != PAIRS[opener]])
+
+
+def make_chunks(rng: random.Random, length: int, corrupted: bool) -> str:
+    stack = []
+    chunks = []
+    corrupt_at = rng.randrange(length // 2, length) if corrupted else None
+    for index in range(length):
+        if corrupt_at is not None and index >= corrupt_at and stack:
+            chunks.append(wrong_closer(rng, stack.pop()))
+            corrupt_at = None
+        elif stack and rng.random() < 0.45:
+            chunks.append(PAIRS[stack.pop()])
+        else:
+            opener = rng.choice(list(PAIRS))
+            stack.append(opener)
+            chunks.append(opener)
+    if corrupt_at is not None:
+        opener = rng.choice(list(PAIRS))
+        chunks.append(opener + wrong_closer(rng, opener))
+    elif not stack:
+        # Never end balanced; the line would be neither corrupted nor
+        # incomplete.
+        chunks.append(rng.choice(list(PAIRS)))
+    return "".join(chunks)
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    count = scaled(94, scale)
+    # The autocomplete score is a median, so the number of incomplete lines
+    # has to be odd.
+    incomplete = max(1, count // 2) | 1
+    corrupted = max(0, count - incomplete)
+    lines = [make_chunks(rng, rng.randint(90, 110), False) for _ in range(incomplete)]
+    lines += [make_chunks(rng, rng.randint(90, 110), True) for _ in range(corrupted)]
+    rng.shuffle(lines)
+    return os.linesep.join(lines) + os.linesep
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+import itertools
+import os
+import random
+
+from year2021.generators import scaled_side
+
+
+# Part b steps until every octopus flashes at once, and uniformly random
+# grids of any real size never get there. Grids drawn from a narrower range
+# of energy levels do, so narrow the range until a candidate synchronises.
+SYNC_LIMIT = 200
+
+
+def synchronises(grid: list[list[int]], limit: int) -> bool:
+    height, width = len(grid), len(grid[0])
+    energy = [cell for row in grid for cell in row]
+    neighbours = [
+        [
+            (y + dy) * width + (x + dx)
+            for dy, dx in itertools.product((-1, 0, 1), repeat=2)
+            if (dy or dx) and 0 <= y + dy < height and 0 <= x + dx < width
+        ]
+        for y in range(height)
+        for x in range(width)
+    ]
+
+    for _ in range(limit):
+        energy = [level + 1 for level in energy]
+        pending = [index for index, level in enumerate(energy) if level > 9]
+        flashed = set(pending)
+        while pending:
+            index = pending.pop()
+            for other in neighbours[index]:
+                energy[other] += 1
+                if energy[other] > 9 and other not in flashed:
+                    flashed.add(other)
+                    pending.append(other)
+        if len(flashed) == len(energy):
+            return True
+        for index in flashed:
+            energy[index] = 0
+    return False
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = scaled_side(10, scale, minimum=2)
+    for attempt in itertools.count():
+        lowest = min(8, 3 + attempt // 3)
+        grid = [[rng.randint(lowest, 9) for _ in range(side)] for _ in range(side)]
+        # With only 8s and a 9, the first flash sets off every octopus.
+        grid[rng.randrange(side)][rng.randrange(side)] = 9
+        if synchronises(grid, SYNC_LIMIT):
+            break
+    rows = ["".join(map(str, row)) for row in grid]
+    return os.linesep.join(rows) + os.linesep
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import math
+import os
+import random
+import string
+
+
+def cave_name(rng: random.Random, alphabet: str, taken: set[str]) -> str:
+    while True:
+        name = "".join(rng.choice(alphabet) for _ in range(2))
+        if name not in taken and name not in ("start", "end"):
+            taken.add(name)
+            return name
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    # The number of paths grows exponentially with the number of caves, so
+    # the cave count only grows with the logarithm of the scale.
+    extra = round(2 * math.log2(scale)) if scale > 1 else 0
+    small_count = 6 + extra
+    big_count = 3 + extra // 3
+
+    taken = set()
+    small = ["start", "end"]
+    small += [cave_name(rng, string.ascii_lowercase, taken) for _ in range(small_count)]
+    big = [cave_name(rng, string.ascii_uppercase, taken) for _ in range(big_count)]
+
+    edges = set()
+    # Big caves only ever connect to small caves, otherwise there would be
+    # infinitely many paths bouncing between them.
+    for cave in big:
+        for other in rng.sample(small, min(len(small), rng.randint(3, 5))):
+            edges.add(tuple(sorted((cave, other))))
+    for cave in small[2:]:
+        for other in rng.sample(small, 2):
+            if other != cave:
+                edges.add(tuple(sorted((cave, other))))
+    if not any("start" in edge for edge in edges):
+        edges.add(("start", small[2]))
+    if not any("end" in edge for edge in edges):
+        edges.add((small[-1], "end"))
+
+    edges = sorted(edges)
+    rng.shuffle(edges)
+    return os.linesep.join(f"{lhs}-{rhs}" for lhs, rhs in edges) + os.linesep
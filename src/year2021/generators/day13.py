@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+import math
+import os
+import random
+
+from year2021.util import letters4by6
+
+
+LETTER_COUNT = 8
+LETTER_WIDTH = 4
+LETTER_HEIGHT = 6
+# Axis sizes of the folded paper are the fold lines of the real input:
+# x=655, 327, 163, 81, 40 and y=447, 223, 111, 55, 27, 13, 6.
+BASE_X_FOLDS = 5
+BASE_Y_FOLDS = 7
+
+
+def fold_lines(first: int, count: int) -> list[int]:
+    # Folding a sheet 2 * f + 1 wide at f leaves a sheet f wide.
+    lines = [first]
+    while len(lines) < count:
+        lines.append(2 * lines[-1] + 1)
+    return lines
+
+
+def unfold(
+    rng: random.Random, dots: set[tuple[int, int]], axis: int, at: int, both: float
+) -> set[tuple[int, int]]:
+    result = set()
+    for dot in dots:
+        mirrored = list(dot)
+        mirrored[axis] = 2 * at - dot[axis]
+        mirrored = tuple(mirrored)
+        roll = rng.random()
+        if roll < both:
+            result.update([dot, mirrored])
+        elif roll < (1 + both) / 2:
+            result.add(dot)
+        else:
+            result.add(mirrored)
+    return result
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    letters = rng.choices(list(letters4by6.LETTERS), k=LETTER_COUNT)
+
+    dots = set()
+    for index, letter in enumerate(letters):
+        for y, row in enumerate(letters4by6.LETTERS[letter]):
+            for x, cell in enumerate(row):
+                if cell == "#":
+                    dots.add((index * (LETTER_WIDTH + 1) + x, y))
+
+    # Each unfold keeps some dots on one side, some on the other and copies
+    # a few to both. Past the real input's folds, extra folds copy more
+    # eagerly so the dot count grows with the scale.
+    extra = max(0, round(math.log(scale, 1.5))) if scale > 1 else 0
+    x_lines = fold_lines(LETTER_COUNT * (LETTER_WIDTH + 1), BASE_X_FOLDS + extra // 2)
+    y_lines = fold_lines(LETTER_HEIGHT, BASE_Y_FOLDS + extra - extra // 2)
+
+    folds = []
+    for index in range(max(len(x_lines), len(y_lines))):
+        folds += [("x", line) for line in x_lines[index : index + 1]]
+        folds += [("y", line) for line in y_lines[index : index + 1]]
+    for count, (axis, line) in enumerate(folds):
+        both = 0.1 if count < BASE_X_FOLDS + BASE_Y_FOLDS else 0.5
+        dots = unfold(rng, dots, "xy".index(axis), line, both)
+    folds.reverse()
+
+    dots = sorted(dots)
+    rng.shuffle(dots)
+    lines = [f"{x},{y}" for x, y in dots]
+    lines.append("")
+    lines += [f"fold along {axis}={line}" for axis, line in folds]
+    return os.linesep.join(lines) + os.linesep
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+
+import itertools
+import os
+import random
+import string
+
+from year2021.generators import scaled
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    elements = rng.sample(string.ascii_uppercase, 10)
+    template = "".join(rng.choices(elements, k=scaled(20, scale, minimum=2)))
+    # Every pair has a rule, so every step inserts between every pair.
+    rules = [
+        f"{lhs}{rhs} -> {rng.choice(elements)}"
+        for lhs, rhs in itertools.product(elements, repeat=2)
+    ]
+    rng.shuffle(rules)
+    return os.linesep.join([template, ""] + rules) + os.linesep
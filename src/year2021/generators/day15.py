@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled_side
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = scaled_side(100, scale, minimum=2)
+    rows = ["".join(str(rng.randint(1, 9)) for _ in range(side)) for _ in range(side)]
+    return os.linesep.join(rows) + os.linesep
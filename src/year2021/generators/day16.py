@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import math
+import os
+import random
+
+from year2021.generators import scaled
+
+
+# The real transmission holds about 300 packets.
+BASE_PACKETS = 300
+MAX_DEPTH = 12
+MAX_COUNT = 2**11 - 1
+MAX_LENGTH = 2**15 - 1
+
+SUM, PRODUCT, MINIMUM, MAXIMUM, LITERAL = 0, 1, 2, 3, 4
+COMPARISONS = [5, 6, 7]
+
+
+def encode_literal(value: int) -> str:
+    bits = f"{value:b}"
+    bits = bits.zfill(-(-len(bits) // 4) * 4)
+    groups = [bits[i : i + 4] for i in range(0, len(bits), 4)]
+    return "".join(
+        ("0" if index == len(groups) - 1 else "1") + group
+        for index, group in enumerate(groups)
+    )
+
+
+def encode_operator(rng: random.Random, children: list[str]) -> str:
+    length = sum(map(len, children))
+    if len(children) <= MAX_COUNT and (length > MAX_LENGTH or rng.random() < 0.5):
+        return "1" + f"{len(children):011b}" + "".join(children)
+    return "0" + f"{length:015b}" + "".join(children)
+
+
+def split_budget(rng: random.Random, budget: int, parts: int) -> list[int]:
+    cuts = sorted(rng.sample(range(1, budget), parts - 1))
+    return [b - a for a, b in zip([0] + cuts, cuts + [budget])]
+
+
+def make_packet(
+    rng: random.Random, budget: int, depth: int = 0, type_id: int | None = None
+) -> str:
+    version = f"{rng.randrange(8):03b}"
+    if type_id is None:
+        if budget == 1:
+            type_id = LITERAL
+        elif budget == 2:
+            type_id = rng.choice([SUM, MINIMUM, MAXIMUM])
+        else:
+            type_id = rng.choice([SUM, PRODUCT, MINIMUM, MAXIMUM] + COMPARISONS)
+
+    if type_id == LITERAL:
+        return version + "100" + encode_literal(rng.randrange(2 ** rng.randint(4, 16)))
+
+    budget -= 1
+    if type_id in COMPARISONS:
+        parts = [make_packet(rng, b, depth + 1) for b in split_budget(rng, budget, 2)]
+    elif type_id == PRODUCT:
+        # Multiply a comparison with another subtree, which keeps the value
+        # from growing without bound as the transmission grows.
+        lhs, rhs = split_budget(rng, budget, 2) if budget >= 4 else (3, budget - 3)
+        parts = [
+            make_packet(rng, max(3, lhs), depth + 1, rng.choice(COMPARISONS)),
+            make_packet(rng, max(1, rhs), depth + 1),
+        ]
+    else:
+        # Widen the operators as the remaining depth runs out, so the packet
+        # tree stays shallow enough for the recursive decoder.
+        width = math.ceil(budget ** (1 / max(1, MAX_DEPTH - depth)))
+        count = min(budget, MAX_COUNT, max(rng.randint(1, 5), width))
+        parts = [
+            make_packet(rng, b, depth + 1) for b in split_budget(rng, budget, count)
+        ]
+    return version + f"{type_id:03b}" + encode_operator(rng, parts)
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    bits = make_packet(rng, scaled(BASE_PACKETS, scale))
+    bits += "0" * (-len(bits) % 4)
+    return f"{int(bits, 2):0{len(bits) // 4}X}" + os.linesep
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+
+import math
+import os
+import random
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    # Part b tries every velocity that could reach the target, which is a
+    # range of x velocities times a range of y velocities. Scaling both
+    # axes by the square root keeps that product in step with the scale.
+    factor = math.sqrt(scale)
+    x0 = round(rng.randint(80, 120) * factor)
+    x1 = x0 + max(20, round(rng.randint(20, 40) * factor))
+    y1 = -round(rng.randint(80, 110) * factor)
+    y0 = y1 - max(10, round(rng.randint(30, 60) * factor))
+    return f"target area: x={x0}..{x1}, y={y0}..{y1}" + os.linesep
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled
+
+
+MAX_DEPTH = 4
+
+
+def make_number(rng: random.Random, depth: int = 1) -> str:
+    # Reduced numbers never nest a pair inside four others and never hold a
+    # regular number above 9.
+    halves = [
+        (
+            make_number(rng, depth + 1)
+            if depth < MAX_DEPTH and rng.random() < 0.6
+            else str(rng.randrange(10))
+        )
+        for _ in range(2)
+    ]
+    return f"[{halves[0]},{halves[1]}]"
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    numbers = [make_number(rng) for _ in range(scaled(100, scale, minimum=2))]
+    return os.linesep.join(numbers) + os.linesep
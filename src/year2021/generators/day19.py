@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.day19a import MIN_OVERLAP, ROTATIONS
+from year2021.generators import scaled
+
+
+SCANNER_RANGE = 1000
+# Beacons each scanner adds inside its own range, on top of the ones shared
+# with the scanner it overlaps.
+OWN_BEACONS = 14
+
+V3 = tuple[int, int, int]
+
+
+def in_range(scanner: V3, beacon: V3) -> bool:
+    return all(abs(b - s) < SCANNER_RANGE for s, b in zip(scanner, beacon))
+
+
+def cell(v: V3) -> V3:
+    return tuple(c // SCANNER_RANGE for c in v)
+
+
+def nearby(grid: dict[V3, list[V3]], scanner: V3) -> list[V3]:
+    # Beacons are bucketed into cubes one scanner range wide, so everything
+    # a scanner sees is within the neighbouring cubes.
+    x, y, z = cell(scanner)
+    return [
+        beacon
+        for dx in (-1, 0, 1)
+        for dy in (-1, 0, 1)
+        for dz in (-1, 0, 1)
+        for beacon in grid.get((x + dx, y + dy, z + dz), [])
+        if in_range(scanner, beacon)
+    ]
+
+
+def rotate(matrix, v: V3) -> V3:
+    return tuple(sum(m * c for m, c in zip(row, v)) for row in matrix)
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    count = scaled(31, scale, minimum=2)
+
+    def random_point(lower: V3, upper: V3) -> V3:
+        return tuple(rng.randint(lo, hi) for lo, hi in zip(lower, upper))
+
+    beacons = set()
+    grid = {}
+
+    def add_beacon(beacon: V3) -> bool:
+        if beacon in beacons:
+            return False
+        beacons.add(beacon)
+        grid.setdefault(cell(beacon), []).append(beacon)
+        return True
+
+    edge = SCANNER_RANGE - 1
+    scanners = [(0, 0, 0)]
+    for _ in range(OWN_BEACONS):
+        add_beacon(random_point((-edge,) * 3, (edge,) * 3))
+
+    # Grow a chain of scanners, each placed near one of the last few. Every
+    # new scanner shares at least MIN_OVERLAP beacons with that neighbour,
+    # so the reports always assemble into a single map.
+    while len(scanners) < count:
+        parent = rng.choice(scanners[-3:])
+        offset = [rng.randint(-600, 600) for _ in range(3)]
+        axis = rng.randrange(3)
+        offset[axis] = rng.choice([-1, 1]) * rng.randint(900, 1300)
+        scanner = tuple(p + o for p, o in zip(parent, offset))
+
+        lower = tuple(max(p, s) - edge for p, s in zip(parent, scanner))
+        upper = tuple(min(p, s) + edge for p, s in zip(parent, scanner))
+        shared = [b for b in nearby(grid, parent) if in_range(scanner, b)]
+        while len(shared) < MIN_OVERLAP:
+            beacon = random_point(lower, upper)
+            if add_beacon(beacon):
+                shared.append(beacon)
+
+        lower = tuple(s - edge for s in scanner)
+        upper = tuple(s + edge for s in scanner)
+        for _ in range(OWN_BEACONS):
+            add_beacon(random_point(lower, upper))
+        scanners.append(scanner)
+
+    sections = []
+    for index, scanner in enumerate(scanners):
+        # Scanner 0 defines the orientation; the others report in any of
+        # the 24 orientations.
+        matrix = ROTATIONS[0] if index == 0 else rng.choice(ROTATIONS)
+        seen = [
+            rotate(matrix, tuple(b - s for b, s in zip(beacon, scanner)))
+            for beacon in nearby(grid, scanner)
+        ]
+        rng.shuffle(seen)
+        lines = [f"--- scanner {index} ---"]
+        lines += [",".join(map(str, beacon)) for beacon in seen]
+        sections.append(os.linesep.join(lines))
+    return (os.linesep * 2).join(sections) + os.linesep
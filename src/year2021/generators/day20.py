@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled_side
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    algorithm = [rng.choice("#.") for _ in range(512)]
+    if algorithm[0] == "#":
+        # Otherwise the infinite background lights up and stays lit.
+        algorithm[511] = "."
+    side = scaled_side(100, scale, minimum=1)
+    rows = ["".join(rng.choice("#.") for _ in range(side)) for _ in range(side)]
+    return os.linesep.join(["".join(algorithm), ""] + rows) + os.linesep
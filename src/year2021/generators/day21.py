@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    # Two starting positions are all there is; the games are the same size
+    # whatever the scale, so only the seed matters.
+    rng = random.Random(seed)
+    lines = [
+        f"Player {player} starting position: {rng.randint(1, 10)}" for player in (1, 2)
+    ]
+    return os.linesep.join(lines) + os.linesep
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled
+
+
+def make_step(rng: random.Random, toggle: str, bound: int, span: int) -> str:
+    ranges = []
+    for axis in "xyz":
+        lower = rng.randint(-bound, bound - span)
+        upper = lower + rng.randint(span // 4, span)
+        ranges.append(f"{axis}={lower}..{upper}")
+    return f"{toggle} {','.join(ranges)}"
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    # Like the real input: a first batch of steps inside the initialization
+    # region, then steps spread across the whole reactor.
+    steps = [
+        make_step(rng, "on" if index < 10 else rng.choice(["on", "off"]), 50, 50)
+        for index in range(scaled(20, scale))
+    ]
+    steps += [
+        make_step(rng, rng.choice(["on", "off"]), 100000, 40000)
+        for _ in range(scaled(400, scale))
+    ]
+    return os.linesep.join(steps) + os.linesep
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled
+
+
+# Each digit is checked by the same block, differing only in the three
+# constants: z is divided by ZDIV, x gets XADD and y gets YADD.
+BLOCK = """
+inp w
+mul x 0
+add x z
+mod x 26
+div z {z_div}
+add x {x_add}
+eql x w
+eql x 0
+mul y 0
+add y 25
+mul y x
+add y 1
+mul z y
+mul y 0
+add y w
+add y {y_add}
+mul y x
+add z y
+""".strip()
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    pairs = scaled(7, scale)
+
+    # Blocks with ZDIV 1 push a base-26 digit onto z and blocks with ZDIV 26
+    # pop it. A random balanced sequence of pushes and pops, where each pop
+    # can cancel its push with digits 1-9, accepts at least one model number.
+    order = []
+    open_count = 0
+    remaining = pairs
+    while remaining or open_count:
+        if remaining and (not open_count or rng.random() < 0.5):
+            order.append("push")
+            open_count += 1
+            remaining -= 1
+        else:
+            order.append("pop")
+            open_count -= 1
+
+    blocks = []
+    stack = []
+    for kind in order:
+        if kind == "push":
+            y_add = rng.randint(1, 16)
+            stack.append(y_add)
+            blocks.append(BLOCK.format(z_div=1, x_add=rng.randint(10, 16), y_add=y_add))
+        else:
+            delta = rng.randint(-8, 8)
+            x_add = delta - stack.pop()
+            y_add = rng.randint(1, 16)
+            blocks.append(BLOCK.format(z_div=26, x_add=x_add, y_add=y_add))
+    return os.linesep.join(blocks) + os.linesep
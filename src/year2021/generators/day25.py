@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+
+import os
+import random
+
+from year2021.generators import scaled_side
+
+
+def generate(scale: float = 1.0, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    height = scaled_side(137, scale, minimum=2)
+    width = scaled_side(139, scale, minimum=2)
+    # The real herds fill a little over half of the floor. Random herds at
+    # that density jam, so the cucumbers eventually stop moving.
+    rows = [
+        "".join(rng.choices(">v.", weights=[3, 3, 4], k=width)) for _ in range(height)
+    ]
+    return os.linesep.join(rows) + os.linesep
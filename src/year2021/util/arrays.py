@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+# NumPy parsing of raw input bytes.
+#
+# parse_ints() turns whitespace-separated unsigned integers into an int64
+# array without going through str or int objects: the bytes are viewed as a
+# uint8 array in place, token boundaries come from where digits start and
+# stop, and values are built with Horner's rule one digit column at a time,
+# so the Python-level loop runs once per digit of the widest number.
+#
+# iter_whole_chunks() regroups inputs.iter_chunks() so no token is cut in
+# half by a chunk boundary; iter_int_chunks() parses each of those chunks.
+
+from __future__ import annotations
+import typing as T
+
+import numpy as np
+
+
+WHITESPACE = np.frombuffer(b" \t\r\n", dtype=np.uint8)
+
+
+def token_spans(is_token: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Start offsets and lengths of the runs of True in `is_token`.
+    edges = np.flatnonzero(np.diff(is_token, prepend=False, append=False))
+    starts = edges[0::2]
+    return starts, edges[1::2] - starts
+
+
+def parse_ints(data: bytes | bytearray | memoryview) -> np.ndarray:
+    raw = np.frombuffer(data, dtype=np.uint8)
+    # Wraps around below "0", so anything that isn't a digit is >= 10.
+    digits = raw - np.uint8(ord("0"))
+    is_digit = digits < 10
+    if not np.all(is_digit | np.isin(raw, WHITESPACE)):
+        raise Exception("Invalid input: expected unsigned integers")
+
+    starts, lengths = token_spans(is_digit)
+    values = np.zeros(len(starts), dtype=np.int64)
+    for offset in range(lengths.max(initial=0)):
+        active = np.flatnonzero(lengths > offset)
+        values[active] = values[active] * 10 + digits[starts[active] + offset]
+    return values
+
+
+def iter_whole_chunks(chunks: T.Iterable[bytes]) -> T.Iterator[bytes]:
+    partial = b""
+    for chunk in chunks:
+        # Everything after the last separator may continue in the next chunk.
+        cut = max(chunk.rfind(separator) for separator in b" \t\r\n") + 1
+        if cut == 0:
+            partial += chunk
+            continue
+        yield partial + chunk[:cut]
+        partial = chunk[cut:]
+    if partial:
+        yield partial
+
+
+def iter_int_chunks(chunks: T.Iterable[bytes]) -> T.Iterator[np.ndarray]:
+    return map(parse_ints, iter_whole_chunks(chunks))
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+
+# Puzzle input loading.
+#
+# Inputs live in <repository>/inputs/yearYYYY/DDD.txt and are found relative
+# to this file, not the working directory. AOC_INPUTS_DIR overrides the
+# inputs directory. Every solution's main() takes an optional `source`, a
+# path or an open stream, that replaces its default input.
+#
+# Files are memory-mapped rather than read, so the only full copy made is
+# the one a solution asks for (e.g. decoding to text), and lines() walks the
+# mapping without copying at all. Solutions that can work one line at a time
+# take iter_lines() instead of the whole text when main() gets stream=True;
+# those that work on raw bytes take iter_chunks().
+
+from __future__ import annotations
+import io
+import mmap
+import os
+import typing as T
+
+
+Source = str | os.PathLike | T.IO
+
+REPOSITORY_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), *[os.pardir] * 3)
+)
+INPUTS_DIR = os.environ.get("AOC_INPUTS_DIR", os.path.join(REPOSITORY_DIR, "inputs"))
+
+CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def input_path(year: int, day: int) -> str:
+    return os.path.join(INPUTS_DIR, f"year{year}", f"{day:03}.txt")
+
+
+class InputData:
+    # Bytes of an input, backed by a read-only mmap for files or by a bytes
+    # object for streams. `view` and the memoryviews from lines() are only
+    # valid until close(); copy them (bytes(line)) to keep them longer.
+
+    def __init__(self, buffer: mmap.mmap | bytes):
+        self.buffer = buffer
+        self.view = memoryview(buffer)
+
+    @classmethod
+    def from_file(cls, filepath: str | os.PathLike) -> InputData:
+        with open(filepath, "rb") as fp:
+            return cls.from_fileno(fp.fileno())
+
+    @classmethod
+    def from_fileno(cls, fileno: int) -> InputData:
+        if os.fstat(fileno).st_size == 0:
+            # Zero-length files can't be mapped.
+            return cls(b"")
+        return cls(mmap.mmap(fileno, 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def from_stream(cls, stream: T.IO) -> InputData:
+        if isinstance(stream, io.TextIOBase):
+            return cls(stream.read().encode())
+        try:
+            fileno = stream.fileno()
+            if stream.seekable() and stream.tell() == 0:
+                return cls.from_fileno(fileno)
+        except (OSError, io.UnsupportedOperation):
+            # Pipes, sockets and in-memory streams.
+            pass
+        return cls(stream.read())
+
+    def lines(self) -> T.Iterator[memoryview]:
+        # Lines without their "\n" or "\r\n" terminator.
+        start = 0
+        size = len(self.view)
+        while start < size:
+            end = self.buffer.find(b"\n", start)
+            if end < 0:
+                end = size
+            stop = end - 1 if end > start and self.view[end - 1] == ord("\r") else end
+            yield self.view[start:stop]
+            start = end + 1
+
+    def text(self) -> str:
+        return str(self.view, "utf-8")
+
+    def close(self):
+        self.view.release()
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def __enter__(self) -> InputData:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_input(year: int, day: int, source: Source | None = None) -> InputData:
+    if source is None:
+        return InputData.from_file(input_path(year, day))
+    if isinstance(source, (str, os.PathLike)):
+        return InputData.from_file(source)
+    return InputData.from_stream(source)
+
+
+def as_lines(content: str | T.Iterable[str]) -> T.Iterable[str]:
+    # Text or any iterable of lines (a file, a pipe, iter_lines()) as lines.
+    # Text is split into a list up front; parse_input() keeps the result of
+    # parsing it as a list too, so parsing is timed on its own. Any other
+    # iterable is passed through as is and parsed lazily, one line at a time.
+    if isinstance(content, str):
+        return content.splitlines()
+    return content
+
+
+def iter_lines(year: int, day: int, source: Source | None = None) -> T.Iterator[str]:
+    # Lines as text without terminators, one at a time. Nothing but the
+    # current line is held, so pipes and files of any size stream through.
+    if source is None or isinstance(source, (str, os.PathLike)):
+        with open_input(year, day, source) as data:
+            for view in data.lines():
+                line = str(view, "utf-8")
+                view.release()
+                yield line
+        return
+    for line in source:
+        if isinstance(line, bytes):
+            line = line.decode()
+        yield line.rstrip("\r\n")
+
+
+def iter_chunks(
+    year: int, day: int, source: Source | None = None, size: int = CHUNK_SIZE
+) -> T.Iterator[bytes]:
+    # Raw bytes, at most `size` at a time. Chunks end wherever `size` falls,
+    # even mid-line; callers carry partial records over to the next chunk.
+    if source is None or isinstance(source, (str, os.PathLike)):
+        with open_input(year, day, source) as data:
+            for start in range(0, len(data.view), size):
+                with data.view[start : start + size] as view:
+                    yield bytes(view)
+        return
+    if isinstance(source, io.TextIOBase):
+        source = source.buffer
+    while chunk := source.read(size):
+        yield chunk
+
+
+def read_input(year: int, day: int, source: Source | None = None) -> str:
+    if isinstance(source, io.TextIOBase):
+        return source.read()
+    with open_input(year, day, source) as data:
+        return data.text()
@@ -5,14 +5,12 @@
 # https://www.reddit.com/r/adventofcode/comments/rfday0/2021_day_13_part_2_need_letters/
 # https://github.com/mstksg/advent-of-code-ocr/blob/main/src/Advent/OCR/LetterMap.hs
 
-import os
-
 
 V2 = tuple[int, int]
 
 
 def _to_matrix(embed: str, pixel: str = "#") -> list[list[str]]:
-    matrix = list(map(list, filter(None, map(str.strip, embed.split(os.linesep)))))
+    matrix = list(map(list, filter(None, map(str.strip, embed.splitlines()))))
     if not matrix:
         raise Exception("No matrix generated. Empty embed?")
     if len(set(map(len, matrix))) != 1:
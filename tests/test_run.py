@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+
+import csv
+import errno
+import importlib
+import importlib.util
+import io
+import math
+import os
+import pstats
+import sys
+import textwrap
+import xml.etree.ElementTree as ET
+
+import pytest
+
+RUN_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "run.py")
+spec = importlib.util.spec_from_file_location("run", RUN_PATH)
+run = importlib.util.module_from_spec(spec)
+# Registered like an imported module, so its namedtuples pickle across the
+# processes of run_modules_isolated().
+sys.modules["run"] = run
+spec.loader.exec_module(run)
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    # A stand-in for year2021: a day that imports a shared util helper.
+    root = tmp_path / "yearcache"
+    (root / "util").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "util" / "__init__.py").write_text("")
+    (root / "util" / "helper.py").write_text("def double(n):\n    return n * 2\n")
+    (root / "day01a.py").write_text(
+        textwrap.dedent(
+            """
+            from .util import helper
+
+
+            def main(runner=False, source=None):
+                return helper.double(1)
+            """
+        )
+    )
+    input_file = tmp_path / "001.txt"
+    input_file.write_text("1\n2\n3\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(run, "input_path", lambda year, day: str(input_file))
+    importlib.invalidate_caches()
+    yield root, input_file
+    # find_spec() imports the parent packages, which would keep this
+    # tmp_path on their __path__ for the next test.
+    for name in [name for name in sys.modules if name.startswith("yearcache")]:
+        del sys.modules[name]
+
+
+def test_module_source_files_follow_util_imports():
+    package_dir = os.path.dirname(importlib.util.find_spec("year2021").origin)
+    sources = run.module_source_files("year2021.day01a")
+    actual = {os.path.relpath(path, package_dir) for path in sources}
+    assert "day01a.py" in actual
+    assert os.path.join("util", "inputs.py") in actual
+
+
+def test_cache_key_changes_with_helper(package):
+    root, _ = package
+    before = run.cache_key((2021, 1, "a"), "yearcache.day01a")
+    (root / "util" / "helper.py").write_text("def double(n):\n    return n + n\n")
+    after = run.cache_key((2021, 1, "a"), "yearcache.day01a")
+    assert before is not None
+    assert before != after
+
+
+def test_cache_key_changes_with_input(package):
+    _, input_file = package
+    before = run.cache_key((2021, 1, "a"), "yearcache.day01a")
+    input_file.write_text("1\n2\n4\n")
+    after = run.cache_key((2021, 1, "a"), "yearcache.day01a")
+    assert before is not None
+    assert before != after
+
+
+def test_cache_key_without_input(package):
+    _, input_file = package
+    input_file.unlink()
+    actual = run.cache_key((2021, 1, "a"), "yearcache.day01a")
+    assert actual is None
+
+
+@pytest.fixture
+def cached_package(tmp_path, monkeypatch):
+    # A day whose solve() goes through a memoised util helper, counting the
+    # calls that miss the cache.
+    root = tmp_path / "yearbench"
+    (root / "util").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "util" / "__init__.py").write_text("")
+    (root / "util" / "helper.py").write_text(
+        textwrap.dedent(
+            """
+            import functools
+
+            MISSES = []
+
+
+            @functools.cache
+            def slow_double(n):
+                MISSES.append(n)
+                return n * 2
+            """
+        )
+    )
+    (root / "day01a.py").write_text(
+        textwrap.dedent(
+            """
+            from .util import helper
+
+            CALLS = []
+
+
+            def parse_input(content):
+                return int(content)
+
+
+            def solve(n):
+                CALLS.append(n)
+                return helper.slow_double(n)
+
+
+            def main(runner=False, source=None):
+                content = source.read() if source else "21"
+                return solve(parse_input(content))
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importlib.invalidate_caches()
+    yield "yearbench.day01a"
+    for name in [name for name in sys.modules if name.startswith("yearbench")]:
+        del sys.modules[name]
+
+
+def test_summarize_timings():
+    actual = run.summarize_timings([4.0, 1.0, 3.0, 2.0])
+    assert 1.0 == actual["min"]
+    assert 2.5 == actual["median"]
+    assert 2.5 == actual["mean"]
+    assert math.isclose(actual["stdev"], math.sqrt(5 / 3))
+    assert math.isclose(actual["p95"], 3.85)
+
+
+def test_summarize_timings_single():
+    expected = {"min": 2.0, "median": 2.0, "mean": 2.0, "stdev": 0.0, "p95": 2.0}
+    actual = run.summarize_timings([2.0])
+    assert expected == actual
+
+
+def test_bench_module_clears_caches(cached_package):
+    result = run.bench_module(cached_package, warmup=2, repeat=5, min_time=0)
+    mod = sys.modules[cached_package]
+    assert 42 == result.response
+    assert len(mod.CALLS) == len(mod.helper.MISSES)
+
+
+def test_measure_solve_clears_caches(cached_package):
+    mod = importlib.import_module(cached_package)
+    run.measure_solve(mod, "21", rounds=3)
+    assert len(mod.CALLS) == len(mod.helper.MISSES)
+
+
+def test_solve_with_content_skips_default_input(tmp_path, monkeypatch):
+    inputs = importlib.import_module("year2021.util.inputs")
+    monkeypatch.setattr(inputs, "INPUTS_DIR", str(tmp_path / "missing"))
+    mod = importlib.import_module("year2021.day01a")
+    assert 2 == run.solve_with_content(mod, "199\n200\n208\n")
+
+
+def test_can_stream_without_importing(cached_package):
+    assert run.can_stream("year2021.day01a")
+    assert not run.can_stream("year2021.day01b")
+    assert not run.can_stream(cached_package)
+    assert cached_package not in sys.modules
+
+
+def record(module, median, scale=None, seed=None, revision="abc", dirty=False, **kw):
+    return {
+        "module": module,
+        "mode": "run",
+        "median": median,
+        "input_sha256": "0" * 64,
+        "scale": scale,
+        "seed": seed,
+        "revision": revision,
+        "dirty": dirty,
+        **kw,
+    }
+
+
+def test_compare_to_baseline_clean_records_only():
+    history = [
+        record("year2021.day01a", 1.0),
+        record("year2021.day01a", 0.1, dirty=True),
+        record("year2021.day01a", 0.1, revision="def"),
+    ]
+    records = [record("year2021.day01a", 2.0, revision="def")]
+    rows, regressions = run.compare_to_baseline(records, history, "abc", 10.0)
+    expected = [["year2021.day01a", 1.0, 2.0, 100.0, "SLOWER"]]
+    assert expected == rows
+    assert ["year2021.day01a"] == regressions
+
+
+def test_compare_to_baseline_same_scale_and_seed():
+    history = [
+        record("year2021.day01a", 1.0, scale=2.0, seed=0),
+        record("year2021.day01a", 5.0, scale=2.0, seed=1),
+        record("year2021.day01a", 5.0),
+    ]
+    records = [
+        record("year2021.day01a", 1.05, scale=2.0, seed=0),
+        record("year2021.day01a", 1.0, scale=4.0, seed=0),
+    ]
+    rows, regressions = run.compare_to_baseline(records, history, "abc", 10.0)
+    assert "ok" == rows[0][-1]
+    assert 1.0 == rows[0][1]
+    assert "MISSING" == rows[1][-1]
+    assert [] == regressions
+
+
+def test_compare_to_baseline_same_input_and_reading():
+    history = [
+        record("year2021.day01a", 1.0),
+        record("year2021.day01a", 5.0, input_sha256="1" * 64),
+        record("year2021.day01a", 5.0, stream=True),
+    ]
+    records = [
+        record("year2021.day01a", 1.0),
+        record("year2021.day01a", 1.0, input_sha256="2" * 64),
+        record("year2021.day01a", 1.0, stream=True),
+    ]
+    rows, _ = run.compare_to_baseline(records, history, "abc", 10.0)
+    assert [1.0, None, 5.0] == [row[1] for row in rows]
+
+
+@pytest.mark.parametrize(
+    "model, sizes",
+    [
+        ("n", [1000 * 2**i for i in range(8)]),
+        ("n^2", [1000 * 2**i for i in range(8)]),
+        ("n^3", [1000 * 2**i for i in range(8)]),
+        ("exp", list(range(10, 50, 5))),
+    ],
+)
+def test_fit_complexity(model, sizes):
+    g = {**run.COMPLEXITY_MODELS, "exp": lambda n: math.exp(0.5 * n)}[model]
+    values = [1e-9 * g(n) + 1e-4 for n in sizes]
+    fits = run.fit_complexity(sizes, values)
+    assert model == fits[0].model
+
+
+def test_fit_complexity_constant():
+    sizes = [1000 * 2**i for i in range(8)]
+    values = [1e-4 * (1 + 0.01 * (-1) ** i) for i in range(len(sizes))]
+    fits = run.fit_complexity(sizes, values)
+    assert "1" == fits[0].model
+    assert math.isclose(fits[0].predict(10**12), 1e-4, rel_tol=0.01)
+
+
+def test_print_complexity_report_constant(capsys):
+    samples = [[scale, 1000 * scale, 1e-3 * scale, 200] for scale in [1, 2, 4, 8]]
+    sizes = [n for _, n, _, _ in samples]
+    report = run.ComplexityReport(
+        samples,
+        run.fit_complexity(sizes, [seconds for _, _, seconds, _ in samples]),
+        run.fit_complexity(sizes, [peak for _, _, _, peak in samples]),
+    )
+    run.print_complexity_report("year2021.day01a", report, 1.0, 1e-6)
+    rows = {
+        line.split()[0]: line.split()
+        for line in capsys.readouterr().out.splitlines()
+        if line.startswith(("time", "memory"))
+    }
+    assert ["time", "n", "(0)", "1000001"] == rows["time"][:4]
+    assert ["memory", "1", "(0)"] == rows["memory"][:3]
+    # No crossover or scale, the other fits come right after the best one.
+    assert not rows["memory"][3].isdigit()
+
+
+@pytest.mark.parametrize("model", ["n", "n^2", "n^3"])
+def test_find_crossover(model):
+    g = run.COMPLEXITY_MODELS[model]
+    sizes = [1000 * 2**i for i in range(8)]
+    fits = run.fit_complexity(sizes, [1e-9 * g(n) for n in sizes])
+    budget = 1e-9 * g(10**6)
+    actual = run.find_crossover(fits[0].predict, budget, sizes[-1])
+    assert math.isclose(actual, 10**6, rel_tol=1e-3)
+
+
+def test_find_crossover_exact():
+    assert 11 == run.find_crossover(lambda n: n**2, 100, 1)
+    assert 1 == run.find_crossover(lambda n: n**2, 0, 1)
+    assert run.find_crossover(lambda n: 0, 1, 1) is None
+
+
+@pytest.mark.parametrize(
+    "error, limited, expected",
+    [
+        (MemoryError(), False, True),
+        (OSError(errno.ENOMEM, "Cannot allocate memory"), True, True),
+        (OSError(errno.ENOENT, "No such file or directory"), True, False),
+        (ImportError("failed to map segment from shared object"), True, True),
+        (ImportError("No module named 'numpy'"), False, False),
+        (ValueError("Invalid state."), True, False),
+    ],
+)
+def test_is_out_of_memory(error, limited, expected):
+    assert expected == run.is_out_of_memory(error, limited)
+
+
+def test_describe_error():
+    try:
+        try:
+            raise ImportError("lib.so: failed to map segment from shared object")
+        except ImportError as e:
+            raise ImportError("\n\nIMPORTANT: PLEASE READ THIS\n\nmore advice") from e
+    except ImportError as e:
+        error = e
+    expected = "ImportError: lib.so: failed to map segment from shared object"
+    assert expected == run.describe_error(error)
+    assert "MemoryError" == run.describe_error(MemoryError())
+    assert "Exception: first line" == run.describe_error(Exception("first line\nmore"))
+
+
+class SyntheticProfile:
+    # Enough of cProfile.Profile for pstats.Stats(): main() spends 1s in
+    # itself and calls a() (4s) and b(), which spends 3s in itself and calls
+    # a() (2s) and sorted() (0.5s).
+    MAIN = ("day.py", 10, "main")
+    A = ("day.py", 20, "a")
+    B = ("day.py", 30, "b")
+    SORTED = ("~", 0, "<built-in method builtins.sorted>")
+
+    def create_stats(self):
+        self.stats = {
+            self.MAIN: (1, 1, 1.0, 10.5, {}),
+            self.A: (2, 2, 6.0, 6.0, {self.MAIN: (1, 1, 4, 4), self.B: (1, 1, 2, 2)}),
+            self.B: (1, 1, 3.0, 5.5, {self.MAIN: (1, 1, 3, 5.5)}),
+            self.SORTED: (1, 1, 0.5, 0.5, {self.B: (1, 1, 0.5, 0.5)}),
+        }
+
+
+def test_folded_stacks():
+    stats = pstats.Stats(SyntheticProfile())
+    expected = {
+        "day.py:main:10": 1.0,
+        "day.py:main:10;day.py:a:20": 4.0,
+        "day.py:main:10;day.py:b:30": 3.0,
+        "day.py:main:10;day.py:b:30;day.py:a:20": 2.0,
+        "day.py:main:10;day.py:b:30;built-in method builtins.sorted": 0.5,
+    }
+    actual = run.folded_stacks(stats)
+    assert expected.keys() == actual.keys()
+    for stack, seconds in expected.items():
+        assert math.isclose(seconds, actual[stack])
+
+
+def test_folded_stacks_min_time():
+    stats = pstats.Stats(SyntheticProfile())
+    actual = run.folded_stacks(stats, min_time=1.0)
+    assert "day.py:main:10;day.py:b:30;built-in method builtins.sorted" not in actual
+    assert "day.py:main:10;day.py:b:30;day.py:a:20" in actual
+
+
+def test_write_folded(tmp_path):
+    folded = {"main;b": 0.25, "main": 1.5, "main;a": 1e-9}
+    filepath = tmp_path / "day.folded"
+    run.write_folded(str(filepath), folded, prefix="year2021.day01a")
+    expected = ["year2021.day01a;main 1500000", "year2021.day01a;main;b 250000"]
+    actual = filepath.read_text().splitlines()
+    assert expected == actual
+
+
+@pytest.fixture
+def failing_package(tmp_path, monkeypatch):
+    # Days that run forever, spin the CPU, or allocate more than they may.
+    root = tmp_path / "yearfail"
+    root.mkdir()
+    (root / "__init__.py").write_text("")
+    bodies = {
+        "day01a": "time.sleep(60)",
+        "day02a": "while True: pass",
+        "day03a": "bytearray(1 << 30)",
+        "day04a": "mmap.mmap(-1, 1 << 30)",
+        "day05a": "return 42",
+    }
+    for name, body in bodies.items():
+        (root / f"{name}.py").write_text(
+            "import mmap\n"
+            "import time\n"
+            "\n"
+            "\n"
+            "def main(runner=False, source=None):\n"
+            f"    {body}\n"
+        )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importlib.invalidate_caches()
+    yield {(2021, int(name[3:5]), "a"): f"yearfail.{name}" for name in bodies}
+    for name in [name for name in sys.modules if name.startswith("yearfail")]:
+        del sys.modules[name]
+
+
+def run_isolated(target_modules: dict, limits) -> dict:
+    completed = run.run_modules_isolated(target_modules, 2, limits=limits)
+    return {module: status for module, status, _ in completed}
+
+
+def test_run_modules_isolated_timeout(failing_package):
+    target_modules = {k: failing_package[k] for k in [(2021, 1, "a"), (2021, 5, "a")]}
+    expected = {(2021, 1, "a"): "TIMEOUT", (2021, 5, "a"): "OK"}
+    actual = run_isolated(target_modules, run.Limits(1, None, None))
+    assert expected == actual
+
+
+def test_run_modules_isolated_cpu_limit(failing_package):
+    target_modules = {(2021, 2, "a"): failing_package[(2021, 2, "a")]}
+    expected = {(2021, 2, "a"): "TIMEOUT"}
+    actual = run_isolated(target_modules, run.Limits(None, None, 1))
+    assert expected == actual
+
+
+def test_run_modules_isolated_oom(failing_package):
+    target_modules = {
+        k: failing_package[k] for k in [(2021, 3, "a"), (2021, 4, "a"), (2021, 5, "a")]
+    }
+    completed = run.run_modules_isolated(
+        target_modules, 2, limits=run.Limits(None, 256, None)
+    )
+    actual = {module: (status, result) for module, status, result in completed}
+    assert ("OOM", "MemoryError") == actual[(2021, 3, "a")]
+    status, message = actual[(2021, 4, "a")]
+    assert "OOM" == status
+    assert message.startswith("OSError: [Errno 12]")
+    status, result = actual[(2021, 5, "a")]
+    assert "OK" == status
+    assert 42 == result.response
+
+
+ENVIRONMENT = {"timestamp": "2026-10-18T12:00:00", "revision": "abc"}
+
+OUTPUT_RECORDS = [
+    {
+        "module": "year2021.day01a",
+        "response": "1688",
+        "median": 0.25,
+        "phases": {"read": 0.125, "parse": 0.5},
+        "timings": [0.25, 0.5],
+        "status": "OK",
+    },
+    {"module": "year2021.day01b", "response": "1728", "status": "CACHED"},
+    {"module": "year2021.day02a", "status": "OOM", "error": "MemoryError"},
+]
+
+
+def test_flatten_record():
+    expected = {
+        "module": "year2021.day01a",
+        "response": "1688",
+        "median": 0.25,
+        "phases_read": 0.125,
+        "phases_parse": 0.5,
+        "timings": "0.25;0.5",
+        "status": "OK",
+    }
+    actual = run.flatten_record(OUTPUT_RECORDS[0])
+    assert expected == actual
+
+
+def test_format_csv():
+    content = run.format_csv(ENVIRONMENT, OUTPUT_RECORDS)
+    rows = list(csv.DictReader(io.StringIO(content)))
+    assert 3 == len(rows)
+    assert {"abc"} == {row["revision"] for row in rows}
+    assert "0.25;0.5" == rows[0]["timings"]
+    assert "0.125" == rows[0]["phases_read"]
+    assert "" == rows[1]["phases_read"]
+    assert ["OK", "CACHED", "OOM"] == [row["status"] for row in rows]
+    assert "MemoryError" == rows[2]["error"]
+
+
+def test_format_junit():
+    suite = ET.fromstring(run.format_junit(ENVIRONMENT, OUTPUT_RECORDS))
+    assert "year2021" == suite.get("name")
+    assert "3" == suite.get("tests")
+    assert "1" == suite.get("failures")
+    assert "1" == suite.get("skipped")
+    properties = {p.get("name"): p.get("value") for p in suite.iter("property")}
+    assert ENVIRONMENT == properties
+
+    ok, cached, failed = suite.findall("testcase")
+    assert "0.750000" == ok.get("time")
+    assert "1688" == ok.find("system-out").text
+    assert cached.find("skipped") is not None
+    assert "MemoryError" == failed.find("failure").get("message")
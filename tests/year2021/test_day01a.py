@@ -20,3 +20,24 @@ def test_example():
     expected = 7
     actual = day.count_depth_increases(case)
     assert expected == actual
+
+
+def test_example_stream():
+    case = """
+199
+200
+208
+210
+200
+207
+240
+269
+260
+263
+"""
+    lines = iter(case.splitlines())
+    data = day.parse_input(lines)
+    assert not isinstance(data, list)
+    expected = 7
+    actual = day.count_depth_increases(data)
+    assert expected == actual
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import pytest
+
+import year2021.day01b_numpy as day
+from year2021.util import arrays
+
+
+CASE = """
+199
+200
+208
+210
+200
+207
+240
+269
+260
+263
+"""
+
+
+def test_example():
+    case = day.parse_input(CASE)
+    expected = 5
+    actual = day.solve(case)
+    assert expected == actual
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 64])
+def test_example_chunked(chunk_size):
+    content = CASE.replace("\n", "\r\n").encode()
+    chunks = [
+        content[index : index + chunk_size]
+        for index in range(0, len(content), chunk_size)
+    ]
+    expected = 5
+    actual = day.count_window_increases_chunked(arrays.iter_int_chunks(chunks))
+    assert expected == actual
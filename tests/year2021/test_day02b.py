@@ -16,3 +16,20 @@ forward 2
     expected = (15, 60)
     actual = day.execute_plan(case)
     assert expected == actual
+
+
+def test_example_stream():
+    case = """
+forward 5
+down 5
+forward 8
+up 3
+down 8
+forward 2
+"""
+    lines = iter(case.splitlines())
+    data = day.parse_input(lines)
+    assert not isinstance(data, list)
+    expected = (15, 60)
+    actual = day.execute_plan(data)
+    assert expected == actual
@@ -22,3 +22,25 @@ def test_example():
     expected = 230
     actual = day.solve(case)
     assert expected == actual
+
+
+def test_example_stream():
+    case = """
+00100
+11110
+10110
+10111
+10101
+01111
+00111
+11100
+10000
+11001
+00010
+01010
+"""
+    lines = iter(case.splitlines())
+    data = day.parse_input(lines)
+    expected = 230
+    actual = day.solve(data)
+    assert expected == actual
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import pytest
+
+import year2021.day03b_numpy as day
+
+
+CASE = """
+00100
+11110
+10110
+10111
+10101
+01111
+00111
+11100
+10000
+11001
+00010
+01010
+"""
+
+
+def test_example():
+    case = day.parse_input(CASE)
+    expected = 230
+    actual = day.solve(case)
+    assert expected == actual
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 7, 64])
+def test_example_chunked(chunk_size):
+    content = CASE.encode()
+    chunks = [
+        content[index : index + chunk_size]
+        for index in range(0, len(content), chunk_size)
+    ]
+    data = day.parse_chunks(chunks)
+    expected = 230
+    actual = day.solve(data)
+    assert expected == actual
+
+
+def test_wide_rows():
+    case = "\n".join(["1" * 64, "0" * 63 + "1", "1" + "0" * 63])
+    rows, width = day.parse_input(case)
+    assert width == 64
+    assert day.bit_criteria(rows, width, day.Commonality.MOST) == 2**64 - 1
+    assert day.bit_criteria(rows, width, day.Commonality.LEAST) == 1
+
+
+def test_uneven_rows():
+    with pytest.raises(Exception):
+        day.parse_input("0101\n011\n")
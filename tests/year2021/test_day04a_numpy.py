@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+import year2021.day04a_numpy as day
+
+
+CASE = """
+7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,26,1
+
+22 13 17 11  0
+ 8  2 23  4 24
+21  9 14 16  7
+ 6 10  3 18  5
+ 1 12 20 15 19
+
+ 3 15  0  2 22
+ 9 18 13 17  5
+19  8  7 25 23
+20 11 10 24  4
+14 21 16 12  6
+
+14 21 17 24  4
+10 16 15  9 19
+18  8 23 26 20
+22 11 13  6  5
+ 2  0 12  3  7
+"""
+
+
+def test_example():
+    case = day.parse_input(CASE)
+    expected = 4512
+    actual = day.solve(*case)
+    assert expected == actual
+
+
+def test_no_winner():
+    boards, numbers = day.parse_input(CASE)
+    assert day.solve(boards, numbers[:4]) is None
+
+
+def test_win_turns():
+    boards, numbers = day.parse_input(CASE)
+    ranks = day.call_ranks(boards, numbers)
+    expected = [13, 14, 11]
+    actual = day.win_turns(ranks).tolist()
+    assert expected == actual
+
+
+def test_call_ranks_large_numbers():
+    boards = day.np.array([[[10**9, 5], [7, 10**12]]])
+    numbers = day.np.array([7, 10**12, 7, 3])
+    expected = [[[4, 4], [0, 1]]]
+    actual = day.call_ranks(boards, numbers).tolist()
+    assert expected == actual
+
+
+def test_call_ranks_no_calls():
+    boards, numbers = day.parse_input(CASE)
+    ranks = day.call_ranks(boards, numbers[:0])
+    assert (ranks == 0).all()
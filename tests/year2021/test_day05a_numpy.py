@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+import year2021.day05a_numpy as day
+
+
+CASE = """
+0,9 -> 5,9
+8,0 -> 0,8
+9,4 -> 3,4
+2,2 -> 2,1
+7,0 -> 7,4
+6,4 -> 2,0
+0,9 -> 2,9
+3,4 -> 1,4
+0,0 -> 8,8
+5,5 -> 8,2
+"""
+
+
+def test_example():
+    case = day.parse_input(CASE)
+    expected = 5
+    actual = day.solve(case)
+    assert expected == actual
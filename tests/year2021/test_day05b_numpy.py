@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+import year2021.day05b_numpy as day
+
+
+CASE = """
+0,9 -> 5,9
+8,0 -> 0,8
+9,4 -> 3,4
+2,2 -> 2,1
+7,0 -> 7,4
+6,4 -> 2,0
+0,9 -> 2,9
+3,4 -> 1,4
+0,0 -> 8,8
+5,5 -> 8,2
+"""
+
+
+def test_example():
+    case = day.parse_input(CASE)
+    expected = 12
+    actual = day.solve(case)
+    assert expected == actual
+
+
+def test_dense_and_sparse_agree():
+    case = day.parse_input(CASE)
+    assert day.is_dense(case)
+    counts = day.count_dense(case)
+    cells, sparse_counts = day.count_sparse(case)
+    expected = counts.ravel()[cells].tolist()
+    actual = sparse_counts.tolist()
+    assert expected == actual
+    assert counts.sum() == sparse_counts.sum()
+
+
+def test_huge_coordinates():
+    case = """
+0,0 -> 0,5
+0,3 -> 0,9
+1000000000,1000000000 -> 1000000000,999999990
+1000000000,999999995 -> 999999995,999999995
+"""
+    case = day.parse_input(case)
+    assert not day.is_dense(case)
+    # Three cells where the first two overlap, one where the last two cross.
+    expected = 4
+    actual = day.solve(case)
+    assert expected == actual
+
+
+def test_long_segments_are_split():
+    case = day.parse_input("0,0 -> 0,9\n0,5 -> 9,5\n")
+    batches = list(day.rasterise(case, batch_points=3))
+    assert [3] * 6 + [2] == list(map(len, batches))
+    expected = day.np.unique(day.np.concatenate(list(day.rasterise(case))))
+    actual = day.np.unique(day.np.concatenate(batches))
+    assert expected.tolist() == actual.tolist()
+
+
+def test_sparse_batches_merge(monkeypatch):
+    case = day.parse_input(CASE)
+    counts = day.count_dense(case).ravel()
+    monkeypatch.setattr(day, "BATCH_POINTS", 4)
+    cells, sparse_counts = day.count_sparse(case)
+    assert day.np.flatnonzero(counts).tolist() == cells.tolist()
+    assert counts[cells].tolist() == sparse_counts.tolist()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pytest
+
+import year2021.day06b as reference
+import year2021.day06b_matrix as day
+
+
+CASE = """
+3,4,3,1,2
+"""
+
+
+@pytest.mark.parametrize("days, expected", [(18, 26), (80, 5934), (256, 26984457539)])
+def test_example(days, expected):
+    data = day.parse_input(CASE)
+    actual = day.solve(data, days)
+    assert expected == actual
+
+
+@pytest.mark.parametrize("days", [0, 1, 6, 7, 8, 9, 500])
+def test_matches_simulation(days):
+    data = day.parse_input(CASE)
+    expected = reference.solve(data, days)
+    assert expected == day.solve(data, days)
+    assert expected % 1_000_000_007 == day.solve(data, days, 1_000_000_007)
+
+
+def test_forecast_modulo_prime():
+    data = day.parse_input(CASE)
+    modulus = 998_244_353
+    counts = day.count_timers(data)
+    later = day.advance(day.advance(counts, 10**18, modulus), 10**9, modulus)
+    expected = {
+        10**9: day.solve(data, 10**9, modulus),
+        10**18 + 10**9: sum(later) % modulus,
+    }
+    actual = day.forecast(data, expected, modulus)
+    assert expected == actual
+
+
+def test_exact_limit():
+    data = day.parse_input(CASE)
+    with pytest.raises(Exception):
+        day.solve(data, 10**18)
+
+
+def test_forecast_batch():
+    populations = [day.parse_input(CASE), [0], [8, 8, 1], []]
+    counts = np.array([day.count_timers(state) for state in populations])
+    horizons = [18, 80, 256]
+    expected = [[day.solve(state, days) for days in horizons] for state in populations]
+    actual = day.forecast_batch(counts, horizons)
+    assert expected == actual.tolist()
+
+
+def test_forecast_batch_modulo_prime():
+    counts = np.array([day.count_timers(day.parse_input(CASE))] * 3)
+    modulus = 998_244_353
+    expected = [day.solve(day.parse_input(CASE), 10**18, modulus)] * 3
+    actual = day.forecast_batch(counts, [10**18], modulus)
+    assert actual.dtype == np.int64
+    assert expected == actual[:, 0].tolist()
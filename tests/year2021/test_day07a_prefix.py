@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+import pytest
+
+import year2021.day07a_prefix as day
+
+
+CASE = "16,1,2,0,4,2,7,1,2,14"
+
+
+def test_example():
+    data = day.parse_input(CASE)
+    expected = 37
+    actual = day.solve(data)
+    assert expected == actual
+
+
+@pytest.mark.parametrize("pos,cost", [(2, 37), (1, 41), (3, 39), (10, 71)])
+def test_example_cost(pos, cost):
+    data = day.parse_input(CASE)
+    expected = cost
+    actual = day.linear_cost(data, pos)
+    assert expected == actual
+
+
+def test_cheapest():
+    data = day.parse_input(CASE)
+    expected = (2, 37)
+    actual = day.cheapest(lambda candidate: day.linear_cost(data, candidate), 0, 16)
+    assert expected == actual
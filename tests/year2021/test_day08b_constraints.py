@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import pytest
+
+import year2021.day08b_constraints as day
+
+
+# Hex digits on a 14-segment display: a-f as on seven segments, g and h the
+# left and right halves of the middle bar, then the diagonals and the
+# centre verticals.
+FOURTEEN_SEGMENT_HEX = {
+    "0": "abcdefkl",
+    "1": "bck",
+    "2": "abdegh",
+    "3": "abcdh",
+    "4": "bcfgh",
+    "5": "acdfgh",
+    "6": "acdefgh",
+    "7": "abc",
+    "8": "abcdefgh",
+    "9": "abcdfgh",
+    "A": "abcefgh",
+    "B": "abcdhjm",
+    "C": "adef",
+    "D": "abcdjm",
+    "E": "adefg",
+    "F": "aefg",
+}
+
+
+def test_translation():
+    case = """
+acedgfb cdfbe gcdfa fbcad dab cefabd cdfgeb eafb cagedb ab | cdfeb fcadb cdfeb cdbaf
+"""
+    data = day.parse_input(case)
+    expected = dict(zip("deafgbc", "abcdefg"))
+    actual = day.SEVEN_SEGMENT.deduce_rewire(data[0][0])
+    assert expected == actual
+
+
+def test_example_multi_row():
+    case = """
+be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe
+edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | fcgedb cgb dgebacf gc
+fgaebd cg bdaec gdafb agbcfd gdcbef bgcad gfac gcb cdgabef | cg cg fdcagb cbg
+fbegcd cbd adcefb dageb afcb bc aefdc ecdab fgdeca fcdbega | efabcd cedba gadfec cb
+aecbfdg fbg gf bafeg dbefa fcge gcbea fcaegb dgceab fcbdga | gecf egdcabf bgf bfgea
+fgeab ca afcebg bdacfeg cfaedg gcfdb baec bfadeg bafgc acf | gebdcfa ecba ca fadegcb
+dbcfg fgd bdegcaf fgec aegbdf ecdfab fbedc dacgb gdcebf gf | cefg dcbef fcge gbcadfe
+bdfegc cbegaf gecbf dfcage bdacg ed bedf ced adcbefg gebcd | ed bcgafe cdgba cbgef
+egadfb cdbfeg cegd fecab cgb gbdefca cg fgcdab egfdb bfceg | gbdfcae bgc cg cgb
+gcafb gcf dcaebfg ecagb gf abcdeg gaef cafbge fdbac fegbdc | fgae cfgab fg bagce
+"""
+    data = day.parse_input(case)
+    expected = 61229
+    actual = day.solve(data)
+    assert expected == actual
+
+
+def test_fourteen_segments():
+    display = day.SegmentDisplay("abcdefghijklmn", FOURTEEN_SEGMENT_HEX)
+    wiring = dict(zip("abcdefghijklmn", "nmlkjihgfedcba"))
+    patterns = [
+        "".join(map(wiring.get, reversed(pattern)))
+        for pattern in FOURTEEN_SEGMENT_HEX.values()
+    ]
+    output = [patterns[12], patterns[10], patterns[15], patterns[14]]
+    expected = list("CAFE")
+    actual = display.decode(patterns[::-1], output)
+    assert expected == actual
+
+
+def test_indistinguishable_symbols():
+    # Mirror images of each other with nothing else to tell them apart.
+    with pytest.raises(Exception):
+        day.SegmentDisplay("abc", {"L": "ab", "R": "bc", "C": "b"})
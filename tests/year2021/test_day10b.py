@@ -42,3 +42,24 @@ def test_example():
     expected = 288957
     actual = day.solve(data)
     assert expected == actual
+
+
+def test_example_stream():
+    case = """
+[({(<(())[]>[[{[]{<()<>>
+[(()[<>])]({[<{<<[]>>(
+{([(<{}[<>[]}>{[]{[(<()>
+(((({<>}<{<{<>}{[]{[]{}
+[[<[([]))<([[{}[[()]]]
+[{[{({}]{}}([{[{{{}}([]
+{<[[]]>}<{[{[{[]{()[[[]
+[<(<(<(<{}))><([]([]()
+<{([([[(<>()){}]>(<<{{
+<{([{{}}[<[[[<>{}]]]>[]]
+"""
+    lines = iter(case.splitlines())
+    data = day.parse_input(lines)
+    assert not isinstance(data, list)
+    expected = 288957
+    actual = day.solve(data)
+    assert expected == actual
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import importlib
+
+import pytest
+
+from year2021 import generators
+import year2021.day03b as day03b
+import year2021.day10b as day10b
+import year2021.day13b as day13b
+import year2021.day24a as day24a
+import year2021.day24b as day24b
+
+
+DAYS = [day for day in range(1, 26) if day != 23]
+
+
+@pytest.mark.parametrize("day", DAYS)
+def test_deterministic(day):
+    expected = generators.generate(day, 0.1, seed=3)
+    actual = generators.generate(day, 0.1, seed=3)
+    assert expected == actual
+
+
+@pytest.mark.parametrize("day", DAYS)
+def test_parses(day):
+    content = generators.generate(day, 0.1)
+    for part in "ab":
+        try:
+            mod = importlib.import_module(f"year2021.day{day:02}{part}")
+        except ModuleNotFoundError:
+            continue
+        assert mod.parse_input(content)
+
+
+def test_unknown_day():
+    with pytest.raises(Exception):
+        generators.generate(23)
+
+
+@pytest.mark.parametrize("scale", [0.01, 1, 5])
+def test_day03_bit_criteria(scale):
+    data = day03b.parse_input(generators.generate(3, scale))
+    assert day03b.solve(data) > 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_day10_median(seed):
+    data = day10b.parse_input(generators.generate(10, 1, seed))
+    assert day10b.solve(data) > 0
+
+
+@pytest.mark.parametrize("scale", [0.5, 1, 4])
+def test_day13_letters(scale):
+    data = day13b.parse_input(generators.generate(13, scale))
+    assert len(day13b.solve(data)) == 8
+
+
+@pytest.mark.parametrize("scale", [1, 3])
+def test_day24_model_numbers(scale):
+    content = generators.generate(24, scale)
+    data = day24a.parse_input(content)
+    largest = day24a.solve(data)
+    smallest = day24b.solve(data)
+    assert len(largest) == len(smallest) == round(14 * scale)
+    assert smallest <= largest
+
+    sections = [data[i : i + 18] for i in range(0, len(data), 18)]
+    for model_number in [largest, smallest]:
+        z = 0
+        for w, section in zip(map(int, model_number), sections):
+            assert 1 <= w <= 9
+            z = day24a.apply_section(
+                w, z, section[4][-1], section[5][-1], section[15][-1]
+            )
+        assert z == 0
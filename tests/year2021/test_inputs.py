@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+import io
+import os
+
+import year2021.day01a as day
+from year2021.util import inputs
+
+
+def test_input_path_independent_of_cwd(tmp_path, monkeypatch):
+    expected = inputs.input_path(2021, 1)
+    monkeypatch.chdir(tmp_path)
+    actual = inputs.input_path(2021, 1)
+    assert expected == actual
+    assert os.path.isabs(actual)
+    assert os.path.exists(actual)
+
+
+def test_lines_strip_terminators():
+    data = inputs.InputData.from_stream(io.BytesIO(b"199\r\n200\n\r\n208"))
+    expected = [b"199", b"200", b"", b"208"]
+    actual = [bytes(line) for line in data.lines()]
+    assert expected == actual
+
+
+def test_lines_from_mmap(tmp_path):
+    filepath = tmp_path / "input.txt"
+    filepath.write_bytes(b"199\r\n200\r\n")
+    with inputs.open_input(2021, 1, filepath) as data:
+        assert isinstance(data.view, memoryview)
+        expected = [b"199", b"200"]
+        actual = [bytes(line) for line in data.lines()]
+        assert expected == actual
+
+
+def test_empty_file(tmp_path):
+    filepath = tmp_path / "input.txt"
+    filepath.write_bytes(b"")
+    assert inputs.read_input(2021, 1, filepath) == ""
+
+
+def test_main_source_override(tmp_path):
+    case = "199\r\n200\r\n208\r\n210\r\n200\r\n207\r\n240\r\n269\r\n260\r\n263\r\n"
+    filepath = tmp_path / "input.txt"
+    filepath.write_bytes(case.encode())
+    expected = 7
+    assert expected == day.main(runner=True, source=str(filepath))
+    assert expected == day.main(runner=True, source=io.BytesIO(case.encode()))
+    assert expected == day.main(runner=True, source=io.StringIO(case))